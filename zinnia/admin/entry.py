@@ -1,27 +1,48 @@
 """EntryAdmin for Zinnia"""
 from __future__ import unicode_literals
 
+from hashlib import md5
+
 from django.contrib import admin
+from django.contrib.admin import helpers
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.core.paginator import Paginator
+from django.db.models import Exists
+from django.db.models import OuterRef
 from django.db.models import Q
+from django.db.models.signals import m2m_changed
+from django.http import JsonResponse
+from django.template.response import TemplateResponse
 from django.urls import NoReverseMatch
+from django.urls import path
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.encoding import force_bytes
 from django.utils.html import conditional_escape
 from django.utils.html import format_html
 from django.utils.html import format_html_join
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
 
+from tagging.models import Tag
+from tagging.models import TaggedItem
+from tagging.settings import FORCE_LOWERCASE_TAGS
+
 from zinnia import settings
 from zinnia.admin.filters import AuthorListFilter
 from zinnia.admin.filters import CategoryListFilter
+from zinnia.admin.forms import AddCategoryForm
+from zinnia.admin.forms import AddSiteForm
 from zinnia.admin.forms import EntryAdminForm
-from zinnia.comparison import EntryPublishedVectorBuilder
+from zinnia.admin.widgets import AuthorAutocomplete
 from zinnia.managers import HIDDEN
 from zinnia.managers import PUBLISHED
 from zinnia.models.author import Author
-from zinnia.ping import DirectoryPinger
+from zinnia.ping import ping_dispatcher
+from zinnia.signals import entries_were_updated
 
 
 class EntryAdmin(admin.ModelAdmin):
@@ -62,15 +83,19 @@ class EntryAdmin(admin.ModelAdmin):
     sortable_by = ('publication_date', 'featured')
     radio_fields = {'content_template': admin.VERTICAL,
                     'detail_template': admin.VERTICAL}
-    filter_horizontal = ('categories', 'authors', 'related')
+    filter_horizontal = ('categories', 'related')
     prepopulated_fields = {'slug': ('title', )}
     search_fields = ('title', 'excerpt', 'content', 'tags')
     actions = ['make_mine', 'make_published', 'make_hidden',
                'close_comments', 'close_pingbacks', 'close_trackbacks',
                'ping_directories', 'put_on_top',
-               'mark_featured', 'unmark_featured']
+               'mark_featured', 'unmark_featured',
+               'add_categories', 'add_sites']
     actions_on_top = True
     actions_on_bottom = True
+    authors_paginate_by = 20
+    tags_paginate_by = 20
+    tags_cache_timeout = 60
 
     def __init__(self, model, admin_site):
         self.form.admin_site = admin_site
@@ -193,14 +218,25 @@ class EntryAdmin(admin.ModelAdmin):
             'authors': [request.user.pk]
         }
 
+    def get_authors_queryset(self):
+        """
+        Return the disposable authors, the staff members and the
+        authors of entries, without joining the users to the entries.
+        """
+        return Author.objects.annotate(
+            has_entries=Exists(self.model.authors.through.objects.filter(
+                author_id=OuterRef('pk')))).filter(
+            Q(is_staff=True) | Q(has_entries=True))
+
     def formfield_for_manytomany(self, db_field, request, **kwargs):
         """
-        Filter the disposable authors.
+        Filter the disposable authors and load them by autocompletion.
         """
         if db_field.name == 'authors':
-            kwargs['queryset'] = Author.objects.filter(
-                Q(is_staff=True) | Q(entries__isnull=False)
-                ).distinct()
+            kwargs['queryset'] = self.get_authors_queryset()
+            kwargs['widget'] = AuthorAutocomplete(
+                db_field.remote_field, self.admin_site,
+                using=kwargs.get('using'))
 
         return super(EntryAdmin, self).formfield_for_manytomany(
             db_field, request, **kwargs)
@@ -238,15 +274,187 @@ class EntryAdmin(admin.ModelAdmin):
 
         return actions
 
+    def get_urls(self):
+        """
+        Add the URL of the ping status page.
+        """
+        urls = super(EntryAdmin, self).get_urls()
+        info = self.model._meta.app_label, self.model._meta.model_name
+        return [
+            path('authors_autocomplete/',
+                 self.admin_site.admin_view(self.authors_autocomplete_view),
+                 name='%s_%s_authors_autocomplete' % info),
+            path('tags_autocomplete/',
+                 self.admin_site.admin_view(self.tags_autocomplete_view),
+                 name='%s_%s_tags_autocomplete' % info),
+            path('ping_status/',
+                 self.admin_site.admin_view(self.ping_status_view),
+                 name='%s_%s_ping_status' % info)
+        ] + urls
+
+    def authors_autocomplete_view(self, request):
+        """
+        Return a page of the disposable authors matching
+        the searched term, in the JSON format of select2.
+        """
+        if not (self.has_add_permission(request) or
+                self.has_change_permission(request)):
+            raise PermissionDenied
+        username_field = Author.USERNAME_FIELD
+        authors = self.get_authors_queryset().order_by(username_field, 'pk')
+        term = request.GET.get('term', '').strip()
+        if term:
+            authors = authors.filter(
+                **{'%s__icontains' % username_field: term})
+        page = Paginator(authors, self.authors_paginate_by).get_page(
+            request.GET.get('page'))
+        return JsonResponse({
+            'results': [{'id': str(author.pk), 'text': str(author)}
+                        for author in page.object_list],
+            'pagination': {'more': page.has_next()}})
+
+    def get_tags_queryset(self, term):
+        """
+        Return the tags used by the entries starting with a term,
+        matched by prefix to use the index of the tag names.
+        """
+        tags = Tag.objects.annotate(used=Exists(TaggedItem.objects.filter(
+            tag=OuterRef('pk'),
+            content_type=ContentType.objects.get_for_model(self.model)))
+        ).filter(used=True)
+        if FORCE_LOWERCASE_TAGS:
+            tags = tags.filter(name__startswith=term.lower())
+        else:
+            tags = tags.filter(name__istartswith=term)
+        return tags.order_by('name')
+
+    def tags_autocomplete_view(self, request):
+        """
+        Return a page of the tags starting with the searched term,
+        in the JSON format of select2, cached for a short time.
+        """
+        if not (self.has_add_permission(request) or
+                self.has_change_permission(request)):
+            raise PermissionDenied
+        term = request.GET.get('term', '').strip()
+        try:
+            page = max(int(request.GET.get('page', 1)), 1)
+        except ValueError:
+            page = 1
+        cache_key = 'zinnia:tags_autocomplete:%s:%s' % (
+            md5(force_bytes(term)).hexdigest(), page)
+        data = cache.get(cache_key)
+        if data is None:
+            offset = (page - 1) * self.tags_paginate_by
+            tags = list(self.get_tags_queryset(term).values_list(
+                'name', flat=True)[offset:offset + self.tags_paginate_by + 1])
+            data = {'results': [{'id': tag, 'text': tag}
+                                for tag in tags[:self.tags_paginate_by]],
+                    'pagination': {'more': len(tags) > self.tags_paginate_by}}
+            cache.set(cache_key, data, self.tags_cache_timeout)
+        return JsonResponse(data)
+
+    def ping_status_view(self, request):
+        """
+        Display the results of the last directory pings.
+        """
+        context = dict(
+            self.admin_site.each_context(request),
+            opts=self.model._meta,
+            title=_('Status of the directory pings'),
+            jobs=ping_dispatcher.get_jobs())
+        return TemplateResponse(
+            request, 'admin/zinnia/entry/ping_status.html', context)
+
+    def update_entries(self, request, queryset, **fields):
+        """
+        Update the fields of the selected entries and send
+        a single entries_were_updated signal for the whole update.
+        """
+        entries = list(queryset.values_list('pk', flat=True))
+        self.model.objects.filter(pk__in=entries).update(**fields)
+        entries_were_updated.send(
+            sender=self.model, entries=entries,
+            fields=list(fields), request=request)
+        return entries
+
+    def add_related(self, request, queryset, field_name, related):
+        """
+        Link an object to the selected entries through a
+        many to many field, with one query for finding the entries
+        not linked yet and one insertion of the missing links.
+        """
+        field = self.model._meta.get_field(field_name)
+        through = field.remote_field.through
+        source = field.m2m_field_name()
+        target = field.m2m_reverse_field_name()
+
+        entries = sorted(queryset.exclude(
+            pk__in=through.objects.filter(
+                **{target: related.pk}).values(source)
+        ).values_list('pk', flat=True))
+        if not entries:
+            return entries
+
+        instances = {}
+        if settings.ADMIN_M2M_SIGNALS:
+            instances = self.model.objects.in_bulk(entries)
+        self.send_m2m_changed('pre_add', instances, through, related)
+        through.objects.bulk_create(
+            [through(**{'%s_id' % source: entry,
+                        '%s_id' % target: related.pk})
+             for entry in entries], ignore_conflicts=True)
+        self.send_m2m_changed('post_add', instances, through, related)
+
+        entries_were_updated.send(
+            sender=self.model, entries=entries,
+            fields=[field_name], request=request)
+        return entries
+
+    def send_m2m_changed(self, action, instances, through, related):
+        """
+        Send the m2m_changed signal for each entry linked to an object.
+        """
+        for instance in instances.values():
+            m2m_changed.send(
+                sender=through, action=action, instance=instance,
+                reverse=False, model=related.__class__,
+                pk_set={related.pk}, using=instance._state.db)
+
+    def add_related_action(self, request, queryset, action, field_name,
+                           form_class, title):
+        """
+        Ask for the object to link to the selected entries
+        on an intermediate page, then link it with add_related.
+        """
+        form = form_class(request.POST if 'apply' in request.POST else None)
+        if form.is_valid():
+            self.add_related(request, queryset, field_name,
+                             form.cleaned_data['related'])
+            self.message_user(request, _(
+                'The selected entries have been updated.'))
+            return None
+
+        context = dict(
+            self.admin_site.each_context(request),
+            opts=self.model._meta,
+            title=title,
+            form=form,
+            action=action,
+            action_checkbox_name=helpers.ACTION_CHECKBOX_NAME,
+            selected=request.POST.getlist(helpers.ACTION_CHECKBOX_NAME),
+            select_across=request.POST.get('select_across', '0'),
+            entries_count=queryset.count())
+        return TemplateResponse(
+            request, 'admin/zinnia/entry/add_related.html', context)
+
     # Custom Actions
     def make_mine(self, request, queryset):
         """
         Set the entries to the current user.
         """
         author = Author.objects.get(pk=request.user.pk)
-        for entry in queryset:
-            if author not in entry.authors.all():
-                entry.authors.add(author)
+        self.add_related(request, queryset, 'authors', author)
         self.message_user(
             request, _('The selected entries now belong to you.'))
     make_mine.short_description = _('Set the entries to the user')
@@ -255,9 +463,10 @@ class EntryAdmin(admin.ModelAdmin):
         """
         Set entries selected as published.
         """
-        queryset.update(status=PUBLISHED)
-        EntryPublishedVectorBuilder().cache_flush()
-        self.ping_directories(request, queryset, messages=False)
+        entries = self.update_entries(request, queryset, status=PUBLISHED)
+        self.ping_directories(
+            request, self.model.objects.filter(pk__in=entries),
+            messages=False)
         self.message_user(
             request, _('The selected entries are now marked as published.'))
     make_published.short_description = _('Set entries selected as published')
@@ -266,8 +475,7 @@ class EntryAdmin(admin.ModelAdmin):
         """
         Set entries selected as hidden.
         """
-        queryset.update(status=HIDDEN)
-        EntryPublishedVectorBuilder().cache_flush()
+        self.update_entries(request, queryset, status=HIDDEN)
         self.message_user(
             request, _('The selected entries are now marked as hidden.'))
     make_hidden.short_description = _('Set entries selected as hidden')
@@ -276,7 +484,7 @@ class EntryAdmin(admin.ModelAdmin):
         """
         Close the comments for selected entries.
         """
-        queryset.update(comment_enabled=False)
+        self.update_entries(request, queryset, comment_enabled=False)
         self.message_user(
             request, _('Comments are now closed for selected entries.'))
     close_comments.short_description = _('Close the comments for '
@@ -286,7 +494,7 @@ class EntryAdmin(admin.ModelAdmin):
         """
         Close the pingbacks for selected entries.
         """
-        queryset.update(pingback_enabled=False)
+        self.update_entries(request, queryset, pingback_enabled=False)
         self.message_user(
             request, _('Pingbacks are now closed for selected entries.'))
     close_pingbacks.short_description = _(
@@ -296,7 +504,7 @@ class EntryAdmin(admin.ModelAdmin):
         """
         Close the trackbacks for selected entries.
         """
-        queryset.update(trackback_enabled=False)
+        self.update_entries(request, queryset, trackback_enabled=False)
         self.message_user(
             request, _('Trackbacks are now closed for selected entries.'))
     close_trackbacks.short_description = _(
@@ -306,8 +514,11 @@ class EntryAdmin(admin.ModelAdmin):
         """
         Put the selected entries on top at the current date.
         """
-        queryset.update(publication_date=timezone.now())
-        self.ping_directories(request, queryset, messages=False)
+        entries = self.update_entries(request, queryset,
+                                      publication_date=timezone.now())
+        self.ping_directories(
+            request, self.model.objects.filter(pk__in=entries),
+            messages=False)
         self.message_user(request, _(
             'The selected entries are now set at the current date.'))
     put_on_top.short_description = _(
@@ -317,7 +528,7 @@ class EntryAdmin(admin.ModelAdmin):
         """
         Mark selected as featured post.
         """
-        queryset.update(featured=True)
+        self.update_entries(request, queryset, featured=True)
         self.message_user(
             request, _('Selected entries are now marked as featured.'))
     mark_featured.short_description = _('Mark selected entries as featured')
@@ -326,7 +537,7 @@ class EntryAdmin(admin.ModelAdmin):
         """
         Un-Mark selected featured posts.
         """
-        queryset.update(featured=False)
+        self.update_entries(request, queryset, featured=False)
         self.message_user(
             request, _('Selected entries are no longer marked as featured.'))
     unmark_featured.short_description = _(
@@ -334,25 +545,41 @@ class EntryAdmin(admin.ModelAdmin):
 
     def ping_directories(self, request, queryset, messages=True):
         """
-        Ping web directories for selected entries.
+        Ping web directories for selected entries in background.
         """
         for directory in settings.PING_DIRECTORIES:
-            pinger = DirectoryPinger(directory, queryset)
-            pinger.join()
-            if messages:
-                success = 0
-                for result in pinger.results:
-                    if not result.get('flerror', True):
-                        success += 1
-                    else:
-                        self.message_user(request,
-                                          '%s : %s' % (directory,
-                                                       result['message']))
-                if success:
-                    self.message_user(
-                        request,
-                        _('%(directory)s directory succesfully '
-                          'pinged %(success)d entries.') %
-                        {'directory': directory, 'success': success})
+            ping_dispatcher.dispatch(directory, queryset)
+        if messages and settings.PING_DIRECTORIES:
+            try:
+                status_url = reverse('admin:%s_%s_ping_status' % (
+                    self.model._meta.app_label,
+                    self.model._meta.model_name))
+            except NoReverseMatch:
+                status_url = ''
+            self.message_user(
+                request, format_html(
+                    _('Directories are being pinged, '
+                      'see <a href="{}">the status of the pings</a>.'),
+                    status_url))
     ping_directories.short_description = _(
         'Ping Directories for selected entries')
+
+    def add_categories(self, request, queryset):
+        """
+        Add a category to the selected entries.
+        """
+        return self.add_related_action(
+            request, queryset, 'add_categories', 'categories',
+            AddCategoryForm, _('Add the selected entries to a category'))
+    add_categories.short_description = _(
+        'Add the selected entries to a category')
+
+    def add_sites(self, request, queryset):
+        """
+        Publish the selected entries on a site.
+        """
+        return self.add_related_action(
+            request, queryset, 'add_sites', 'sites',
+            AddSiteForm, _('Publish the selected entries on a site'))
+    add_sites.short_description = _(
+        'Publish the selected entries on a site')
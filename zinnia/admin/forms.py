@@ -1,6 +1,7 @@
 """Forms for Zinnia admin"""
 from django import forms
 from django.contrib.admin.widgets import RelatedFieldWidgetWrapper
+from django.contrib.sites.models import Site
 from django.utils.translation import gettext_lazy as _
 
 from mptt.forms import TreeNodeChoiceField
@@ -64,6 +65,7 @@ class EntryAdminForm(forms.ModelForm):
             self.fields['categories'].widget,
             Entry.categories.field.remote_field,
             self.admin_site)
+        self.fields['tags'].widget.admin_site = self.admin_site
 
     class Meta:
         """
@@ -77,3 +79,20 @@ class EntryAdminForm(forms.ModelForm):
             'excerpt': MiniTextarea,
             'image_caption': MiniTextarea,
         }
+
+
+class AddCategoryForm(forms.Form):
+    """
+    Form for choosing the category added to entries.
+    """
+    related = TreeNodeChoiceField(
+        label=_('Category'), level_indicator='|--',
+        queryset=Category.objects.all())
+
+
+class AddSiteForm(forms.Form):
+    """
+    Form for choosing the site where entries are published.
+    """
+    related = forms.ModelChoiceField(
+        label=_('Site'), queryset=Site.objects.all())
@@ -5,12 +5,10 @@ from itertools import chain
 from django.contrib.admin import widgets
 from django.contrib.staticfiles.storage import staticfiles_storage
 from django.forms import Media
+from django.urls import reverse
 from django.utils.encoding import force_str
-from django.utils.safestring import mark_safe
 
-from tagging.models import Tag
-
-from zinnia.models import Entry
+from tagging.utils import parse_tag_input
 
 
 class MPTTFilteredSelectMultiple(widgets.FilteredSelectMultiple):
@@ -70,49 +68,76 @@ class MPTTFilteredSelectMultiple(widgets.FilteredSelectMultiple):
         return Media(js=[staticfiles_storage.url(path) for path in js])
 
 
-class TagAutoComplete(widgets.AdminTextInputWidget):
+class TagAutoComplete(widgets.AutocompleteSelectMultiple):
     """
-    Tag widget with autocompletion based on select2.
+    Tag widget with autocompletion based on the select2 of the admin,
+    rendering the tags as selected options, loading the others
+    from the tags autocomplete view and allowing new tags.
     """
 
-    def get_tags(self):
+    def __init__(self, attrs=None):
+        super(TagAutoComplete, self).__init__(None, None, attrs)
+
+    def get_url(self):
         """
-        Returns the list of tags to auto-complete.
+        Return the URL of the tags autocomplete view.
         """
-        return [tag.name for tag in
-                Tag.objects.usage_for_model(Entry)]
+        return reverse('%s:zinnia_entry_tags_autocomplete' % (
+            self.admin_site and self.admin_site.name or 'admin'))
 
-    def render(self, name, value, attrs=None, renderer=None):
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        """
+        Allow the creation of tags separated by commas or spaces.
+        """
+        attrs = super(TagAutoComplete, self).build_attrs(
+            base_attrs, extra_attrs=extra_attrs)
+        attrs.update({
+            'data-tags': 'true',
+            'data-token-separators': json.dumps([',', ' ']),
+            'data-maximum-input-length': 50,
+        })
+        return attrs
+
+    def format_value(self, value):
         """
-        Render the default widget and initialize select2.
+        Return the tag names of the field value.
         """
-        output = [super(TagAutoComplete, self).render(name, value, attrs)]
-        output.append('<script type="text/javascript">')
-        output.append('(function($) {')
-        output.append('  $(document).ready(function() {')
-        output.append('    $("#id_%s").select2({' % name)
-        output.append('       width: "element",')
-        output.append('       maximumInputLength: 50,')
-        output.append('       tokenSeparators: [",", " "],')
-        output.append('       tags: %s' % json.dumps(self.get_tags()))
-        output.append('     });')
-        output.append('    });')
-        output.append('}(django.jQuery));')
-        output.append('</script>')
-        return mark_safe('\n'.join(output))
+        if isinstance(value, str):
+            return parse_tag_input(value)
+        return super(TagAutoComplete, self).format_value(value)
 
-    @property
-    def media(self):
+    def optgroups(self, name, value, attrs=None):
+        """
+        Return the tags as selected options, without any query.
+        """
+        return [(None, [self.create_option(name, tag, tag, True, index)
+                        for index, tag in enumerate(value)], 0)]
+
+    def value_from_datadict(self, data, files, name):
+        """
+        Return the selected tags as a string of tags,
+        quoting the names containing a comma or a space.
+        """
+        tags = super(TagAutoComplete, self).value_from_datadict(
+            data, files, name)
+        if not isinstance(tags, (list, tuple)):
+            return tags
+        return ', '.join('"%s"' % tag if ',' in tag or ' ' in tag else tag
+                         for tag in tags)
+
+
+class AuthorAutocomplete(widgets.AutocompleteSelectMultiple):
+    """
+    Authors widget rendering only the selected authors,
+    and loading the others from the authors autocomplete view.
+    """
+
+    def get_url(self):
         """
-        TagAutoComplete's Media.
+        Return the URL of the authors autocomplete view.
         """
-        def static(path):
-            return staticfiles_storage.url(
-                'zinnia/admin/select2/%s' % path)
-        return Media(
-            css={'all': (static('css/select2.css'),)},
-            js=(static('js/select2.js'),)
-        )
+        return reverse('%s:zinnia_entry_authors_autocomplete' %
+                       self.admin_site.name)
 
 
 class MiniTextarea(widgets.AdminTextareaWidget):
@@ -12,11 +12,21 @@ class ZinniaConfig(AppConfig):
     verbose_name = _('Weblog')
 
     def ready(self):
+        from django.db.models.signals import pre_delete
+        from django.test.signals import setting_changed
+        from django.utils.autoreload import file_changed
+
         from django_comments.moderation import moderator
 
+        from mptt.signals import node_moved
+
+        from zinnia.models.category import rebuild_tree_path_handler
+        from zinnia.models.category import strip_tree_path_handler
+        from zinnia.models_bases.entry import reset_url_caches
         from zinnia.signals import connect_entry_signals
         from zinnia.signals import connect_discussion_signals
         from zinnia.moderator import EntryCommentModerator
+        from zinnia.templating import reset_template_caches
 
         entry_klass = self.get_model('Entry')
         # Register the comment moderator on Entry
@@ -24,3 +34,12 @@ class ZinniaConfig(AppConfig):
         # Connect the signals
         connect_entry_signals()
         connect_discussion_signals()
+        # Keep the tree paths of the categories in sync with the tree
+        category_klass = self.get_model('Category')
+        node_moved.connect(rebuild_tree_path_handler, sender=category_klass)
+        pre_delete.connect(strip_tree_path_handler, sender=category_klass)
+        # Forget the loop templates when the templates are reloaded
+        file_changed.connect(reset_template_caches)
+        setting_changed.connect(reset_template_caches)
+        # Forget the entries' URLs when the URLconf is changed
+        setting_changed.connect(reset_url_caches)
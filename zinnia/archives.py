@@ -0,0 +1,156 @@
+"""Archive index for Zinnia"""
+from bisect import bisect_left
+from bisect import bisect_right
+from datetime import date
+from datetime import timedelta
+
+from django.contrib.sites.models import Site
+from django.core.cache import InvalidCacheBackendError
+from django.core.cache import caches
+from django.db.models import Min
+from django.db.models import Q
+from django.utils import timezone
+
+from zinnia.instrumentation import instrument_cache
+from zinnia.managers import PUBLISHED
+from zinnia.models.entry import Entry
+
+ARCHIVE_INDEX_CACHE_KEY = 'zinnia:archive_index'
+
+
+def to_date(value):
+    """
+    Return the date part of a date or a datetime.
+    """
+    return date(value.year, value.month, value.day)
+
+
+def week_start(day):
+    """
+    Return the monday of the week of a day.
+    """
+    return day - timedelta(days=day.weekday())
+
+
+class ArchiveIndex(object):
+    """
+    Sorted lists of the days, months and years with
+    published entries, allowing bisect based lookups
+    of the previous and next periods.
+    """
+
+    def __init__(self, days, expiration=None):
+        """
+        Compute the months and the years from the days,
+        the index is valid until the expiration datetime.
+        """
+        self.days = sorted(set(days))
+        self.months = sorted(set(day.replace(day=1) for day in self.days))
+        self.years = sorted(set(day.replace(month=1, day=1)
+                                for day in self.days))
+        self.expiration = expiration
+
+    @property
+    def is_expired(self):
+        """
+        Check if an entry has been published or unpublished
+        by its publication dates since the creation of the index.
+        """
+        return (self.expiration is not None and
+                self.expiration <= timezone.now())
+
+    def get_previous(self, dates, value):
+        """
+        Return the greatest date of the list before the value.
+        """
+        index = bisect_left(dates, value)
+        return index and dates[index - 1] or None
+
+    def get_next(self, dates, value):
+        """
+        Return the smallest date of the list after the value.
+        """
+        index = bisect_right(dates, value)
+        return index < len(dates) and dates[index] or None
+
+    def get_month_days(self, year, month):
+        """
+        Return the days of a month with published entries.
+        """
+        start = date(year, month, 1)
+        end = (start + timedelta(days=31)).replace(day=1)
+        return self.days[bisect_left(self.days, start):
+                         bisect_left(self.days, end)]
+
+    def get_previous_next(self, value):
+        """
+        Return a dict of the previous and next day, week,
+        month and year with published entries around a date.
+        """
+        value = to_date(value)
+        year = value.replace(month=1, day=1)
+        month = value.replace(day=1)
+        previous_day = self.get_previous(self.days, value)
+        next_week_day = self.get_next(self.days, value + timedelta(weeks=1))
+        return {'year': [self.get_previous(self.years, year),
+                         self.get_next(self.years, year)],
+                'week': [previous_day and week_start(previous_day),
+                         next_week_day and week_start(next_week_day)],
+                'month': [self.get_previous(self.months, month),
+                          self.get_next(self.months, month)],
+                'day': [previous_day,
+                        self.get_next(self.days, value)]}
+
+
+def get_cache_backend():
+    """
+    Try to access to ``archives`` cache value,
+    if fail use the ``default`` cache backend config.
+    """
+    try:
+        archives_cache = caches['archives']
+    except InvalidCacheBackendError:
+        archives_cache = caches['default']
+    return instrument_cache(archives_cache)
+
+
+def build_archive_index():
+    """
+    Build the archive index of the current site
+    in the current time zone.
+    """
+    now = timezone.now()
+    days = [to_date(day) for day in Entry.published.datetimes(
+        'publication_date', 'day')]
+    expirations = Entry.objects.filter(
+        status=PUBLISHED, sites=Site.objects.get_current()
+    ).aggregate(
+        start=Min('start_publication', filter=Q(start_publication__gt=now)),
+        end=Min('end_publication', filter=Q(end_publication__gt=now)))
+    expirations = [expiration for expiration in expirations.values()
+                   if expiration is not None]
+    return ArchiveIndex(days, expirations and min(expirations) or None)
+
+
+def get_archive_index():
+    """
+    Return the archive index of the current site
+    in the current time zone, built if not cached or expired.
+    """
+    cache = get_cache_backend()
+    index_key = (Site.objects.get_current().pk,
+                 timezone.get_current_timezone_name())
+    indexes = cache.get(ARCHIVE_INDEX_CACHE_KEY) or {}
+    index = indexes.get(index_key)
+    if index is None or index.is_expired:
+        index = build_archive_index()
+        indexes[index_key] = index
+        cache.set(ARCHIVE_INDEX_CACHE_KEY, indexes, None)
+    return index
+
+
+def flush_archive_index():
+    """
+    Flush the archive indexes of all the sites.
+    """
+    get_cache_backend().delete(ARCHIVE_INDEX_CACHE_KEY)
@@ -0,0 +1,450 @@
+"""Benchmark harness for Zinnia"""
+import random
+import statistics
+import time
+import tracemalloc
+from contextlib import nullcontext
+from importlib.util import find_spec
+from urllib.parse import urlsplit
+
+from django.contrib.sites.models import Site
+from django.core.cache import caches
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import Q
+from django.template import Context
+from django.template import Template
+from django.test.client import Client
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from zinnia import markups
+from zinnia import settings as zinnia_settings
+from zinnia.corpus import build_vocabulary
+from zinnia.corpus import generate_content
+from zinnia.managers import PUBLISHED
+from zinnia.models.author import Author
+from zinnia.models.category import Category
+from zinnia.models.entry import Entry
+from zinnia.preview import HTMLPreview
+from zinnia.signals import suppress_signals
+from zinnia.sitemaps import AuthorSitemap
+from zinnia.sitemaps import CategorySitemap
+from zinnia.sitemaps import EntrySitemap
+from zinnia.sitemaps import TagSitemap
+from zinnia.templatetags.zinnia import week_number
+from zinnia.xmlrpc.metaweblog import get_recent_posts
+
+BENCHMARK_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'zinnia-benchmark',
+    }
+}
+
+INCLUSION_TAGS = [
+    'get_categories',
+    'get_categories_tree',
+    'get_authors',
+    'get_recent_entries',
+    'get_featured_entries',
+    'get_draft_entries',
+    'get_random_entries',
+    'get_popular_entries',
+    'get_similar_entries',
+    'get_archives_entries',
+    'get_archives_entries_tree',
+    'get_calendar_entries',
+    'get_recent_comments',
+    'get_recent_linkbacks',
+    'get_tag_cloud',
+    'zinnia_pagination page',
+    'zinnia_breadcrumbs',
+    'zinnia_statistics',
+]
+
+MARKUP_LIBRARIES = {
+    'markdown': 'markdown',
+    'textile': 'textile',
+    'restructuredtext': 'docutils',
+}
+
+CONTENT_SIZES = [1, 4, 16, 64]
+
+RANDOM_SIZES = [1, 5]
+
+RECENT_POSTS_SIZES = [1, 10, 50]
+
+BENCHMARK_PASSWORD = 'zinnia-benchmark'
+
+
+class QueryCounter(object):
+    """
+    Database execution wrapper counting the queries,
+    the requests resetting the log of the queries.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def measure(function, repeat=5):
+    """
+    Call a function once to count its queries and trace
+    its peak memory, then ``repeat`` times to time it.
+    Return its first result with the metrics.
+    """
+    queries = QueryCounter()
+    tracemalloc.start()
+    try:
+        with connection.execute_wrapper(queries):
+            result = function()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    warm_queries = QueryCounter()
+    with connection.execute_wrapper(warm_queries):
+        function()
+
+    return result, {'queries': queries.count,
+                    'warm_queries': warm_queries.count,
+                    'time': times and statistics.median(times) or None,
+                    'peak_memory': peak_memory}
+
+
+def get_url_cases(entry):
+    """
+    Return the names and the paths of the public URLs,
+    pointing on the objects related to an entry if given.
+    """
+    cases = [
+        ('entry_archive_index', reverse('zinnia:entry_archive_index')),
+        ('entry_archive_index_paginated',
+         reverse('zinnia:entry_archive_index_paginated', args=[2])),
+        ('entry_archive_today', reverse('zinnia:entry_archive_today')),
+        ('category_list', reverse('zinnia:category_list')),
+        ('author_list', reverse('zinnia:author_list')),
+        ('tag_list', reverse('zinnia:tag_list')),
+        ('entry_random', reverse('zinnia:entry_random')),
+        ('sitemap', reverse('zinnia:sitemap')),
+        ('entry_feed', reverse('zinnia:entry_feed')),
+        ('discussion_feed', reverse('zinnia:discussion_feed')),
+        ('rsd', reverse('zinnia:rsd')),
+        ('humans', reverse('zinnia:humans')),
+        ('opensearch', reverse('zinnia:opensearch')),
+        ('wlwmanifest', reverse('zinnia:wlwmanifest')),
+    ]
+    if entry is None:
+        return cases
+
+    date = entry.publication_date
+    if timezone.is_aware(date):
+        date = timezone.localtime(date)
+    entry_kwargs = {'year': date.strftime('%Y'),
+                    'month': date.strftime('%m'),
+                    'day': date.strftime('%d'),
+                    'slug': entry.slug}
+    pattern = entry.title.split()[0]
+    cases.extend([
+        ('entry_detail', entry.get_absolute_url()),
+        ('entry_shortlink', urlsplit(entry.short_url).path),
+        ('entry_archive_year',
+         reverse('zinnia:entry_archive_year', args=[entry_kwargs['year']])),
+        ('entry_archive_month',
+         reverse('zinnia:entry_archive_month',
+                 args=[entry_kwargs['year'], entry_kwargs['month']])),
+        ('entry_archive_week',
+         reverse('zinnia:entry_archive_week',
+                 args=[entry_kwargs['year'], week_number(date)])),
+        ('entry_archive_day',
+         reverse('zinnia:entry_archive_day',
+                 args=[entry_kwargs['year'], entry_kwargs['month'],
+                       entry_kwargs['day']])),
+        ('entry_search',
+         '%s?pattern=%s' % (reverse('zinnia:entry_search'), pattern)),
+        ('entry_search_feed',
+         '%s?pattern=%s' % (reverse('zinnia:entry_search_feed'), pattern)),
+        ('entry_discussion_feed',
+         reverse('zinnia:entry_discussion_feed', kwargs=entry_kwargs)),
+        ('entry_comment_feed',
+         reverse('zinnia:entry_comment_feed', kwargs=entry_kwargs)),
+        ('entry_pingback_feed',
+         reverse('zinnia:entry_pingback_feed', kwargs=entry_kwargs)),
+        ('entry_trackback_feed',
+         reverse('zinnia:entry_trackback_feed', kwargs=entry_kwargs)),
+    ])
+
+    category = entry.categories.order_by('-level', 'pk').first()
+    if category is not None:
+        cases.extend([
+            ('category_detail', category.get_absolute_url()),
+            ('category_feed',
+             reverse('zinnia:category_feed', args=[category.tree_path])),
+        ])
+    author = entry.authors.order_by('pk').first()
+    if author is not None:
+        cases.extend([
+            ('author_detail', author.get_absolute_url()),
+            ('author_feed',
+             reverse('zinnia:author_feed', args=[author.get_username()])),
+        ])
+    tags = entry.tags_list
+    if tags:
+        cases.extend([
+            ('tag_detail', reverse('zinnia:tag_detail', args=[tags[0]])),
+            ('tag_feed', reverse('zinnia:tag_feed', args=[tags[0]])),
+        ])
+    return cases
+
+
+def benchmark_urls(entry, repeat):
+    """
+    Benchmark the responses of the public URLs.
+    """
+    client = Client()
+    results = []
+    for name, path in get_url_cases(entry):
+        response, metrics = measure(lambda: client.get(path), repeat)
+        metrics.update({'group': 'url', 'name': name, 'target': path,
+                        'status': response.status_code,
+                        'size': len(response.content)})
+        results.append(metrics)
+    return results
+
+
+def benchmark_inclusion_tags(entry, repeat):
+    """
+    Benchmark the rendering of the inclusion tags
+    in the context of an entry.
+    """
+    path = entry is not None and entry.get_absolute_url() or '/'
+    context = {
+        'object': entry,
+        'request': RequestFactory().get(path),
+        'page': Paginator(Entry.published.all(), 10).page(1),
+    }
+    results = []
+    for tag in INCLUSION_TAGS:
+        template = Template('{%% load zinnia %%}{%% %s %%}' % tag)
+        html, metrics = measure(
+            lambda: template.render(Context(context)), repeat)
+        metrics.update({'group': 'tag', 'name': tag.split()[0],
+                        'size': len(html)})
+        results.append(metrics)
+    return results
+
+
+def benchmark_sitemaps(repeat):
+    """
+    Benchmark the URLs listed by the sitemaps.
+    """
+    site = Site.objects.get_current()
+    results = []
+    for sitemap_class in (EntrySitemap, CategorySitemap,
+                          AuthorSitemap, TagSitemap):
+        sitemap = sitemap_class()
+        urls, metrics = measure(
+            lambda: sitemap.get_urls(site=site), repeat)
+        metrics.update({'group': 'sitemap', 'name': sitemap_class.__name__,
+                        'size': len(urls)})
+        results.append(metrics)
+    return results
+
+
+def joined_published(model):
+    """
+    Return the objects having published entries by joining
+    the entries and making the rows distinct, the query replaced
+    by the correlated subqueries of the managers, for comparison.
+    """
+    now = timezone.now()
+    return model.objects.filter(
+        Q(entries__start_publication__lte=now) |
+        Q(entries__start_publication=None),
+        Q(entries__end_publication__gt=now) |
+        Q(entries__end_publication=None),
+        entries__status=PUBLISHED,
+        entries__sites=Site.objects.get_current()).distinct()
+
+
+def benchmark_related_published(repeat):
+    """
+    Benchmark the categories and the authors having published
+    entries, with and without their counts of published entries,
+    by correlated subqueries and by joins made distinct.
+    """
+    results = []
+    for model in (Category, Author):
+        cases = [
+            ('exists', lambda: list(
+                model.published.values_list('pk', flat=True))),
+            ('exists_count', lambda: list(
+                model.published.with_count_entries_published().values_list(
+                    'pk', 'count_entries_published'))),
+            ('join_distinct', lambda: list(
+                joined_published(model).values_list('pk', flat=True))),
+            ('join_count', lambda: list(
+                joined_published(model).annotate(
+                    count_entries_published=Count('entries')).values_list(
+                    'pk', 'count_entries_published'))),
+        ]
+        for name, function in cases:
+            objects, metrics = measure(function, repeat)
+            metrics.update({'group': 'published', 'name': name,
+                            'target': model.__name__, 'size': len(objects)})
+            results.append(metrics)
+    return results
+
+
+def benchmark_random(repeat):
+    """
+    Benchmark the random entries picked at random offsets,
+    and picked by sorting the entries by a random order.
+    """
+    results = []
+    for number in RANDOM_SIZES:
+        cases = [
+            ('random', lambda: Entry.published.random(number)),
+            ('order_by_random', lambda: list(
+                Entry.published.order_by('?')[:number])),
+        ]
+        for name, function in cases:
+            entries, metrics = measure(function, repeat)
+            metrics.update({'group': 'random', 'name': name,
+                            'target': number, 'size': len(entries)})
+            results.append(metrics)
+    return results
+
+
+def benchmark_xmlrpc(repeat):
+    """
+    Benchmark metaWeblog.getRecentPosts for several numbers of posts,
+    as the author of the most entries, made staff with a known password
+    in a transaction rolled back.
+    """
+    author = Author.objects.annotate(count_entries=Count('entries')).filter(
+        count_entries__gt=0).order_by('-count_entries', 'pk').first()
+    if author is None:
+        return []
+
+    results = []
+    with transaction.atomic():
+        author.is_staff = True
+        author.is_active = True
+        author.set_password(BENCHMARK_PASSWORD)
+        author.save()
+        for number in RECENT_POSTS_SIZES:
+            posts, metrics = measure(lambda: get_recent_posts(
+                1, author.get_username(), BENCHMARK_PASSWORD, number), repeat)
+            metrics.update({'group': 'xmlrpc', 'name': 'getRecentPosts',
+                            'target': number, 'size': len(posts)})
+            results.append(metrics)
+        transaction.set_rollback(True)
+    return results
+
+
+def benchmark_entry_save(entry, repeat):
+    """
+    Benchmark the saving of an entry with the signals handled
+    and suppressed, without pinging, in a transaction rolled back.
+    """
+    if entry is None:
+        return []
+
+    results = []
+    original_pings = (zinnia_settings.SAVE_PING_DIRECTORIES,
+                      zinnia_settings.SAVE_PING_EXTERNAL_URLS)
+    zinnia_settings.SAVE_PING_DIRECTORIES = False
+    zinnia_settings.SAVE_PING_EXTERNAL_URLS = False
+    try:
+        with transaction.atomic():
+            for name, context in (('signals', nullcontext),
+                                  ('suppressed', suppress_signals)):
+                def save():
+                    with context():
+                        entry.save()
+
+                result, metrics = measure(save, repeat)
+                metrics.update({'group': 'save', 'name': name})
+                results.append(metrics)
+            transaction.set_rollback(True)
+    finally:
+        (zinnia_settings.SAVE_PING_DIRECTORIES,
+         zinnia_settings.SAVE_PING_EXTERNAL_URLS) = original_pings
+    return results
+
+
+def benchmark_markups(repeat, seed=42):
+    """
+    Benchmark the conversion of contents of several sizes
+    by the markup languages available.
+    """
+    rng = random.Random(seed)
+    vocabulary = build_vocabulary(rng, 2000)
+    results = []
+    for language, library in sorted(MARKUP_LIBRARIES.items()):
+        if find_spec(library) is None:
+            continue
+        function = getattr(markups, language)
+        for paragraphs in CONTENT_SIZES:
+            content = generate_content(rng, vocabulary, paragraphs, language)
+            html, metrics = measure(lambda: function(content), repeat)
+            metrics.update({'group': 'markup', 'name': language,
+                            'target': paragraphs, 'size': len(content)})
+            results.append(metrics)
+    return results
+
+
+def benchmark_previews(repeat, seed=42):
+    """
+    Benchmark the previews of HTML contents of several sizes.
+    """
+    rng = random.Random(seed)
+    vocabulary = build_vocabulary(rng, 2000)
+    results = []
+    for paragraphs in CONTENT_SIZES:
+        content = generate_content(rng, vocabulary, paragraphs, 'html')
+
+        def preview():
+            html_preview = HTMLPreview(content)
+            return str(html_preview), html_preview.displayed_percent
+
+        html, metrics = measure(preview, repeat)
+        metrics.update({'group': 'preview', 'name': 'HTMLPreview',
+                        'target': paragraphs, 'size': len(content)})
+        results.append(metrics)
+    return results
+
+
+def run_benchmarks(repeat=5):
+    """
+    Run all the benchmarks on the current database,
+    with an empty local memory cache isolated from the project's caches.
+    """
+    with override_settings(CACHES=BENCHMARK_CACHES,
+                           ALLOWED_HOSTS=['testserver']):
+        caches['default'].clear()
+        entry = Entry.published.order_by('-comment_count', 'pk').first()
+        return (benchmark_urls(entry, repeat) +
+                benchmark_inclusion_tags(entry, repeat) +
+                benchmark_sitemaps(repeat) +
+                benchmark_related_published(repeat) +
+                benchmark_random(repeat) +
+                benchmark_xmlrpc(repeat) +
+                benchmark_entry_save(entry, repeat) +
+                benchmark_markups(repeat) +
+                benchmark_previews(repeat))
@@ -90,7 +90,7 @@ def handle_page_crumb(func):
     def wrapper(path, model, page, root_name):
         path = PAGE_REGEXP.sub('', path)
         breadcrumbs = func(path, model, root_name)
-        if page:
+        if page and page.number:
             if page.number > 1:
                 breadcrumbs[-1].url = path
                 page_crumb = Crumb(_('Page %s') % page.number)
@@ -10,7 +10,7 @@ from django.utils.dates import WEEKDAYS_ABBR
 from django.utils.formats import date_format
 from django.utils.formats import get_format
 
-from zinnia.models.entry import Entry
+from zinnia.archives import get_archive_index
 
 AMERICAN_TO_EUROPEAN_WEEK_DAYS = [6, 0, 1, 2, 3, 4, 5]
 
@@ -93,19 +93,20 @@ class Calendar(HTMLCalendar):
         return '<caption>%s</caption>' % monthname
 
     def formatmonth(self, theyear, themonth, withyear=True,
-                    previous_month=None, next_month=None):
+                    previous_month=None, next_month=None,
+                    archive_index=None):
         """
         Return a formatted month as a table
         with new attributes computed for formatting a day,
         and thead/tfooter.
         """
+        if archive_index is None:
+            archive_index = get_archive_index()
         self.current_year = theyear
         self.current_month = themonth
-        self.day_entries = [date.day
-                            for date in Entry.published.filter(
-                                publication_date__year=theyear,
-                                publication_date__month=themonth
-                                ).datetimes('publication_date', 'day')]
+        self.day_entries = set(
+            day.day for day in archive_index.get_month_days(
+                theyear, themonth))
         v = []
         a = v.append
         a('<table class="%s">' % (
@@ -9,6 +9,7 @@ from django.utils.html import strip_tags
 
 import regex as re
 
+from zinnia.instrumentation import instrument_cache
 from zinnia.models.entry import Entry
 from zinnia.settings import COMPARISON_FIELDS
 from zinnia.settings import STOP_WORDS
@@ -164,7 +165,7 @@ class CachedModelVectorBuilder(ModelVectorBuilder):
             comparison_cache = caches['comparison']
         except InvalidCacheBackendError:
             comparison_cache = caches['default']
-        return comparison_cache
+        return instrument_cache(comparison_cache)
 
     @property
     def cache_key(self):
@@ -194,6 +195,23 @@ class CachedModelVectorBuilder(ModelVectorBuilder):
         """
         return self.cache_backend.delete(self.cache_key)
 
+    def cache_flush_objects(self, pks):
+        """
+        Flush the cache related to some objects, the dataset,
+        and the related objects of or including these objects.
+        """
+        pks = set(pks)
+        cache = self.cache
+        for cache_key in list(cache.keys()):
+            if cache_key == 'columns_dataset':
+                del cache[cache_key]
+                continue
+            instance_pk = cache_key.split(':')[0]
+            if (instance_pk in [str(pk) for pk in pks] or
+                    pks.intersection([o.pk for o in cache[cache_key]])):
+                del cache[cache_key]
+        return self.cache_backend.set(self.cache_key, cache)
+
     def get_related(self, instance, number):
         """
         Implement high level cache system for get_related.
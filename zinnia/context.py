@@ -31,9 +31,8 @@ def get_context_loop_positions(context):
         loop_counter = context['forloop']['counter']
     except KeyError:
         return 0, 0
-    try:
-        page = context['page_obj']
-    except KeyError:
+    page = context.get('page_obj')
+    if page is None or page.number is None:
         return loop_counter, loop_counter
     total_loop_counter = ((page.number - 1) * page.paginator.per_page +
                           loop_counter)
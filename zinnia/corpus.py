@@ -0,0 +1,322 @@
+"""Synthetic corpus generator for Zinnia"""
+import random
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.utils import timezone
+
+import django_comments as comments
+from django_comments.models import CommentFlag
+
+from tagging.models import Tag
+from tagging.models import TaggedItem
+
+from zinnia.flags import PINGBACK
+from zinnia.flags import TRACKBACK
+from zinnia.flags import get_user_flagger
+from zinnia.managers import DRAFT
+from zinnia.managers import PUBLISHED
+from zinnia.models.category import Category
+from zinnia.models.entry import Entry
+from zinnia.settings import MARKUP_LANGUAGE
+from zinnia.signals import flush_entry_caches
+from zinnia.signals import suppress_signals
+
+CORPUS_PREFIX = 'corpus'
+
+SYLLABLES = ['ba', 'ce', 'di', 'fo', 'gu', 'ka', 'le', 'mi', 'no', 'pu',
+             'ra', 'se', 'ti', 'vo', 'zu', 'lan', 'mor', 'tes', 'vin', 'dar']
+
+MARKUP_SYNTAXES = {
+    'html': {
+        'paragraph': '<p>%s</p>',
+        'strong': '<strong>%s</strong>',
+        'link': '<a href="%(url)s">%(text)s</a>',
+        'heading': '<h2>%s</h2>',
+        'list': '<ul>\n%s\n</ul>',
+        'item': '<li>%s</li>'},
+    'markdown': {
+        'paragraph': '%s',
+        'strong': '**%s**',
+        'link': '[%(text)s](%(url)s)',
+        'heading': '## %s',
+        'list': '%s',
+        'item': '* %s'},
+    'textile': {
+        'paragraph': '%s',
+        'strong': '*%s*',
+        'link': '"%(text)s":%(url)s',
+        'heading': 'h2. %s',
+        'list': '%s',
+        'item': '* %s'},
+    'restructuredtext': {
+        'paragraph': '%s',
+        'strong': '**%s**',
+        'link': '`%(text)s <%(url)s>`__',
+        'heading': '%s\n' + '-' * 40,
+        'list': '%s',
+        'item': '* %s'},
+}
+
+
+def build_vocabulary(rng, size):
+    """
+    Build a list of distinct pseudo words made of syllables.
+    """
+    vocabulary = set()
+    while len(vocabulary) < size:
+        vocabulary.add(''.join(rng.choice(SYLLABLES)
+                               for i in range(rng.randint(2, 4))))
+    return sorted(vocabulary)
+
+
+def generate_sentence(rng, vocabulary, words):
+    """
+    Generate a sentence of pseudo words.
+    """
+    return ' '.join(rng.choice(vocabulary) for i in range(words))
+
+
+def generate_content(rng, vocabulary, paragraphs, markup=MARKUP_LANGUAGE):
+    """
+    Generate a content written in a markup language,
+    made of paragraphs with strong words and links,
+    a heading and a list every few paragraphs.
+    """
+    syntax = MARKUP_SYNTAXES.get(markup, MARKUP_SYNTAXES['html'])
+    blocks = []
+    for i in range(paragraphs):
+        if i and not i % 4:
+            blocks.append(syntax['heading'] % generate_sentence(
+                rng, vocabulary, 3).capitalize())
+            blocks.append(syntax['list'] % '\n'.join(
+                syntax['item'] % generate_sentence(rng, vocabulary, 4)
+                for j in range(rng.randint(2, 5))))
+        words = generate_sentence(
+            rng, vocabulary, rng.randint(40, 120)).split()
+        words[rng.randrange(len(words))] = syntax['strong'] % rng.choice(
+            vocabulary)
+        text = rng.choice(vocabulary)
+        words[rng.randrange(len(words))] = syntax['link'] % {
+            'url': 'http://example.com/%s/' % text, 'text': text}
+        blocks.append(syntax['paragraph'] % (
+            ' '.join(words).capitalize() + '.'))
+    return '\n\n'.join(blocks)
+
+
+def generate_sites(rng, count):
+    """
+    Return the current site and create the other sites.
+    """
+    current_site = Site.objects.get_current()
+    sites = [Site.objects.create(
+        domain='%s-%i.example.com' % (CORPUS_PREFIX, i),
+        name='%s %i' % (CORPUS_PREFIX, i)) for i in range(1, count)]
+    return [current_site] + sites
+
+
+def generate_authors(rng, vocabulary, count):
+    """
+    Create the users writing the entries.
+    """
+    user_model = get_user_model()
+    users = []
+    for i in range(count):
+        user = user_model(**{
+            user_model.USERNAME_FIELD: '%s-author-%i' % (CORPUS_PREFIX, i),
+            user_model.get_email_field_name():
+            '%s-author-%i@example.com' % (CORPUS_PREFIX, i)})
+        user.set_unusable_password()
+        users.append(user)
+    user_model.objects.bulk_create(users)
+    return list(user_model.objects.filter(**{
+        '%s__startswith' % user_model.USERNAME_FIELD: '%s-author-' %
+        CORPUS_PREFIX}).order_by('pk').values_list('pk', flat=True))
+
+
+def generate_categories(rng, vocabulary, count):
+    """
+    Create a tree of categories, each category being
+    a child of a previous category or a root category.
+    """
+    categories = []
+    with Category.objects.disable_mptt_updates():
+        for i in range(count):
+            parent = None
+            if categories and rng.random() < 0.8:
+                parent = rng.choice(categories[-50:])
+            category = Category(
+                title=generate_sentence(rng, vocabulary, 2).capitalize(),
+                slug='%s-category-%i' % (CORPUS_PREFIX, i),
+                description=generate_sentence(rng, vocabulary, 20),
+                parent=parent, lft=0, rght=0, tree_id=0, level=0)
+            category.save()
+            categories.append(category)
+    Category.objects.rebuild()
+    return [category.pk for category in categories]
+
+
+def generate_tags(rng, vocabulary, count):
+    """
+    Create the tags, named with the first words of the vocabulary.
+    """
+    names = vocabulary[:count]
+    Tag.objects.bulk_create([Tag(name=name) for name in names])
+    return dict(Tag.objects.filter(name__in=names).values_list('name', 'pk'))
+
+
+def generate_entries(rng, vocabulary, count, sites, authors,
+                     categories, tags, discussions, paragraphs, markup):
+    """
+    Create the entries with their relations,
+    and return the primary keys of the published entries
+    with the numbers of comments, pingbacks and trackbacks to create.
+    """
+    now = timezone.now()
+    # The discussions are spread with a Zipf distribution
+    weights = [1.0 / (i + 1) for i in range(count)]
+    counts = [[0, 0, 0] for i in range(count)]
+    for index in rng.choices(range(count), weights, k=discussions):
+        counts[index][rng.choices((0, 1, 2), (8, 1, 1))[0]] += 1
+
+    entries = []
+    for i in range(count):
+        status = rng.random() < 0.9 and PUBLISHED or DRAFT
+        if status == DRAFT:
+            counts[i] = [0, 0, 0]
+        publication_date = now - timedelta(
+            seconds=rng.randint(0, 3 * 365 * 24 * 3600))
+        entries.append(Entry(
+            title=generate_sentence(
+                rng, vocabulary, rng.randint(3, 8)).capitalize(),
+            slug='%s-entry-%i' % (CORPUS_PREFIX, i),
+            status=status,
+            publication_date=publication_date,
+            creation_date=publication_date,
+            content=generate_content(
+                rng, vocabulary, rng.randint(1, paragraphs), markup),
+            lead=rng.random() < 0.5 and generate_content(
+                rng, vocabulary, 1, markup) or '',
+            featured=rng.random() < 0.05,
+            tags=', '.join(rng.sample(
+                sorted(tags), min(len(tags), rng.randint(0, 5)))),
+            comment_count=counts[i][0],
+            pingback_count=counts[i][1],
+            trackback_count=counts[i][2]))
+    Entry.objects.bulk_create(entries, batch_size=500)
+    entry_pks = dict(Entry.objects.filter(
+        slug__startswith='%s-entry-' % CORPUS_PREFIX).values_list(
+        'slug', 'pk'))
+
+    entry_sites = []
+    entry_authors = []
+    entry_categories = []
+    tagged_items = []
+    content_type = ContentType.objects.get_for_model(Entry)
+    for entry in entries:
+        pk = entry_pks[entry.slug]
+        entry_sites.extend(
+            Entry.sites.through(entry_id=pk, site_id=site.pk)
+            for index, site in enumerate(sites)
+            if (index and rng.random() < 0.3) or
+            (not index and rng.random() < 0.9))
+        entry_authors.extend(
+            Entry.authors.through(entry_id=pk, author_id=author)
+            for author in rng.sample(authors, min(len(authors),
+                                                  rng.choice((1, 1, 1, 2)))))
+        entry_categories.extend(
+            Entry.categories.through(entry_id=pk, category_id=category)
+            for category in rng.sample(categories, min(len(categories),
+                                                       rng.randint(1, 3))))
+        tagged_items.extend(
+            TaggedItem(tag_id=tags[name], content_type=content_type,
+                       object_id=pk)
+            for name in entry.tags.split(', ') if name)
+    Entry.sites.through.objects.bulk_create(entry_sites, batch_size=500)
+    Entry.authors.through.objects.bulk_create(entry_authors, batch_size=500)
+    Entry.categories.through.objects.bulk_create(
+        entry_categories, batch_size=500)
+    TaggedItem.objects.bulk_create(tagged_items, batch_size=500)
+
+    return [(entry_pks[entry.slug], entry.publication_date, counts[i])
+            for i, entry in enumerate(entries)]
+
+
+def generate_discussions(rng, vocabulary, entries, site):
+    """
+    Create the comments, pingbacks and trackbacks of the entries,
+    the pingbacks and trackbacks being flagged as such.
+    """
+    comment_model = comments.get_model()
+    content_type = ContentType.objects.get_for_model(Entry)
+    discussions = []
+    for pk, publication_date, counts in entries:
+        for kind, count in zip(('comment', PINGBACK, TRACKBACK), counts):
+            for i in range(count):
+                name = generate_sentence(rng, vocabulary, 2).title()
+                discussions.append(comment_model(
+                    content_type=content_type, object_pk=str(pk),
+                    site=site, user_name=name,
+                    user_email='%s@example.com' % name.split()[0].lower(),
+                    user_url='http://%s.example.com/%s/%i/' % (
+                        kind, CORPUS_PREFIX, len(discussions)),
+                    comment=generate_sentence(
+                        rng, vocabulary, rng.randint(5, 60)),
+                    submit_date=publication_date + timedelta(
+                        seconds=rng.randint(60, 30 * 24 * 3600)),
+                    is_public=True, is_removed=False))
+    comment_model.objects.bulk_create(discussions, batch_size=500)
+
+    flagger = get_user_flagger()
+    for flag in (PINGBACK, TRACKBACK):
+        CommentFlag.objects.bulk_create([
+            CommentFlag(comment_id=pk, user=flagger, flag=flag,
+                        flag_date=timezone.now())
+            for pk in comment_model.objects.filter(
+                user_url__startswith='http://%s.example.com/%s/' % (
+                    flag, CORPUS_PREFIX)).values_list('pk', flat=True)],
+            batch_size=500)
+    return len(discussions)
+
+
+def generate_corpus(entries=100, discussions=500, categories=20,
+                    authors=5, sites=2, tags=50, paragraphs=8,
+                    markup=MARKUP_LANGUAGE, seed=42):
+    """
+    Generate deterministically a synthetic blog
+    and return the numbers of objects created.
+    """
+    rng = random.Random(seed)
+    vocabulary = build_vocabulary(rng, max(2000, tags))
+    with suppress_signals():
+        site_list = generate_sites(rng, sites)
+        author_pks = generate_authors(rng, vocabulary, authors)
+        category_pks = generate_categories(rng, vocabulary, categories)
+        tag_pks = generate_tags(rng, vocabulary, tags)
+        entry_list = generate_entries(
+            rng, vocabulary, entries, site_list, author_pks,
+            category_pks, tag_pks, discussions, paragraphs, markup)
+        discussion_count = generate_discussions(
+            rng, vocabulary, entry_list, site_list[0])
+    flush_entry_caches()
+    return {'entries': entries,
+            'discussions': discussion_count,
+            'categories': categories,
+            'authors': authors,
+            'sites': sites,
+            'tags': tags}
+
+
+def scale_corpus(entries):
+    """
+    Return the numbers of objects of a corpus
+    proportional to its number of entries.
+    """
+    return {'entries': entries,
+            'discussions': entries * 5,
+            'categories': max(5, entries // 20),
+            'authors': max(3, entries // 100),
+            'sites': 3,
+            'tags': max(20, entries // 10)}
@@ -0,0 +1,70 @@
+"""Discussion lists of the entries for Zinnia"""
+from django.core.cache import InvalidCacheBackendError
+from django.core.cache import caches
+from django.db.models import Exists
+from django.db.models import OuterRef
+
+from django_comments.models import CommentFlag
+
+from zinnia.flags import PINGBACK
+from zinnia.flags import TRACKBACK
+from zinnia.instrumentation import instrument_cache
+
+DISCUSSIONS_CACHE_KEY = 'zinnia:discussions:%s'
+
+
+def get_cache_backend():
+    """
+    Try to access to ``discussions`` cache value,
+    if fail use the ``default`` cache backend config.
+    """
+    try:
+        discussions_cache = caches['discussions']
+    except InvalidCacheBackendError:
+        discussions_cache = caches['default']
+    return instrument_cache(discussions_cache)
+
+
+def build_discussion_lists(entry):
+    """
+    Fetch the published discussions of an entry in one query,
+    and split them in lists of comments, pingbacks and trackbacks.
+    """
+    flags = CommentFlag.objects.filter(comment=OuterRef('pk'))
+    discussions = entry.discussions.select_related('user').annotate(
+        is_flagged=Exists(flags),
+        is_approved=Exists(flags.filter(
+            flag=CommentFlag.MODERATOR_APPROVAL)),
+        is_pingback=Exists(flags.filter(flag=PINGBACK)),
+        is_trackback=Exists(flags.filter(flag=TRACKBACK)))
+
+    discussion_lists = {'comments': [], 'pingbacks': [], 'trackbacks': []}
+    for discussion in discussions:
+        if not discussion.is_flagged or discussion.is_approved:
+            discussion_lists['comments'].append(discussion)
+        if discussion.is_pingback:
+            discussion_lists['pingbacks'].append(discussion)
+        if discussion.is_trackback:
+            discussion_lists['trackbacks'].append(discussion)
+    return discussion_lists
+
+
+def get_discussion_lists(entry):
+    """
+    Return the discussion lists of an entry,
+    built if not cached.
+    """
+    cache = get_cache_backend()
+    cache_key = DISCUSSIONS_CACHE_KEY % entry.pk
+    discussion_lists = cache.get(cache_key)
+    if discussion_lists is None:
+        discussion_lists = build_discussion_lists(entry)
+        cache.set(cache_key, discussion_lists)
+    return discussion_lists
+
+
+def flush_discussion_lists(entry_pk):
+    """
+    Flush the cached discussion lists of an entry.
+    """
+    get_cache_backend().delete(DISCUSSIONS_CACHE_KEY % entry_pk)
@@ -0,0 +1,202 @@
+"""Instrumentation of the views and template tags of Zinnia"""
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+from django.db import connection
+
+from zinnia.settings import INSTRUMENTATION
+
+MISSING = object()
+
+current_report = ContextVar('zinnia_instrumentation_report', default=None)
+
+
+class Record(object):
+    """
+    Metrics of a template tag, of a method of a view mixin,
+    or of a whole request, summed over their calls.
+    """
+
+    def __init__(self, kind, name):
+        self.kind = kind
+        self.name = name
+        self.calls = 0
+        self.queries = 0
+        self.query_time = 0.0
+        self.time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def as_dict(self):
+        """
+        Return the metrics as a dict, with the times in milliseconds.
+        """
+        return {'kind': self.kind,
+                'name': self.name,
+                'calls': self.calls,
+                'queries': self.queries,
+                'query_time': round(self.query_time * 1000, 3),
+                'time': round(self.time * 1000, 3),
+                'cache_hits': self.cache_hits,
+                'cache_misses': self.cache_misses}
+
+
+class Report(object):
+    """
+    Records of the instrumented scopes of a request,
+    with the stack of the scopes being measured.
+    """
+
+    def __init__(self):
+        self.records = {}
+        self.stack = []
+
+    def get_record(self, kind, name):
+        """
+        Return the record of a scope, created if needed.
+        """
+        record = self.records.get((kind, name))
+        if record is None:
+            record = self.records[kind, name] = Record(kind, name)
+        return record
+
+    def count_cache(self, hits, misses):
+        """
+        Count the cache hits and misses in the scopes being measured.
+        """
+        for record in self.stack:
+            record.cache_hits += hits
+            record.cache_misses += misses
+
+
+class QueryTimer(object):
+    """
+    Database execution wrapper counting and timing
+    the queries of a record.
+    """
+
+    def __init__(self, record):
+        self.record = record
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record.queries += 1
+            self.record.query_time += time.perf_counter() - start
+
+
+def measure(record, function, *args, **kwargs):
+    """
+    Call a function, adding its queries, wall time and
+    cache accesses to a record of the current report.
+    """
+    report = current_report.get()
+    report.stack.append(record)
+    start = time.perf_counter()
+    try:
+        with connection.execute_wrapper(QueryTimer(record)):
+            return function(*args, **kwargs)
+    finally:
+        record.time += time.perf_counter() - start
+        record.calls += 1
+        report.stack.pop()
+
+
+def instrument(kind, name, function, *args, **kwargs):
+    """
+    Call a function, measured under the name of a scope
+    if a report is collected for the current request.
+    """
+    report = current_report.get()
+    if report is None:
+        return function(*args, **kwargs)
+    return measure(report.get_record(kind, name), function, *args, **kwargs)
+
+
+def instrumented(kind):
+    """
+    Decorator measuring a function under its qualified name,
+    the function is returned as is if the instrumentation is disabled.
+    """
+    def decorator(function):
+        if not INSTRUMENTATION:
+            return function
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            return instrument(kind, function.__qualname__,
+                              function, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_library(library):
+    """
+    Measure the rendering of the nodes of the tags of a library,
+    the library is left as is if the instrumentation is disabled.
+    """
+    if not INSTRUMENTATION:
+        return library
+
+    def instrument_compile_function(name, compile_function):
+        @wraps(compile_function)
+        def wrapper(parser, token):
+            node = compile_function(parser, token)
+            render = node.render
+            node.render = lambda context: instrument(
+                'tag', name, render, context)
+            return node
+
+        return wrapper
+
+    for name, compile_function in list(library.tags.items()):
+        library.tags[name] = instrument_compile_function(
+            name, compile_function)
+    return library
+
+
+class InstrumentedCache(object):
+    """
+    Proxy of a cache backend, counting the hits and the misses
+    of the reads if a report is collected for the current request.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def __getattr__(self, name):
+        return getattr(self.cache, name)
+
+    def get(self, key, default=None, **kwargs):
+        report = current_report.get()
+        if report is None:
+            return self.cache.get(key, default, **kwargs)
+        value = self.cache.get(key, MISSING, **kwargs)
+        if value is MISSING:
+            report.count_cache(0, 1)
+            return default
+        report.count_cache(1, 0)
+        return value
+
+    def get_many(self, keys, **kwargs):
+        report = current_report.get()
+        keys = list(keys)
+        values = self.cache.get_many(keys, **kwargs)
+        if report is not None:
+            report.count_cache(len(values), len(keys) - len(values))
+        return values
+
+
+def instrument_cache(cache):
+    """
+    Return a cache backend counting its hits and misses,
+    or the cache backend itself if the instrumentation is disabled.
+    """
+    if not INSTRUMENTATION:
+        return cache
+    return InstrumentedCache(cache)
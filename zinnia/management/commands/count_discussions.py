@@ -7,7 +7,7 @@ from django.core.management.base import BaseCommand
 from django.utils.encoding import smart_str
 
 from zinnia.models.entry import Entry
-from zinnia.signals import disconnect_entry_signals
+from zinnia.signals import suppress_signals
 
 
 class Command(BaseCommand):
@@ -25,34 +25,34 @@ class Command(BaseCommand):
             sys.stdout.write(smart_str(message))
             sys.stdout.flush()
 
+    @suppress_signals()
     def handle(self, *args, **options):
-        disconnect_entry_signals()
         self.verbosity = int(options.get('verbosity', 1))
         for entry in Entry.objects.all():
             self.write_out('Processing %s\n' % entry.title)
-            changed = False
+            changed = []
             comment_count = entry.comments.count()
             pingback_count = entry.pingbacks.count()
             trackback_count = entry.trackbacks.count()
 
             if entry.comment_count != comment_count:
-                changed = True
+                changed.append('comment_count')
                 self.write_out('- %s comments found, %s before\n' % (
                     comment_count, entry.comment_count))
                 entry.comment_count = comment_count
 
             if entry.pingback_count != pingback_count:
-                changed = True
+                changed.append('pingback_count')
                 self.write_out('- %s pingbacks found, %s before\n' % (
                     pingback_count, entry.pingback_count))
                 entry.pingback_count = pingback_count
 
             if entry.trackback_count != trackback_count:
-                changed = True
+                changed.append('trackback_count')
                 self.write_out('- %s trackbacks found, %s before\n' % (
                     trackback_count, entry.trackback_count))
                 entry.trackback_count = trackback_count
 
             if changed:
                 self.write_out('- Updating...\n')
-                entry.save()
+                entry.save(update_fields=changed)
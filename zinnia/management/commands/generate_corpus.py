@@ -0,0 +1,63 @@
+"""
+Management command for generating a synthetic blog.
+"""
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import transaction
+
+from zinnia.corpus import CORPUS_PREFIX
+from zinnia.corpus import generate_corpus
+from zinnia.corpus import scale_corpus
+from zinnia.models.entry import Entry
+from zinnia.settings import MARKUP_LANGUAGE
+
+
+class Command(BaseCommand):
+    """
+    Command generating deterministically entries written
+    in the markup language, with tags, a tree of categories,
+    authors, sites and discussions.
+    """
+    help = 'Generate a synthetic blog for benchmarking Zinnia'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--entries', type=int, default=100,
+            help='Number of entries.')
+        for name in ('discussions', 'categories', 'authors',
+                     'sites', 'tags'):
+            parser.add_argument(
+                '--%s' % name, type=int,
+                help='Number of %s, proportional to the number '
+                'of entries by default.' % name)
+        parser.add_argument(
+            '--paragraphs', type=int, default=8,
+            help='Maximum number of paragraphs of the entries.')
+        parser.add_argument(
+            '--markup', default=MARKUP_LANGUAGE,
+            help='Markup language of the contents.')
+        parser.add_argument(
+            '--seed', type=int, default=42,
+            help='Seed of the random generator.')
+
+    def handle(self, *args, **options):
+        verbosity = int(options.get('verbosity', 1))
+        if Entry.objects.filter(
+                slug__startswith='%s-' % CORPUS_PREFIX).exists():
+            raise CommandError('A corpus has already been generated.')
+
+        parameters = scale_corpus(options['entries'])
+        for name in parameters:
+            if options.get(name) is not None:
+                parameters[name] = options[name]
+        with transaction.atomic():
+            corpus = generate_corpus(
+                paragraphs=options['paragraphs'],
+                markup=options['markup'],
+                seed=options['seed'], **parameters)
+
+        if verbosity:
+            self.stdout.write(
+                'Corpus generated: %s.' % ', '.join(
+                    '%i %s' % (corpus[name], name)
+                    for name in sorted(corpus)))
@@ -0,0 +1,77 @@
+"""
+Management command for benchmarking Zinnia.
+"""
+import json
+import platform
+
+import django
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db import transaction
+
+import zinnia
+from zinnia.benchmark import run_benchmarks
+from zinnia.corpus import generate_corpus
+from zinnia.corpus import scale_corpus
+from zinnia.flags import get_user_flagger
+from zinnia.settings import MARKUP_LANGUAGE
+
+
+class Command(BaseCommand):
+    """
+    Command reporting in JSON the queries, wall time and peak memory
+    of the public URLs, inclusion tags, sitemaps, markups and previews,
+    on the current database or on synthetic blogs of several sizes.
+    """
+    help = 'Benchmark the views and the template tags of Zinnia'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', default='',
+            help='Comma separated numbers of entries of the synthetic '
+            'blogs to benchmark, generated then rolled back. '
+            'The current database is benchmarked if not given.')
+        parser.add_argument(
+            '--repeat', type=int, default=5,
+            help='Number of timed calls of each case.')
+        parser.add_argument(
+            '--seed', type=int, default=42,
+            help='Seed of the random generator.')
+        parser.add_argument(
+            '--output',
+            help='File where the JSON report is written.')
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        runs = []
+        if not options['sizes']:
+            runs.append({'corpus': None,
+                         'results': run_benchmarks(repeat)})
+        for size in options['sizes'].split(','):
+            if not size.strip():
+                continue
+            with transaction.atomic():
+                corpus = generate_corpus(
+                    seed=options['seed'], **scale_corpus(int(size)))
+                runs.append({'corpus': corpus,
+                             'results': run_benchmarks(repeat)})
+                transaction.set_rollback(True)
+            Site.objects.clear_cache()
+            get_user_flagger.cache_clear()
+
+        report = json.dumps({
+            'environment': {
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'zinnia': zinnia.__version__,
+                'database': connection.vendor,
+                'markup': MARKUP_LANGUAGE,
+                'repeat': repeat},
+            'runs': runs}, indent=2, sort_keys=True)
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                output.write(report)
+        else:
+            self.stdout.write(report)
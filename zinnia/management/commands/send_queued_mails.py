@@ -0,0 +1,25 @@
+"""
+Management command for sending the mails of the outbox.
+"""
+from django.core.management.base import BaseCommand
+
+from zinnia.outbox import send_queued_mails
+
+
+class Command(BaseCommand):
+    """
+    Command for sending the queued mail notifications,
+    to be run periodically by a scheduler.
+    """
+    help = 'Send the queued mail notifications'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit', type=int, default=None,
+            help='Maximum number of queued mails to send.')
+
+    def handle(self, *args, **options):
+        verbosity = int(options.get('verbosity', 1))
+        sent = send_queued_mails(options['limit'])
+        if verbosity:
+            self.stdout.write('%i mails sent.' % sent)
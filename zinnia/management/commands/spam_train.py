@@ -0,0 +1,116 @@
+"""
+Management command for training the naive Bayes spam classifier.
+"""
+import random
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+import django_comments as comments
+
+from zinnia.models.entry import Entry
+from zinnia.models.spam import SpamToken
+from zinnia.spam_checker.backends.naive_bayes import NaiveBayesClassifier
+from zinnia.spam_checker.backends.naive_bayes import flush_classifier
+from zinnia.spam_checker.backends.naive_bayes import save_classifier
+from zinnia.spam_checker.backends.naive_bayes import tokenize
+
+
+class Command(BaseCommand):
+    """
+    Command for training the naive Bayes spam classifier
+    on the public comments and the removed comments,
+    or evaluating its accuracy and throughput.
+    """
+    help = 'Train the naive Bayes spam classifier on moderated comments'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--evaluate', action='store_true', default=False,
+            help='Evaluate the classifier on a part of the comments '
+            'without saving the statistics.')
+        parser.add_argument(
+            '--test-ratio', type=float, default=0.2,
+            help='Ratio of comments kept for the evaluation.')
+        parser.add_argument(
+            '--prune', type=int, default=0,
+            help='Remove the tokens seen less than this number of times.')
+
+    def get_dataset(self):
+        """
+        Return the list of (comment, is_spam) of the moderated comments.
+        """
+        content_type = ContentType.objects.get_for_model(Entry)
+        discussions = comments.get_model().objects.filter(
+            content_type=content_type)
+        dataset = []
+        for comment in discussions.filter(is_public=True, is_removed=False):
+            dataset.append((comment, False))
+        for comment in discussions.filter(is_removed=True):
+            dataset.append((comment, True))
+        return dataset
+
+    def handle(self, *args, **options):
+        verbosity = int(options.get('verbosity', 1))
+        dataset = self.get_dataset()
+
+        if options['evaluate']:
+            return self.evaluate(dataset, options['test_ratio'], verbosity)
+
+        classifier = NaiveBayesClassifier()
+        for comment, is_spam in dataset:
+            classifier.train(tokenize(comment), is_spam)
+        if options['prune']:
+            classifier.prune(options['prune'])
+        with transaction.atomic():
+            SpamToken.objects.all().delete()
+            save_classifier(classifier)
+        # Invalidate again the classifiers reloaded before the commit
+        flush_classifier()
+
+        if verbosity:
+            self.stdout.write(
+                'Classifier trained on %i spams and %i hams, '
+                '%i tokens saved.' % (classifier.spams, classifier.hams,
+                                      len(classifier.tokens)))
+
+    def evaluate(self, dataset, test_ratio, verbosity):
+        """
+        Train a classifier on a part of the dataset
+        and report its accuracy and throughput on the other part.
+        """
+        random.Random(42).shuffle(dataset)
+        split = int(len(dataset) * (1 - test_ratio))
+        training, testing = dataset[:split], dataset[split:]
+
+        classifier = NaiveBayesClassifier()
+        for comment, is_spam in training:
+            classifier.train(tokenize(comment), is_spam)
+
+        true_positives = false_positives = errors = 0
+        start = time.perf_counter()
+        for comment, is_spam in testing:
+            prediction = classifier.is_spam(tokenize(comment))
+            if prediction != is_spam:
+                errors += 1
+            if prediction and is_spam:
+                true_positives += 1
+            elif prediction:
+                false_positives += 1
+        duration = time.perf_counter() - start
+
+        spams = len([1 for comment, is_spam in testing if is_spam])
+        total = len(testing) or 1
+        if verbosity:
+            self.stdout.write(
+                'Trained on %i comments, tested on %i comments.\n'
+                'Accuracy: %.2f%%\n'
+                'Spams detected: %i/%i\n'
+                'False positives: %i\n'
+                'Throughput: %.1f microseconds per comment' % (
+                    len(training), len(testing),
+                    100.0 * (len(testing) - errors) / total,
+                    true_positives, spams, false_positives,
+                    duration * 1000000 / total))
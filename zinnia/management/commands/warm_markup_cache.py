@@ -0,0 +1,38 @@
+"""
+Management command for warming the cache of the markups.
+"""
+from django.core.management.base import BaseCommand
+
+from zinnia.markups import html_format_many
+from zinnia.models.entry import Entry
+
+
+class Command(BaseCommand):
+    """
+    Command rendering in bulk the content and the lead
+    of the entries, to cache their HTML formats.
+    """
+    help = 'Render and cache the HTML of the contents of the entries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes', type=int, default=1,
+            help='Number of processes rendering the contents.')
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of entries rendered at once.')
+
+    def handle(self, *args, **options):
+        verbosity = int(options.get('verbosity', 1))
+        batch_size = options['batch_size']
+        values = Entry.objects.order_by('pk').values_list('content', 'lead')
+
+        rendered = 0
+        for offset in range(0, values.count(), batch_size):
+            contents = [value for entry in values[offset:offset + batch_size]
+                        for value in entry if value]
+            html_format_many(contents, options['processes'])
+            rendered += len(contents)
+
+        if verbosity:
+            self.stdout.write('%i contents rendered.' % rendered)
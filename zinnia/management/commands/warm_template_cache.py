@@ -0,0 +1,45 @@
+"""
+Management command for warming the cache of the existing templates.
+"""
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from zinnia.templating import build_template_index
+from zinnia.templating import flush_template_index
+from zinnia.templating import set_template_index
+
+
+class Command(BaseCommand):
+    """
+    Command scanning the template directories to cache
+    the names of the existing templates, so the templates
+    of the views are resolved without probing the loaders.
+    """
+    help = 'Cache the names of the templates found in the template dirs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--clear', action='store_true', default=False,
+            help='Remove the cached names of the templates.')
+
+    def handle(self, *args, **options):
+        verbosity = int(options.get('verbosity', 1))
+
+        if options['clear']:
+            flush_template_index()
+            if verbosity:
+                self.stdout.write('Cache of the templates cleared.')
+            return
+
+        template_names = build_template_index()
+        if template_names is None:
+            raise CommandError('A template loader does not load '
+                               'its templates from directories.')
+        set_template_index(template_names)
+
+        if verbosity:
+            self.stdout.write(
+                '%i templates cached, %i in the zinnia directory.' % (
+                    len(template_names),
+                    len([name for name in template_names
+                         if name.startswith('zinnia/')])))
@@ -1,4 +1,6 @@
 """Managers of Zinnia"""
+from random import sample
+
 from django.contrib.sites.models import Site
 from django.db import models
 from django.utils import timezone
@@ -54,6 +56,26 @@ class EntryPublishedManager(models.Manager):
         return super(EntryPublishedManager, self).get_queryset().filter(
             sites=Site.objects.get_current())
 
+    def random(self, number=1):
+        """
+        Return up to ``number`` published entries picked randomly,
+        without sorting the entries by a random order.
+
+        Distinct offsets are sampled uniformly in the count
+        of the published entries, then each entry is fetched
+        at its offset in the entries ordered by primary key.
+        """
+        queryset = self.get_queryset().order_by('pk')
+        count = queryset.count()
+        entries = []
+        for offset in sample(range(count), min(number, count)):
+            try:
+                entries.append(queryset[offset])
+            except IndexError:
+                # The entry has been unpublished since the count
+                continue
+        return entries
+
     def search(self, pattern):
         """
         Top level search method on entries.
@@ -89,20 +111,44 @@ class EntryPublishedManager(models.Manager):
 
 class EntryRelatedPublishedManager(models.Manager):
     """
-    Manager to retrieve objects associated with published entries.
+    Manager to retrieve objects associated with published entries,
+    by correlated subqueries rather than by joins made distinct.
     """
 
+    def get_entries_published(self):
+        """
+        Return the published entries related to the object
+        of the outer query.
+        """
+        relation = self.model.entries.rel
+        return entries_published(
+            relation.related_model.objects.all()).filter(
+            **{relation.field.name: models.OuterRef('pk')}).order_by()
+
+    def entries_published_aggregate(self, function, field='pk'):
+        """
+        Return a subquery applying an aggregate function
+        on a field of the published entries of the outer object.
+        """
+        return models.Subquery(self.get_entries_published().annotate(
+            aggregate=models.Func(models.F(field), function=function)
+        ).values('aggregate'))
+
     def get_queryset(self):
         """
-        Return a queryset containing published entries.
+        Return a queryset of the objects having published entries.
         """
-        now = timezone.now()
         return super(
-            EntryRelatedPublishedManager, self).get_queryset().filter(
-            models.Q(entries__start_publication__lte=now) |
-            models.Q(entries__start_publication=None),
-            models.Q(entries__end_publication__gt=now) |
-            models.Q(entries__end_publication=None),
-            entries__status=PUBLISHED,
-            entries__sites=Site.objects.get_current()
-            ).distinct()
+            EntryRelatedPublishedManager, self).get_queryset().annotate(
+            has_entries_published=models.Exists(
+                self.get_entries_published())).filter(
+            has_entries_published=True)
+
+    def with_count_entries_published(self):
+        """
+        Return a queryset of the objects having published entries,
+        annotated with the number of these entries.
+        """
+        return self.get_queryset().annotate(
+            count_entries_published=self.entries_published_aggregate(
+                'COUNT'))
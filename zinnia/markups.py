@@ -2,16 +2,56 @@
 Set of" markup" function to transform plain text into HTML for Zinnia.
 Code originally provided by django.contrib.markups
 """
+import threading
 import warnings
+from copy import copy
+from hashlib import sha1
+from multiprocessing import Pool
 
+from django.core.cache import InvalidCacheBackendError
+from django.core.cache import caches
 from django.utils.encoding import force_bytes
 from django.utils.encoding import force_str
 from django.utils.html import linebreaks
 
+from zinnia.instrumentation import instrument_cache
 from zinnia.settings import MARKDOWN_EXTENSIONS
+from zinnia.settings import MARKUP_CACHE_TIMEOUT
 from zinnia.settings import MARKUP_LANGUAGE
 from zinnia.settings import RESTRUCTUREDTEXT_SETTINGS
 
+MARKUP_CACHE_PREFIX = 'zinnia:markup'
+
+
+class MarkupConverters(threading.local):
+    """
+    Registry of the converters of the markup languages,
+    each converter is built once by thread and configuration,
+    then reused for the next documents.
+    """
+
+    def __init__(self):
+        self.converters = {}
+
+    def get(self, key, build):
+        """
+        Return the converter registered under a key,
+        built by calling ``build`` if not registered yet.
+        """
+        converter = self.converters.get(key)
+        if converter is None:
+            converter = self.converters[key] = build()
+        return converter
+
+    def clear(self):
+        """
+        Forget the converters of the current thread.
+        """
+        self.converters.clear()
+
+
+converters = MarkupConverters()
+
 
 def textile(value):
     """
@@ -24,7 +64,9 @@ def textile(value):
                       RuntimeWarning)
         return value
 
-    return textile.textile(force_str(value))
+    # A new parser for each document, the notes, the references
+    # and the unique id of the anchors depending on the document
+    return textile.Textile().parse(force_str(value))
 
 
 def markdown(value, extensions=MARKDOWN_EXTENSIONS):
@@ -41,7 +83,11 @@ def markdown(value, extensions=MARKDOWN_EXTENSIONS):
                       RuntimeWarning)
         return value
 
-    return markdown.markdown(force_str(value), extensions=extensions)
+    extensions = tuple(extensions)
+    converter = converters.get(
+        ('markdown', extensions),
+        lambda: markdown.Markdown(extensions=extensions))
+    return converter.reset().convert(force_str(value))
 
 
 def restructuredtext(value, settings=RESTRUCTUREDTEXT_SETTINGS):
@@ -49,15 +95,27 @@ def restructuredtext(value, settings=RESTRUCTUREDTEXT_SETTINGS):
     RestructuredText processing with optionnally custom settings.
     """
     try:
+        from docutils.core import Publisher
         from docutils.core import publish_parts
     except ImportError:
         warnings.warn("The Python docutils library isn't installed.",
                       RuntimeWarning)
         return value
 
+    def build_settings():
+        publisher = Publisher()
+        publisher.set_components('standalone', 'restructuredtext',
+                                 'html4css1')
+        publisher.process_programmatic_settings(None, settings, None)
+        return publisher.settings
+
+    # The settings are parsed once, a copy is given to each document
+    docutils_settings = converters.get(
+        ('restructuredtext', repr(sorted(settings.items()))),
+        build_settings)
     parts = publish_parts(source=force_bytes(value),
                           writer_name='html4css1',
-                          settings_overrides=settings)
+                          settings=copy(docutils_settings))
     return force_str(parts['fragment'])
 
 
@@ -77,3 +135,83 @@ def html_format(value):
     elif '</p>' not in value:
         return linebreaks(value)
     return value
+
+
+def render_many(values, processes=None):
+    """
+    Returns the list of the values formatted in HTML,
+    spread across a pool of processes if more than one is given.
+    """
+    if processes and processes > 1 and len(values) > 1:
+        with Pool(processes) as pool:
+            return pool.map(html_format, values,
+                            chunksize=len(values) // processes + 1)
+    return [html_format(value) for value in values]
+
+
+def get_cache_backend():
+    """
+    Try to access to ``markups`` cache value,
+    if fail use the ``default`` cache backend config.
+    """
+    try:
+        markups_cache = caches['markups']
+    except InvalidCacheBackendError:
+        markups_cache = caches['default']
+    return instrument_cache(markups_cache)
+
+
+def get_markup_settings():
+    """
+    Return the representation of the settings
+    of the markup language changing the HTML formats.
+    """
+    if MARKUP_LANGUAGE == 'markdown':
+        return repr(tuple(MARKDOWN_EXTENSIONS))
+    elif MARKUP_LANGUAGE == 'restructuredtext':
+        return repr(sorted(RESTRUCTUREDTEXT_SETTINGS.items()))
+    return ''
+
+
+def get_cache_key(value):
+    """
+    Build the cache key of a value formatted in HTML,
+    from the markup language, its settings and the hash of the value.
+    """
+    return '%s:%s:%s' % (MARKUP_CACHE_PREFIX, MARKUP_LANGUAGE,
+                         sha1(force_bytes(get_markup_settings()) + b'\0' +
+                              force_bytes(value)).hexdigest())
+
+
+def cached_html_format(value):
+    """
+    Returns the value formatted in HTML,
+    reusing the format cached or caching the new one.
+    """
+    if not value:
+        return ''
+    cache = get_cache_backend()
+    key = get_cache_key(value)
+    html = cache.get(key)
+    if html is None:
+        html = html_format(value)
+        cache.set(key, html, MARKUP_CACHE_TIMEOUT)
+    return html
+
+
+def html_format_many(values, processes=None):
+    """
+    Returns the list of the values formatted in HTML,
+    reusing the formats cached and caching the new ones.
+    """
+    cache = get_cache_backend()
+    keys = [get_cache_key(value) for value in values]
+    formats = cache.get_many(keys)
+    missing = dict((key, value) for key, value in zip(keys, values)
+                   if key not in formats)
+    if missing:
+        missing = dict(zip(missing.keys(),
+                           render_many(list(missing.values()), processes)))
+        formats.update(missing)
+        cache.set_many(missing, MARKUP_CACHE_TIMEOUT)
+    return [formats[key] for key in keys]
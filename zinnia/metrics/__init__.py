@@ -0,0 +1,49 @@
+"""Metrics of the instrumentation for Zinnia"""
+import re
+import warnings
+from functools import lru_cache
+from importlib import import_module
+
+from django.core.exceptions import ImproperlyConfigured
+
+from zinnia.settings import METRICS_BACKENDS
+
+INVALID_CHARACTERS = re.compile(r'[^\w.-]')
+
+
+def metric_name(*parts):
+    """
+    Join the parts of the name of a metric with dots,
+    replacing the characters not allowed in the names.
+    """
+    return INVALID_CHARACTERS.sub(
+        '_', '.'.join(parts).replace(':', '.')).strip('_.')
+
+
+@lru_cache(maxsize=None)
+def load_metrics_backend(backend_path):
+    """
+    Import a metrics backend only once.
+    """
+    try:
+        backend_module = import_module(backend_path)
+        backend = getattr(backend_module, 'backend')
+    except (ImportError, AttributeError):
+        warnings.warn('%s backend cannot be imported' % backend_path,
+                      RuntimeWarning)
+        backend = None
+    except ImproperlyConfigured as e:
+        warnings.warn(str(e), RuntimeWarning)
+        backend = None
+
+    return backend
+
+
+def send_metrics(records, request):
+    """
+    Send the records of a request to the metrics backends.
+    """
+    for backend_path in METRICS_BACKENDS:
+        backend = load_metrics_backend(backend_path)
+        if backend is not None:
+            backend(records, request)
@@ -0,0 +1 @@
+"""Metrics backends for Zinnia"""
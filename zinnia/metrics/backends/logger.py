@@ -0,0 +1,16 @@
+"""Logger metrics backend for Zinnia"""
+from logging import getLogger
+
+
+def backend(records, request):
+    """
+    Log each record with its metrics as extra fields,
+    for the structured logging handlers.
+    """
+    logger = getLogger('zinnia.instrumentation')
+    for record in records:
+        logger.info(
+            '%(kind)s %(name)s: %(calls)i calls, %(queries)i queries '
+            'in %(query_time).2fms, %(time).2fms, %(cache_hits)i cache hits, '
+            '%(cache_misses)i cache misses', record,
+            extra={'path': request.path, 'metrics': record})
@@ -0,0 +1,12 @@
+"""Memory metrics backend for Zinnia"""
+from zinnia.metrics.backends.statsd import format_metrics
+
+packets = []
+
+
+def backend(records, request):
+    """
+    Keep the records formatted as StatsD packets in memory,
+    standing in for a StatsD server in development and tests.
+    """
+    packets.append(format_metrics(records))
@@ -0,0 +1,66 @@
+"""StatsD metrics backend for Zinnia"""
+import socket
+from functools import lru_cache
+
+from zinnia.metrics import metric_name
+from zinnia.settings import METRICS_STATSD_HOST
+from zinnia.settings import METRICS_STATSD_PORT
+from zinnia.settings import METRICS_STATSD_PREFIX
+
+MAX_PACKET_SIZE = 1432
+
+COUNTERS = ('calls', 'queries', 'cache_hits', 'cache_misses')
+TIMERS = ('query_time', 'time')
+
+
+def format_metrics(records, prefix=METRICS_STATSD_PREFIX):
+    """
+    Return the lines in the StatsD format of the records,
+    the counters being sent as counts and the times as timings.
+    """
+    lines = []
+    for record in records:
+        name = metric_name(prefix, record['kind'], record['name'])
+        for counter in COUNTERS:
+            lines.append('%s.%s:%i|c' % (name, counter, record[counter]))
+        for timer in TIMERS:
+            lines.append('%s.%s:%s|ms' % (name, timer, record[timer]))
+    return lines
+
+
+@lru_cache(1)
+def get_socket():
+    """
+    Return the UDP socket of the process.
+    """
+    return socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+
+def build_packets(lines):
+    """
+    Group the lines in packets fitting in the MTU of the network.
+    """
+    packets = []
+    packet = b''
+    for line in lines:
+        line = line.encode('utf-8')
+        if packet and len(packet) + len(line) + 1 > MAX_PACKET_SIZE:
+            packets.append(packet)
+            packet = b''
+        packet = packet and b'%s\n%s' % (packet, line) or line
+    if packet:
+        packets.append(packet)
+    return packets
+
+
+def backend(records, request):
+    """
+    Send the records to a StatsD server in UDP packets,
+    without waiting for any answer.
+    """
+    address = (METRICS_STATSD_HOST, METRICS_STATSD_PORT)
+    try:
+        for packet in build_packets(format_metrics(records)):
+            get_socket().sendto(packet, address)
+    except OSError:
+        pass
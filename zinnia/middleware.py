@@ -0,0 +1,57 @@
+"""Middlewares for Zinnia"""
+from django.core.exceptions import MiddlewareNotUsed
+
+from zinnia.instrumentation import Record
+from zinnia.instrumentation import Report
+from zinnia.instrumentation import current_report
+from zinnia.instrumentation import measure
+from zinnia.metrics import metric_name
+from zinnia.metrics import send_metrics
+from zinnia.settings import INSTRUMENTATION
+
+SERVER_TIMING = ('%(metric)s;dur=%(time).2f;'
+                 'desc="calls=%(calls)i queries=%(queries)i '
+                 'query_time=%(query_time).2f cache_hits=%(cache_hits)i '
+                 'cache_misses=%(cache_misses)i"')
+
+
+class InstrumentationMiddleware(object):
+    """
+    Middleware collecting the metrics of the template tags
+    and of the view mixins of Zinnia during a request,
+    added in the Server-Timing header of the response
+    and sent to the metrics backends.
+    """
+
+    def __init__(self, get_response):
+        if not INSTRUMENTATION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        report = Report()
+        record = Record('request', request.path)
+        token = current_report.set(report)
+        try:
+            response = measure(record, self.get_response, request)
+        finally:
+            current_report.reset(token)
+
+        resolver_match = request.resolver_match
+        if resolver_match is not None:
+            record.name = resolver_match.view_name
+        if not report.records and (resolver_match is None or
+                                   resolver_match.app_name != 'zinnia'):
+            return response
+
+        records = [record.as_dict()] + [
+            scope.as_dict() for scope in report.records.values()]
+        server_timing = ', '.join(SERVER_TIMING % dict(
+            scope, metric=metric_name('zinnia', scope['kind'], scope['name']))
+            for scope in records)
+        if response.has_header('Server-Timing'):
+            server_timing = '%s, %s' % (response['Server-Timing'],
+                                        server_timing)
+        response['Server-Timing'] = server_timing
+        send_metrics(records, request)
+        return response
@@ -0,0 +1,44 @@
+from django.db import migrations
+from django.db import models
+
+
+def fill_tree_path(apps, schema_editor):
+    """
+    Materialize the tree path of the existing categories.
+    """
+    category_model = apps.get_model('zinnia', 'Category')
+    categories = dict((category.pk, category)
+                      for category in category_model.objects.all())
+
+    def tree_path(category):
+        if not category.tree_path:
+            parent = categories.get(category.parent_id)
+            category.tree_path = category.slug
+            if parent is not None:
+                category.tree_path = '%s/%s' % (
+                    tree_path(parent), category.slug)
+        return category.tree_path
+
+    for category in categories.values():
+        tree_path(category)
+    category_model.objects.bulk_update(categories.values(), ['tree_path'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zinnia', '0005_category_mptt_update'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='tree_path',
+            field=models.CharField(
+                db_index=True, editable=False,
+                max_length=500, verbose_name='tree path', default=''),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_tree_path,
+                             migrations.RunPython.noop),
+    ]
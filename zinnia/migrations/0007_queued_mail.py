@@ -0,0 +1,36 @@
+from django.db import migrations
+from django.db import models
+from django.utils import timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zinnia', '0006_category_tree_path'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueuedMail',
+            fields=[
+                ('id', models.AutoField(
+                    verbose_name='ID', serialize=False,
+                    auto_created=True, primary_key=True)),
+                ('recipient', models.EmailField(
+                    db_index=True, max_length=254,
+                    verbose_name='recipient')),
+                ('subject', models.TextField(
+                    verbose_name='subject')),
+                ('message', models.TextField(
+                    verbose_name='message')),
+                ('creation_date', models.DateTimeField(
+                    default=timezone.now,
+                    verbose_name='creation date')),
+            ],
+            options={
+                'ordering': ['recipient', 'creation_date', 'pk'],
+                'verbose_name': 'queued mail',
+                'verbose_name_plural': 'queued mails',
+            },
+        ),
+    ]
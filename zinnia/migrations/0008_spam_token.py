@@ -0,0 +1,32 @@
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zinnia', '0007_queued_mail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpamToken',
+            fields=[
+                ('id', models.AutoField(
+                    verbose_name='ID', serialize=False,
+                    auto_created=True, primary_key=True)),
+                ('token', models.CharField(
+                    max_length=255, unique=True,
+                    verbose_name='token')),
+                ('spams', models.PositiveIntegerField(
+                    default=0, verbose_name='spams')),
+                ('hams', models.PositiveIntegerField(
+                    default=0, verbose_name='hams')),
+            ],
+            options={
+                'ordering': ['token'],
+                'verbose_name': 'spam token',
+                'verbose_name_plural': 'spam tokens',
+            },
+        ),
+    ]
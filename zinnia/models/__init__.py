@@ -2,6 +2,8 @@
 from zinnia.models.author import Author
 from zinnia.models.category import Category
 from zinnia.models.entry import Entry
+from zinnia.models.outbox import QueuedMail
+from zinnia.models.spam import SpamToken
 
 # Here we import the Zinnia's Model classes
 # to register the Models at the loading, not
@@ -9,4 +11,6 @@ from zinnia.models.entry import Entry
 # Issue #161, seems not valid since Django 1.7.
 __all__ = [Entry.__name__,
            Author.__name__,
-           Category.__name__]
+           Category.__name__,
+           QueuedMail.__name__,
+           SpamToken.__name__]
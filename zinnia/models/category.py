@@ -1,5 +1,8 @@
 """Category model for Zinnia"""
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Concat
+from django.db.models.functions import Substr
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -33,6 +36,10 @@ class Category(MPTTModel):
         on_delete=models.SET_NULL,
         verbose_name=_('parent category'))
 
+    tree_path = models.CharField(
+        _('tree path'), max_length=500,
+        db_index=True, editable=False)
+
     objects = TreeManager()
     published = EntryRelatedPublishedManager()
 
@@ -42,18 +49,62 @@ class Category(MPTTModel):
         """
         return entries_published(self.entries)
 
-    @property
-    def tree_path(self):
+    def build_tree_path(self):
         """
-        Returns category's tree path
-        by concatening the slug of his ancestors.
+        Builds the category's tree path
+        by concatening the slug of his parent's path.
         """
         if self.parent_id:
-            return '/'.join(
-                [ancestor.slug for ancestor in self.get_ancestors()] +
-                [self.slug])
+            return '%s/%s' % (self.parent.tree_path, self.slug)
         return self.slug
 
+    def update_descendants_tree_path(self, old_path, new_path):
+        """
+        Replaces the beginning of the tree path of the descendants
+        when the category is renamed, moved or deleted.
+        """
+        prefix = '%s/' % old_path
+        Category.objects.filter(tree_path__startswith=prefix).update(
+            tree_path=Concat(Value(new_path),
+                             Substr('tree_path', len(prefix) + 1)))
+
+    def rebuild_tree_path(self):
+        """
+        Rebuilds the tree path of the category and his descendants
+        from the tree stored in the database, when the category
+        is moved without the paths being known, like by move_to().
+        """
+        paths = {None: None}
+        if self.parent_id:
+            paths[self.parent_id] = Category.objects.filter(
+                pk=self.parent_id).values_list('tree_path', flat=True).get()
+        changed = []
+        for node in [self] + list(self.get_descendants().order_by(
+                'lft').only('slug', 'parent', 'tree_path')):
+            path = '/'.join(filter(None, [paths[node.parent_id], node.slug]))
+            paths[node.pk] = path
+            if node is not self and node.tree_path != path:
+                node.tree_path = path
+                changed.append(node)
+        self.tree_path = paths[self.pk]
+        Category.objects.filter(pk=self.pk).update(tree_path=self.tree_path)
+        Category.objects.bulk_update(changed, ['tree_path'])
+
+    def save(self, *args, **kwargs):
+        """
+        Materializes the tree path before saving,
+        and propagates its change to the descendants.
+        """
+        old_path = self.tree_path
+        self.tree_path = self.build_tree_path()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and old_path != self.tree_path:
+            kwargs['update_fields'] = set(update_fields) | {'tree_path'}
+        super(Category, self).save(*args, **kwargs)
+        if old_path and old_path != self.tree_path:
+            self.update_descendants_tree_path(
+                old_path, '%s/' % self.tree_path)
+
     def get_absolute_url(self):
         """
         Builds and returns the category's URL
@@ -77,3 +128,20 @@ class Category(MPTTModel):
         Category MPTT's meta informations.
         """
         order_insertion_by = ['title']
+
+
+def rebuild_tree_path_handler(sender, **kwargs):
+    """
+    Rebuilds the tree paths when a category is moved in the tree.
+    """
+    kwargs['instance'].rebuild_tree_path()
+
+
+def strip_tree_path_handler(sender, **kwargs):
+    """
+    The children being detached from a deleted category,
+    its path is removed from the descendants' paths,
+    even when the category is deleted by a queryset.
+    """
+    category = kwargs['instance']
+    category.update_descendants_tree_path(category.tree_path, '')
@@ -0,0 +1,34 @@
+"""Outbox model for Zinnia"""
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class QueuedMail(models.Model):
+    """
+    Mail notification waiting in the outbox
+    to be sent to a recipient.
+    """
+
+    recipient = models.EmailField(
+        _('recipient'), db_index=True)
+
+    subject = models.TextField(
+        _('subject'))
+
+    message = models.TextField(
+        _('message'))
+
+    creation_date = models.DateTimeField(
+        _('creation date'), default=timezone.now)
+
+    def __str__(self):
+        return '%s: %s' % (self.recipient, self.subject)
+
+    class Meta:
+        """
+        QueuedMail's meta informations.
+        """
+        ordering = ['recipient', 'creation_date', 'pk']
+        verbose_name = _('queued mail')
+        verbose_name_plural = _('queued mails')
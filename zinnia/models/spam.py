@@ -0,0 +1,30 @@
+"""Spam token model for Zinnia"""
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SpamToken(models.Model):
+    """
+    Number of spams and hams containing a token,
+    learned by the naive Bayes spam checker.
+    """
+
+    token = models.CharField(
+        _('token'), max_length=255, unique=True)
+
+    spams = models.PositiveIntegerField(
+        _('spams'), default=0)
+
+    hams = models.PositiveIntegerField(
+        _('hams'), default=0)
+
+    def __str__(self):
+        return '%s: %i/%i' % (self.token, self.spams, self.hams)
+
+    class Meta:
+        """
+        SpamToken's meta informations.
+        """
+        ordering = ['token']
+        verbose_name = _('spam token')
+        verbose_name_plural = _('spam tokens')
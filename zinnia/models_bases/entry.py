@@ -1,14 +1,19 @@
 """Base entry models for Zinnia"""
 import os
+from functools import lru_cache
 
 from django.contrib.sites.models import Site
 from django.db import models
 from django.db.models import Q
 from django.template.defaultfilters import slugify
+from django.urls import get_script_prefix
+from django.urls import get_urlconf
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.html import strip_tags
 from django.utils.text import Truncator
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
 import django_comments as comments
@@ -17,13 +22,14 @@ from django_comments.models import CommentFlag
 from tagging.fields import TagField
 from tagging.utils import parse_tag_input
 
+from zinnia.discussions import get_discussion_lists
 from zinnia.flags import PINGBACK
 from zinnia.flags import TRACKBACK
 from zinnia.managers import DRAFT, HIDDEN, PUBLISHED
 from zinnia.managers import EntryPublishedManager
 from zinnia.managers import entries_published
-from zinnia.markups import html_format
-from zinnia.preview import HTMLPreview
+from zinnia.markups import cached_html_format
+from zinnia.preview import get_html_preview
 from zinnia.settings import AUTO_CLOSE_COMMENTS_AFTER
 from zinnia.settings import AUTO_CLOSE_PINGBACKS_AFTER
 from zinnia.settings import AUTO_CLOSE_TRACKBACKS_AFTER
@@ -31,6 +37,34 @@ from zinnia.settings import ENTRY_CONTENT_TEMPLATES
 from zinnia.settings import ENTRY_DETAIL_TEMPLATES
 from zinnia.settings import UPLOAD_TO
 from zinnia.url_shortener import get_url_shortener
+from zinnia.url_shortener.backends.default import build_shortlink_path
+
+
+@lru_cache(maxsize=4096)
+def build_entry_url(publication_date, slug, current_timezone,
+                    urlconf, script_prefix, language):
+    """
+    Builds the URL of an entry, memoized for each
+    time zone, URLconf, script prefix and language,
+    the URLs being translatable.
+    """
+    if timezone.is_aware(publication_date):
+        publication_date = timezone.localtime(
+            publication_date, current_timezone)
+    return reverse('zinnia:entry_detail', kwargs={
+        'year': publication_date.strftime('%Y'),
+        'month': publication_date.strftime('%m'),
+        'day': publication_date.strftime('%d'),
+        'slug': slug}, urlconf=urlconf)
+
+
+def reset_url_caches(**kwargs):
+    """
+    Forget the memoized URLs when the URLconf is changed.
+    """
+    if kwargs.get('setting', 'ROOT_URLCONF') == 'ROOT_URLCONF':
+        build_entry_url.cache_clear()
+        build_shortlink_path.cache_clear()
 
 
 class CoreEntry(models.Model):
@@ -170,14 +204,10 @@ class CoreEntry(models.Model):
         Builds and returns the entry's URL based on
         the slug and the creation date.
         """
-        publication_date = self.publication_date
-        if timezone.is_aware(publication_date):
-            publication_date = timezone.localtime(publication_date)
-        return reverse('zinnia:entry_detail', kwargs={
-            'year': publication_date.strftime('%Y'),
-            'month': publication_date.strftime('%m'),
-            'day': publication_date.strftime('%d'),
-            'slug': self.slug})
+        return build_entry_url(
+            self.publication_date, self.slug,
+            timezone.get_current_timezone(),
+            get_urlconf(), get_script_prefix(), get_language())
 
     def __str__(self):
         return '%s: %s' % (self.title, self.get_status_display())
@@ -211,7 +241,7 @@ class ContentEntry(models.Model):
         """
         Returns the "content" field formatted in HTML.
         """
-        return html_format(self.content)
+        return cached_html_format(self.content)
 
     @property
     def html_preview(self):
@@ -219,8 +249,8 @@ class ContentEntry(models.Model):
         Returns a preview of the "content" field or
         the "lead" field if defined, formatted in HTML.
         """
-        return HTMLPreview(self.html_content,
-                           getattr(self, 'html_lead', ''))
+        return get_html_preview(self.html_content,
+                                getattr(self, 'html_lead', ''))
 
     @property
     def word_count(self):
@@ -286,6 +316,14 @@ class DiscussionsEntry(models.Model):
         """
         return self.discussions.filter(flags__flag=TRACKBACK)
 
+    @cached_property
+    def discussion_lists(self):
+        """
+        Returns the lists of the published comments,
+        pingbacks and trackbacks, fetched together and cached.
+        """
+        return get_discussion_lists(self)
+
     def discussion_is_still_open(self, discussion_type, auto_close_after):
         """
         Checks if a type of discussion is still open
@@ -364,7 +402,7 @@ class LeadEntry(models.Model):
         """
         Returns the "lead" field formatted in HTML.
         """
-        return html_format(self.lead)
+        return cached_html_format(self.lead)
 
     class Meta:
         abstract = True
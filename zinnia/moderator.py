@@ -1,8 +1,11 @@
 """Moderator of Zinnia comments"""
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.sites.models import Site
 from django.core.mail import EmailMessage
-from django.core.mail import send_mail
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.db.models.functions import NullIf
 from django.template import loader
 from django.utils.translation import activate
 from django.utils.translation import get_language
@@ -10,10 +13,12 @@ from django.utils.translation import gettext_lazy as _
 
 from django_comments.moderation import CommentModerator
 
+from zinnia.outbox import queue_mail
 from zinnia.settings import AUTO_CLOSE_COMMENTS_AFTER
 from zinnia.settings import AUTO_MODERATE_COMMENTS
 from zinnia.settings import MAIL_COMMENT_AUTHORS
 from zinnia.settings import MAIL_COMMENT_NOTIFICATION_RECIPIENTS
+from zinnia.settings import MAIL_COMMENT_QUEUE
 from zinnia.settings import MAIL_COMMENT_REPLY
 from zinnia.settings import PROTOCOL
 from zinnia.settings import SPAM_CHECKER_BACKENDS
@@ -32,6 +37,7 @@ class EntryCommentModerator(CommentModerator):
     spam_checker_backends = SPAM_CHECKER_BACKENDS
     auto_moderate_comments = AUTO_MODERATE_COMMENTS
     mail_comment_notification_recipients = MAIL_COMMENT_NOTIFICATION_RECIPIENTS
+    mail_comment_queue = MAIL_COMMENT_QUEUE
 
     def moderate(self, comment, entry, request):
         """
@@ -65,6 +71,24 @@ class EntryCommentModerator(CommentModerator):
         finally:
             activate(current_language)
 
+    def send_email(self, subject, message, recipient_list, bcc=False):
+        """
+        Send an email, or put it in the outbox
+        to be sent later to each recipient.
+        """
+        if self.mail_comment_queue:
+            queue_mail(subject, message, recipient_list)
+            return
+
+        recipient_list = list(recipient_list)
+        if bcc:
+            mail = EmailMessage(subject, message, settings.DEFAULT_FROM_EMAIL,
+                                bcc=recipient_list)
+        else:
+            mail = EmailMessage(subject, message, settings.DEFAULT_FROM_EMAIL,
+                                recipient_list)
+        mail.send(fail_silently=not settings.DEBUG)
+
     def do_email_notification(self, comment, entry, site):
         """
         Send email notification of a new comment to site staff.
@@ -84,12 +108,9 @@ class EntryCommentModerator(CommentModerator):
             {'site': site.name, 'title': entry.title}
         message = template.render(context)
 
-        send_mail(
+        self.send_email(
             subject, message,
-            settings.DEFAULT_FROM_EMAIL,
-            self.mail_comment_notification_recipients,
-            fail_silently=not settings.DEBUG
-        )
+            self.mail_comment_notification_recipients)
 
     def do_email_authors(self, comment, entry, site):
         """
@@ -119,12 +140,7 @@ class EntryCommentModerator(CommentModerator):
             {'site': site.name, 'title': entry.title}
         message = template.render(context)
 
-        send_mail(
-            subject, message,
-            settings.DEFAULT_FROM_EMAIL,
-            recipient_list,
-            fail_silently=not settings.DEBUG
-        )
+        self.send_email(subject, message, recipient_list)
 
     def do_email_reply(self, comment, entry, site):
         """
@@ -139,10 +155,13 @@ class EntryCommentModerator(CommentModerator):
             + [author.email for author in entry.authors.all()]
             + [comment.email]
         )
+        email_field = 'user__%s' % get_user_model().get_email_field_name()
         recipient_list = (
-            set([other_comment.email
-                 for other_comment in entry.comments
-                 if other_comment.email])
+            set(entry.comments.annotate(
+                recipient=Coalesce(NullIf(email_field, Value('')),
+                                   'user_email')
+            ).exclude(recipient='').order_by().values_list(
+                'recipient', flat=True).distinct())
             - set(exclude_list)
         )
         if not recipient_list:
@@ -160,8 +179,4 @@ class EntryCommentModerator(CommentModerator):
             {'site': site.name, 'title': entry.title}
         message = template.render(context)
 
-        mail = EmailMessage(
-            subject, message,
-            settings.DEFAULT_FROM_EMAIL,
-            bcc=recipient_list)
-        mail.send(fail_silently=not settings.DEBUG)
+        self.send_email(subject, message, recipient_list, bcc=True)
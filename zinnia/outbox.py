@@ -0,0 +1,114 @@
+"""Outbox of the mail notifications for Zinnia"""
+from itertools import groupby
+from operator import attrgetter
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.mail import EmailMessage
+from django.core.mail import get_connection
+from django.db import connections
+from django.db import router
+from django.db import transaction
+from django.utils.translation import gettext as _
+
+from zinnia.models.outbox import QueuedMail
+
+
+def queue_mail(subject, message, recipient_list):
+    """
+    Put a mail in the outbox for each recipient.
+    """
+    QueuedMail.objects.bulk_create([
+        QueuedMail(recipient=recipient, subject=subject, message=message)
+        for recipient in sorted(set(recipient_list))])
+
+
+def build_mail(recipient, queued_mails, site):
+    """
+    Build the mail sent to a recipient, a digest
+    if several mails are waiting for him.
+    """
+    if len(queued_mails) == 1:
+        subject = queued_mails[0].subject
+        message = queued_mails[0].message
+    else:
+        subject = _('[%(site)s] %(count)i new notifications') % {
+            'site': site.name, 'count': len(queued_mails)}
+        message = '\n\n'.join(
+            '%s\n%s\n\n%s' % (queued_mail.subject,
+                              '=' * len(queued_mail.subject),
+                              queued_mail.message)
+            for queued_mail in queued_mails)
+    return EmailMessage(subject, message,
+                        settings.DEFAULT_FROM_EMAIL, [recipient])
+
+
+def claim_queued_mails(limit=None):
+    """
+    Remove the mails from the outbox in a short transaction
+    and return them, so they are claimed by a single sender.
+
+    The rows locked by another sender are skipped when
+    the database supports it.
+    """
+    database = router.db_for_write(QueuedMail)
+    skip_locked = connections[
+        database].features.has_select_for_update_skip_locked
+    with transaction.atomic(using=database):
+        queued_mails = QueuedMail.objects.using(database).select_for_update(
+            skip_locked=skip_locked).order_by(
+                'recipient', 'creation_date', 'pk')
+        if limit:
+            queued_mails = queued_mails[:limit]
+        queued_mails = list(queued_mails)
+        if queued_mails:
+            QueuedMail.objects.using(database).filter(
+                pk__in=[queued_mail.pk for queued_mail in queued_mails]
+            ).delete()
+    return queued_mails
+
+
+def send_queued_mails(limit=None, connection=None):
+    """
+    Send the mails of the outbox over a single connection,
+    one mail by recipient, and return the number of mails sent.
+
+    The mails are claimed before being sent, and the mails
+    of a recipient are put back in the outbox if their sending
+    fails, so they will be sent again by the next call.
+    The first error is raised once every recipient is processed.
+    """
+    queued_mails = claim_queued_mails(limit)
+    if not queued_mails:
+        return 0
+
+    site = Site.objects.get_current()
+    pending = [(recipient, list(recipient_mails))
+               for recipient, recipient_mails in groupby(
+                   queued_mails, attrgetter('recipient'))]
+    connection = connection or get_connection()
+    failed = []
+    error = None
+    sent = 0
+    try:
+        with connection:
+            while pending:
+                recipient, recipient_mails = pending[0]
+                try:
+                    if connection.send_messages(
+                            [build_mail(recipient, recipient_mails, site)]):
+                        sent += 1
+                    else:
+                        failed.extend(recipient_mails)
+                except Exception as exception:
+                    error = error or exception
+                    failed.extend(recipient_mails)
+                pending.pop(0)
+    finally:
+        QueuedMail.objects.bulk_create(failed + [
+            queued_mail for recipient, recipient_mails in pending
+            for queued_mail in recipient_mails])
+
+    if error is not None:
+        raise error
+    return sent
@@ -0,0 +1,285 @@
+"""Paginators for Zinnia"""
+import binascii
+import uuid
+
+from django.core.cache import InvalidCacheBackendError
+from django.core.cache import caches
+from django.core.paginator import EmptyPage
+from django.core.paginator import InvalidPage
+from django.core.paginator import Page
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.encoding import force_bytes
+from django.utils.functional import cached_property
+from django.utils.http import urlsafe_base64_decode
+from django.utils.http import urlsafe_base64_encode
+from django.utils.translation import gettext as _
+
+from zinnia.instrumentation import instrument_cache
+
+COUNT_GENERATION_CACHE_KEY = 'zinnia:count_generation'
+
+
+class KeysetPage(object):
+    """
+    Page of objects delimited by cursors
+    instead of a page number.
+    """
+    number = None
+
+    def __init__(self, object_list, paginator,
+                 has_previous=False, has_next=False):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_previous = has_previous
+        self._has_next = has_next
+
+    def __repr__(self):
+        return '<Page of %s objects>' % len(self)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        """
+        Check if older objects exist.
+        """
+        return self._has_next
+
+    def has_previous(self):
+        """
+        Check if newer objects exist.
+        """
+        return self._has_previous
+
+    def has_other_pages(self):
+        """
+        Check if the objects are paginated.
+        """
+        return self._has_previous or self._has_next
+
+    @property
+    def next_cursor(self):
+        """
+        Cursor of the last object, for the next page.
+        """
+        if self._has_next and self.object_list:
+            return self.paginator.encode_cursor(self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        """
+        Cursor of the first object, for the previous page.
+        """
+        if self._has_previous and self.object_list:
+            return self.paginator.encode_cursor(self.object_list[0])
+
+
+class KeysetPaginator(object):
+    """
+    Paginator ordering the objects by descending date and primary key,
+    and finding the pages from the cursor of the previous or next page.
+
+    Neither COUNT nor OFFSET are used, one extra object is fetched
+    to know if the other page exists.
+    """
+    keyset = True
+
+    def __init__(self, object_list, per_page, date_field='publication_date'):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.date_field = date_field
+
+    def encode_cursor(self, obj):
+        """
+        Return the cursor pointing on an object.
+        """
+        return urlsafe_base64_encode(force_bytes('%s|%s' % (
+            getattr(obj, self.date_field).isoformat(), obj.pk)))
+
+    def decode_cursor(self, cursor):
+        """
+        Return the date and the primary key of a cursor.
+        """
+        try:
+            date, pk = urlsafe_base64_decode(
+                cursor).decode('utf-8').split('|')
+            date = parse_datetime(date)
+            pk = int(pk)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            date = None
+        if date is None:
+            raise InvalidPage(_('Invalid cursor'))
+        return date, pk
+
+    def page(self, after=None, before=None):
+        """
+        Return the page of the objects after a cursor, before a cursor,
+        or the first page if no cursor is given.
+        """
+        field = self.date_field
+        if before:
+            date, pk = self.decode_cursor(before)
+            objects = list(self.object_list.filter(
+                Q(**{'%s__gt' % field: date}) |
+                Q(**{field: date, 'pk__gt': pk})
+            ).order_by(field, 'pk')[:self.per_page + 1])
+            if objects:
+                has_previous = len(objects) > self.per_page
+                objects = objects[:self.per_page][::-1]
+                return KeysetPage(objects, self, has_previous, True)
+
+        queryset = self.object_list
+        if after:
+            date, pk = self.decode_cursor(after)
+            queryset = queryset.filter(
+                Q(**{'%s__lt' % field: date}) |
+                Q(**{field: date, 'pk__lt': pk}))
+        objects = list(queryset.order_by(
+            '-%s' % field, '-pk')[:self.per_page + 1])
+        has_next = len(objects) > self.per_page
+        return KeysetPage(objects[:self.per_page], self,
+                          bool(after), has_next)
+
+
+def get_cache_backend():
+    """
+    Try to access to ``paginator`` cache value,
+    if fail use the ``default`` cache backend config.
+    """
+    try:
+        paginator_cache = caches['paginator']
+    except InvalidCacheBackendError:
+        paginator_cache = caches['default']
+    return instrument_cache(paginator_cache)
+
+
+def get_count_generation():
+    """
+    Return the generation of the cached counts,
+    part of their keys to invalidate them all at once.
+    """
+    cache = get_cache_backend()
+    generation = cache.get(COUNT_GENERATION_CACHE_KEY)
+    if generation is None:
+        generation = flush_cached_counts()
+    return generation
+
+
+def flush_cached_counts():
+    """
+    Invalidate all the cached counts by starting a new generation.
+    """
+    generation = uuid.uuid4().hex
+    get_cache_backend().set(COUNT_GENERATION_CACHE_KEY, generation, None)
+    return generation
+
+
+class EstimatedCountPage(Page):
+    """
+    Page of a paginator whose count is estimated,
+    knowing if a next page exists from an extra object.
+    """
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super(EstimatedCountPage, self).__init__(
+            object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        """
+        Check if more objects exist after the page.
+        """
+        return self._has_next
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator caching the count of the objects under a key,
+    and counting at most ``threshold`` objects if given.
+
+    Past the threshold, the count is estimated to the threshold
+    and the next pages are still reachable.
+    """
+
+    def __init__(self, object_list, per_page, cache_key=None,
+                 threshold=None, **kwargs):
+        self.cache_key = cache_key
+        self.threshold = threshold
+        super(CachedCountPaginator, self).__init__(
+            object_list, per_page, **kwargs)
+
+    def get_count(self):
+        """
+        Count the objects, stopping one object past the threshold
+        to know if more objects exist.
+        """
+        if self.threshold:
+            return self.object_list[:self.threshold + 1].count()
+        return self.object_list.count()
+
+    @cached_property
+    def counted(self):
+        """
+        Return the number of objects counted from the cache,
+        or count them and cache the result.
+        """
+        if self.cache_key is None:
+            return self.get_count()
+        cache = get_cache_backend()
+        cache_key = 'zinnia:count:%s:%s' % (get_count_generation(),
+                                            self.cache_key)
+        count = cache.get(cache_key)
+        if count is None:
+            count = self.get_count()
+            cache.set(cache_key, count)
+        return count
+
+    @cached_property
+    def is_estimated(self):
+        """
+        Check if more objects than the threshold exist.
+        """
+        return bool(self.threshold) and self.counted > self.threshold
+
+    @cached_property
+    def count(self):
+        """
+        Return the count of the objects,
+        estimated to the threshold if exceeded.
+        """
+        if self.is_estimated:
+            return self.threshold
+        return self.counted
+
+    def validate_number(self, number):
+        """
+        Validate the page number, the pages past the estimated
+        count being validated when their objects are fetched.
+        """
+        try:
+            return super(CachedCountPaginator, self).validate_number(number)
+        except EmptyPage:
+            if not self.is_estimated or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        """
+        Return the page of the objects for the given number,
+        fetching one more object to find the next page
+        if the count is estimated.
+        """
+        number = self.validate_number(number)
+        if not self.is_estimated:
+            return super(CachedCountPaginator, self).page(number)
+        bottom = (number - 1) * self.per_page
+        objects = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not objects and number > 1:
+            raise EmptyPage(_('That page contains no results'))
+        return EstimatedCountPage(objects[:self.per_page], number, self,
+                                  len(objects) > self.per_page)
@@ -1,6 +1,9 @@
 """Pings utilities for Zinnia"""
 import socket
+from collections import deque
+from itertools import count
 from logging import getLogger
+from threading import Lock
 from threading import Thread
 from urllib.parse import urlsplit
 from urllib.request import urlopen
@@ -11,6 +14,7 @@ from bs4 import BeautifulSoup
 
 from django.contrib.sites.models import Site
 from django.urls import reverse
+from django.utils import timezone
 
 from zinnia.flags import PINGBACK
 from zinnia.settings import PROTOCOL
@@ -84,6 +88,88 @@ class DirectoryPinger(Thread):
         return reply
 
 
+class PingJob(object):
+    """
+    Follow-up of the ping of entries to a directory.
+    """
+
+    def __init__(self, job_id, directory, entries):
+        self.id = job_id
+        self.directory = directory
+        self.entries = [str(entry) for entry in entries]
+        self.submitted = timezone.now()
+        self.pinger = DirectoryPinger(directory, entries)
+
+    @property
+    def is_running(self):
+        """
+        Checks if the pings are still running.
+        """
+        return self.pinger.is_alive()
+
+    @property
+    def results(self):
+        """
+        Returns the replies received from the directory.
+        """
+        return list(self.pinger.results)
+
+    @property
+    def success(self):
+        """
+        Returns the number of entries successfully pinged.
+        """
+        return len([result for result in self.results
+                    if not result.get('flerror', True)])
+
+    @property
+    def errors(self):
+        """
+        Returns the error messages returned by the directory.
+        """
+        return [result['message'] for result in self.results
+                if result.get('flerror', True)]
+
+
+class PingDispatcher(object):
+    """
+    Dispatcher running the directory pings in background
+    and keeping the last jobs for consultation.
+    """
+
+    def __init__(self, max_jobs=50):
+        self.lock = Lock()
+        self.counter = count(1)
+        self.jobs = deque(maxlen=max_jobs)
+
+    def dispatch(self, directory, entries):
+        """
+        Start pinging the entries to a directory
+        and return the job without waiting the replies.
+        """
+        with self.lock:
+            job = PingJob(next(self.counter), directory, list(entries))
+            self.jobs.appendleft(job)
+        return job
+
+    def get_jobs(self):
+        """
+        Returns the last jobs, the most recent first.
+        """
+        with self.lock:
+            return list(self.jobs)
+
+    def join(self):
+        """
+        Wait the end of all the jobs.
+        """
+        for job in self.get_jobs():
+            job.pinger.join()
+
+
+ping_dispatcher = PingDispatcher()
+
+
 class ExternalUrlsPinger(Thread):
     """
     Threaded external URLs pinger.
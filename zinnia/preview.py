@@ -1,16 +1,37 @@
 """Preview for Zinnia"""
 from __future__ import division
 
+import hashlib
+import re
+
 from bs4 import BeautifulSoup
 
+from django.core.cache import InvalidCacheBackendError
+from django.core.cache import caches
+from django.utils.encoding import force_bytes
 from django.utils.functional import cached_property
 from django.utils.html import strip_tags
 from django.utils.text import Truncator
 
+from zinnia.instrumentation import instrument_cache
 from zinnia.settings import PREVIEW_MAX_WORDS
 from zinnia.settings import PREVIEW_MORE_STRING
 from zinnia.settings import PREVIEW_SPLITTERS
 
+PREVIEW_CACHE_PREFIX = 'zinnia:preview'
+
+WORDS = re.compile(r'[^<>\s]+')
+
+
+def count_words(html):
+    """
+    Count the words of an HTML content,
+    without stripping the tags of a plain text.
+    """
+    if '<' in html:
+        html = strip_tags(html)
+    return len(html.split())
+
 
 class HTMLPreview(object):
     """
@@ -69,8 +90,17 @@ class HTMLPreview(object):
 
     def truncate(self):
         """
-        Truncate the content with the Truncator object.
-        """
+        Truncate the content with the Truncator object,
+        or directly after the last word kept for a plain text.
+        """
+        if '<' not in self.content and self.max_words > 0:
+            words = WORDS.finditer(self.content)
+            for index, word in enumerate(words, 1):
+                if index == self.max_words:
+                    if next(words, None) is None:
+                        break
+                    return self.content[:word.end()] + self.more_string
+            return self.content
         return Truncator(self.content).words(
             self.max_words, self.more_string, html=True)
 
@@ -91,14 +121,14 @@ class HTMLPreview(object):
         Return the total of words contained
         in the content and in the lead.
         """
-        return len(strip_tags('%s %s' % (self.lead, self.content)).split())
+        return count_words('%s %s' % (self.lead, self.content))
 
     @cached_property
     def displayed_words(self):
         """
         Return the number of words displayed in the preview.
         """
-        return (len(strip_tags(self.preview).split()) -
+        return (count_words(str(self.preview)) -
                 (len(self.more_string.split()) * int(not bool(self.lead))))
 
     @cached_property
@@ -121,3 +151,58 @@ class HTMLPreview(object):
         Return the percentage of the content remaining after the preview.
         """
         return (self.remaining_words / self.total_words) * 100
+
+    @cached_property
+    def cache_key(self):
+        """
+        Key identifying the preview of the content and of the lead
+        built with the same options.
+        """
+        options = '\x00'.join([self.lead, self.content, self.more_string,
+                               str(self.max_words)] + list(self.splitters))
+        return '%s:%s' % (PREVIEW_CACHE_PREFIX,
+                          hashlib.sha1(force_bytes(options)).hexdigest())
+
+    def dump(self):
+        """
+        Return the preview and its word statistics to be cached.
+        """
+        return {'preview': str(self.preview),
+                'total_words': self.total_words,
+                'displayed_words': self.displayed_words}
+
+    def load(self, data):
+        """
+        Restore the preview and its word statistics from the cache.
+        """
+        self._preview = data['preview']
+        self.__dict__['total_words'] = data['total_words']
+        self.__dict__['displayed_words'] = data['displayed_words']
+
+
+def get_cache_backend():
+    """
+    Try to access to ``previews`` cache value,
+    if fail use the ``default`` cache backend config.
+    """
+    try:
+        previews_cache = caches['previews']
+    except InvalidCacheBackendError:
+        previews_cache = caches['default']
+    return instrument_cache(previews_cache)
+
+
+def get_html_preview(content, lead=''):
+    """
+    Return the preview of an HTML content, built once
+    for each revision of the content and of the lead,
+    then restored from the cache.
+    """
+    preview = HTMLPreview(content, lead)
+    cache = get_cache_backend()
+    data = cache.get(preview.cache_key)
+    if data is None:
+        cache.set(preview.cache_key, preview.dump())
+    else:
+        preview.load(data)
+    return preview
@@ -15,6 +15,9 @@ TRANSLATED_URLS = getattr(settings, 'ZINNIA_TRANSLATED_URLS', False)
 COPYRIGHT = getattr(settings, 'ZINNIA_COPYRIGHT', 'Zinnia')
 
 PAGINATION = getattr(settings, 'ZINNIA_PAGINATION', 10)
+PAGINATION_MODE = getattr(settings, 'ZINNIA_PAGINATION_MODE', 'offset')
+PAGINATION_COUNT_THRESHOLD = getattr(
+    settings, 'ZINNIA_PAGINATION_COUNT_THRESHOLD', None)
 ALLOW_EMPTY = getattr(settings, 'ZINNIA_ALLOW_EMPTY', True)
 ALLOW_FUTURE = getattr(settings, 'ZINNIA_ALLOW_FUTURE', True)
 
@@ -36,6 +39,8 @@ MARKDOWN_EXTENSIONS = getattr(settings, 'ZINNIA_MARKDOWN_EXTENSIONS', [])
 RESTRUCTUREDTEXT_SETTINGS = getattr(
     settings, 'ZINNIA_RESTRUCTUREDTEXT_SETTINGS', {})
 
+MARKUP_CACHE_TIMEOUT = getattr(settings, 'ZINNIA_MARKUP_CACHE_TIMEOUT', None)
+
 PREVIEW_SPLITTERS = getattr(settings, 'ZINNIA_PREVIEW_SPLITTERS',
                             ['<!-- more -->', '<!--more-->'])
 
@@ -63,12 +68,16 @@ MAIL_COMMENT_NOTIFICATION_RECIPIENTS = getattr(
     settings, 'ZINNIA_MAIL_COMMENT_NOTIFICATION_RECIPIENTS',
     [manager_tuple[1] for manager_tuple in settings.MANAGERS])
 
+MAIL_COMMENT_QUEUE = getattr(settings, 'ZINNIA_MAIL_COMMENT_QUEUE', False)
+
 COMMENT_MIN_WORDS = getattr(settings, 'ZINNIA_COMMENT_MIN_WORDS', 4)
 
 COMMENT_FLAG_USER_ID = getattr(settings, 'ZINNIA_COMMENT_FLAG_USER_ID', 1)
 
 UPLOAD_TO = getattr(settings, 'ZINNIA_UPLOAD_TO', 'uploads/zinnia')
 
+ADMIN_M2M_SIGNALS = getattr(settings, 'ZINNIA_ADMIN_M2M_SIGNALS', True)
+
 PROTOCOL = getattr(settings, 'ZINNIA_PROTOCOL', 'http')
 
 FEEDS_FORMAT = getattr(settings, 'ZINNIA_FEEDS_FORMAT', 'rss')
@@ -77,6 +86,9 @@ FEEDS_MAX_ITEMS = getattr(settings, 'ZINNIA_FEEDS_MAX_ITEMS', 15)
 PINGBACK_CONTENT_LENGTH = getattr(settings,
                                   'ZINNIA_PINGBACK_CONTENT_LENGTH', 300)
 
+XMLRPC_AUTH_CACHE_TIMEOUT = getattr(settings,
+                                    'ZINNIA_XMLRPC_AUTH_CACHE_TIMEOUT', 60)
+
 SEARCH_FIELDS = getattr(settings, 'ZINNIA_SEARCH_FIELDS',
                         ['title', 'lead', 'content',
                          'excerpt', 'image_caption', 'tags'])
@@ -87,8 +99,29 @@ COMPARISON_FIELDS = getattr(settings, 'ZINNIA_COMPARISON_FIELDS',
 
 SPAM_CHECKER_BACKENDS = getattr(settings, 'ZINNIA_SPAM_CHECKER_BACKENDS',
                                 [])
+SPAM_CHECKER_TIMEOUT = getattr(settings, 'ZINNIA_SPAM_CHECKER_TIMEOUT', 5)
+SPAM_CHECKER_MAX_WORKERS = getattr(settings,
+                                   'ZINNIA_SPAM_CHECKER_MAX_WORKERS', 4)
+SPAM_CHECKER_CACHE_TIMEOUT = getattr(settings,
+                                     'ZINNIA_SPAM_CHECKER_CACHE_TIMEOUT',
+                                     60 * 60)
+
+SPAM_CLASSIFIER_THRESHOLD = getattr(settings,
+                                    'ZINNIA_SPAM_CLASSIFIER_THRESHOLD', 0.9)
+SPAM_CLASSIFIER_MIN_TRAINING = getattr(
+    settings, 'ZINNIA_SPAM_CLASSIFIER_MIN_TRAINING', 10)
 
 URL_SHORTENER_BACKEND = getattr(settings, 'ZINNIA_URL_SHORTENER_BACKEND',
                                 'zinnia.url_shortener.backends.default')
 
+INSTRUMENTATION = getattr(settings, 'ZINNIA_INSTRUMENTATION', False)
+
+METRICS_BACKENDS = getattr(settings, 'ZINNIA_METRICS_BACKENDS',
+                           ['zinnia.metrics.backends.logger'])
+METRICS_STATSD_HOST = getattr(settings, 'ZINNIA_METRICS_STATSD_HOST',
+                              'localhost')
+METRICS_STATSD_PORT = getattr(settings, 'ZINNIA_METRICS_STATSD_PORT', 8125)
+METRICS_STATSD_PREFIX = getattr(settings, 'ZINNIA_METRICS_STATSD_PREFIX',
+                                'zinnia')
+
 STOP_WORDS = stop_words(settings.LANGUAGE_CODE.split('-')[0])
@@ -1,19 +1,27 @@
 """Signal handlers of Zinnia"""
-import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 
+from django.contrib.contenttypes.models import ContentType
 from django.db.models import F
+from django.db.models.signals import m2m_changed
 from django.db.models.signals import post_delete
 from django.db.models.signals import post_save
 from django.dispatch import Signal
 
 import django_comments as comments
+from django_comments.models import CommentFlag
 from django_comments.signals import comment_was_flagged
 from django_comments.signals import comment_was_posted
 
 from zinnia import settings
+from zinnia.archives import flush_archive_index
 from zinnia.comparison import EntryPublishedVectorBuilder
+from zinnia.discussions import flush_discussion_lists
+from zinnia.models.category import Category
 from zinnia.models.entry import Entry
+from zinnia.paginator import flush_cached_counts
 from zinnia.ping import DirectoryPinger
 from zinnia.ping import ExternalUrlsPinger
 
@@ -22,28 +30,91 @@ ENTRY_PS_PING_DIRECTORIES = 'zinnia.entry.post_save.ping_directories'
 ENTRY_PS_PING_EXTERNAL_URLS = 'zinnia.entry.post_save.ping_external_urls'
 ENTRY_PS_FLUSH_SIMILAR_CACHE = 'zinnia.entry.post_save.flush_similar_cache'
 ENTRY_PD_FLUSH_SIMILAR_CACHE = 'zinnia.entry.post_delete.flush_similar_cache'
+ENTRY_WU_FLUSH_SIMILAR_CACHE = 'zinnia.entry.were_updated.flush_similar_cache'
+ENTRY_PS_FLUSH_ARCHIVE_INDEX = 'zinnia.entry.post_save.flush_archive_index'
+ENTRY_PD_FLUSH_ARCHIVE_INDEX = 'zinnia.entry.post_delete.flush_archive_index'
+ENTRY_SC_FLUSH_ARCHIVE_INDEX = 'zinnia.entry.sites_changed.flush_archive_index'
+ENTRY_WU_FLUSH_ARCHIVE_INDEX = 'zinnia.entry.were_updated.flush_archive_index'
+ENTRY_PS_FLUSH_CACHED_COUNTS = 'zinnia.entry.post_save.flush_cached_counts'
+ENTRY_PD_FLUSH_CACHED_COUNTS = 'zinnia.entry.post_delete.flush_cached_counts'
+ENTRY_SC_FLUSH_CACHED_COUNTS = 'zinnia.entry.sites_changed.flush_cached_counts'
+ENTRY_CC_FLUSH_CACHED_COUNTS = \
+    'zinnia.entry.categories_changed.flush_cached_counts'
+ENTRY_AC_FLUSH_CACHED_COUNTS = \
+    'zinnia.entry.authors_changed.flush_cached_counts'
+ENTRY_WU_FLUSH_CACHED_COUNTS = 'zinnia.entry.were_updated.flush_cached_counts'
+CATEGORY_PS_FLUSH_CACHED_COUNTS = \
+    'zinnia.category.post_save.flush_cached_counts'
+CATEGORY_PD_FLUSH_CACHED_COUNTS = \
+    'zinnia.category.post_delete.flush_cached_counts'
 COMMENT_PS_COUNT_DISCUSSIONS = 'zinnia.comment.post_save.count_discussions'
 COMMENT_PD_COUNT_DISCUSSIONS = 'zinnia.comment.post_delete.count_discussions'
 COMMENT_WF_COUNT_DISCUSSIONS = 'zinnia.comment.was_flagged.count_discussions'
+COMMENT_WF_TRAIN_SPAM_CLASSIFIER = \
+    'zinnia.comment.was_flagged.train_spam_classifier'
 COMMENT_WP_COUNT_COMMENTS = 'zinnia.comment.was_posted.count_comments'
 PINGBACK_WF_COUNT_PINGBACKS = 'zinnia.pingback.was_flagged.count_pingbacks'
 TRACKBACK_WF_COUNT_TRACKBACKS = 'zinnia.trackback.was_flagged.count_trackbacks'
-
+COMMENT_PS_FLUSH_DISCUSSIONS = 'zinnia.comment.post_save.flush_discussions'
+COMMENT_PD_FLUSH_DISCUSSIONS = 'zinnia.comment.post_delete.flush_discussions'
+COMMENT_WF_FLUSH_DISCUSSIONS = 'zinnia.comment.was_flagged.flush_discussions'
+PINGBACK_WP_FLUSH_DISCUSSIONS = 'zinnia.pingback.was_posted.flush_discussions'
+TRACKBACK_WP_FLUSH_DISCUSSIONS = \
+    'zinnia.trackback.was_posted.flush_discussions'
+
+NAIVE_BAYES_BACKEND = 'zinnia.spam_checker.backends.naive_bayes'
+
+PUBLICATION_FIELDS = set(['status', 'publication_date', 'sites',
+                          'start_publication', 'end_publication'])
+SIMILAR_CACHE_FIELDS = PUBLICATION_FIELDS | set(settings.COMPARISON_FIELDS)
+ARCHIVE_INDEX_FIELDS = PUBLICATION_FIELDS
+CACHED_COUNT_FIELDS = ARCHIVE_INDEX_FIELDS | set([
+    'categories', 'authors', 'tags', 'title', 'lead', 'content', 'excerpt'])
+
+signals_suppressed = ContextVar('zinnia_signals_suppressed', default=False)
+
+entries_were_updated = Signal(providing_args=['entries', 'fields',
+                                              'request'])
 pingback_was_posted = Signal(providing_args=['pingback', 'entry'])
 trackback_was_posted = Signal(providing_args=['trackback', 'entry'])
 
 
+@contextmanager
+def suppress_signals():
+    """
+    Context manager, also usable as a decorator, disabling
+    the expensive handlers of the signals for bulk operations.
+
+    The handlers flushing the caches are disabled too,
+    so flush_entry_caches() has to be called once done.
+    """
+    token = signals_suppressed.set(True)
+    try:
+        yield
+    finally:
+        signals_suppressed.reset(token)
+
+
+def flush_entry_caches():
+    """
+    Flush the caches built from the entries,
+    after a bulk operation within suppress_signals().
+    """
+    EntryPublishedVectorBuilder().cache_flush()
+    flush_archive_index()
+    flush_cached_counts()
+
+
 def disable_for_loaddata(signal_handler):
     """
     Decorator for disabling signals sent by 'post_save'
-    on loaddata command.
+    on loaddata command, or within suppress_signals().
     http://code.djangoproject.com/ticket/8399
     """
     @wraps(signal_handler)
     def wrapper(*args, **kwargs):
-        for fr in inspect.stack():
-            if inspect.getmodulename(fr[1]) == 'loaddata':
-                return  # pragma: no cover
+        if kwargs.get('raw') or signals_suppressed.get():
+            return
         signal_handler(*args, **kwargs)
 
     return wrapper
@@ -82,6 +153,47 @@ def flush_similar_cache_handler(sender, **kwargs):
         EntryPublishedVectorBuilder().cache_flush()
 
 
+def flush_similar_cache_entries_handler(sender, **kwargs):
+    """
+    Flush the cache of similar entries related to
+    the entries updated in bulk, or the whole cache if
+    the published entries compared may have changed.
+    """
+    fields = kwargs['fields']
+    if PUBLICATION_FIELDS.intersection(fields):
+        EntryPublishedVectorBuilder().cache_flush()
+    elif SIMILAR_CACHE_FIELDS.intersection(fields):
+        EntryPublishedVectorBuilder().cache_flush_objects(kwargs['entries'])
+
+
+@disable_for_loaddata
+def flush_archive_index_handler(sender, **kwargs):
+    """
+    Flush the archive index when the publication
+    of an entry may have changed.
+    """
+    if kwargs.get('action', '').startswith('pre_'):
+        return
+    fields = kwargs.get('update_fields') or kwargs.get('fields')
+    if fields and not ARCHIVE_INDEX_FIELDS.intersection(fields):
+        return
+    flush_archive_index()
+
+
+@disable_for_loaddata
+def flush_cached_counts_handler(sender, **kwargs):
+    """
+    Flush the cached counts of the paginated entries
+    when the entries listed by the views may have changed.
+    """
+    if kwargs.get('action', '').startswith('pre_'):
+        return
+    fields = kwargs.get('update_fields') or kwargs.get('fields')
+    if fields and not CACHED_COUNT_FIELDS.intersection(fields):
+        return
+    flush_cached_counts()
+
+
 def count_discussions_handler(sender, **kwargs):
     """
     Update the count of each type of discussion on an entry.
@@ -132,6 +244,41 @@ def count_trackbacks_handler(sender, **kwargs):
     entry.save(update_fields=['trackback_count'])
 
 
+@disable_for_loaddata
+def flush_discussions_handler(sender, **kwargs):
+    """
+    Flush the cached discussion lists of the entry
+    of a discussion saved, deleted, flagged or posted.
+    """
+    if 'entry' in kwargs:
+        flush_discussion_lists(kwargs['entry'].pk)
+        return
+
+    comment = 'comment' in kwargs and kwargs['comment'] or kwargs['instance']
+    if comment.content_type_id == ContentType.objects.get_for_model(
+            Entry).pk:
+        flush_discussion_lists(comment.object_pk)
+
+
+def train_spam_classifier_handler(sender, **kwargs):
+    """
+    Train the naive Bayes spam classifier, if used,
+    when a moderator approves or removes a comment.
+    """
+    if NAIVE_BAYES_BACKEND not in settings.SPAM_CHECKER_BACKENDS:
+        return
+
+    flag = kwargs['flag']
+    if not kwargs.get('created') or flag.flag not in (
+            CommentFlag.MODERATOR_APPROVAL,
+            CommentFlag.MODERATOR_DELETION):
+        return
+
+    from zinnia.spam_checker.backends import naive_bayes
+    naive_bayes.train(kwargs['comment'],
+                      flag.flag == CommentFlag.MODERATOR_DELETION)
+
+
 def connect_entry_signals():
     """
     Connect all the signals on Entry model.
@@ -148,6 +295,45 @@ def connect_entry_signals():
     post_delete.connect(
         flush_similar_cache_handler, sender=Entry,
         dispatch_uid=ENTRY_PD_FLUSH_SIMILAR_CACHE)
+    entries_were_updated.connect(
+        flush_similar_cache_entries_handler, sender=Entry,
+        dispatch_uid=ENTRY_WU_FLUSH_SIMILAR_CACHE)
+    post_save.connect(
+        flush_archive_index_handler, sender=Entry,
+        dispatch_uid=ENTRY_PS_FLUSH_ARCHIVE_INDEX)
+    post_delete.connect(
+        flush_archive_index_handler, sender=Entry,
+        dispatch_uid=ENTRY_PD_FLUSH_ARCHIVE_INDEX)
+    m2m_changed.connect(
+        flush_archive_index_handler, sender=Entry.sites.through,
+        dispatch_uid=ENTRY_SC_FLUSH_ARCHIVE_INDEX)
+    entries_were_updated.connect(
+        flush_archive_index_handler, sender=Entry,
+        dispatch_uid=ENTRY_WU_FLUSH_ARCHIVE_INDEX)
+    post_save.connect(
+        flush_cached_counts_handler, sender=Entry,
+        dispatch_uid=ENTRY_PS_FLUSH_CACHED_COUNTS)
+    post_delete.connect(
+        flush_cached_counts_handler, sender=Entry,
+        dispatch_uid=ENTRY_PD_FLUSH_CACHED_COUNTS)
+    m2m_changed.connect(
+        flush_cached_counts_handler, sender=Entry.sites.through,
+        dispatch_uid=ENTRY_SC_FLUSH_CACHED_COUNTS)
+    m2m_changed.connect(
+        flush_cached_counts_handler, sender=Entry.categories.through,
+        dispatch_uid=ENTRY_CC_FLUSH_CACHED_COUNTS)
+    m2m_changed.connect(
+        flush_cached_counts_handler, sender=Entry.authors.through,
+        dispatch_uid=ENTRY_AC_FLUSH_CACHED_COUNTS)
+    entries_were_updated.connect(
+        flush_cached_counts_handler, sender=Entry,
+        dispatch_uid=ENTRY_WU_FLUSH_CACHED_COUNTS)
+    post_save.connect(
+        flush_cached_counts_handler, sender=Category,
+        dispatch_uid=CATEGORY_PS_FLUSH_CACHED_COUNTS)
+    post_delete.connect(
+        flush_cached_counts_handler, sender=Category,
+        dispatch_uid=CATEGORY_PD_FLUSH_CACHED_COUNTS)
 
 
 def disconnect_entry_signals():
@@ -166,6 +352,45 @@ def disconnect_entry_signals():
     post_delete.disconnect(
         sender=Entry,
         dispatch_uid=ENTRY_PD_FLUSH_SIMILAR_CACHE)
+    entries_were_updated.disconnect(
+        sender=Entry,
+        dispatch_uid=ENTRY_WU_FLUSH_SIMILAR_CACHE)
+    post_save.disconnect(
+        sender=Entry,
+        dispatch_uid=ENTRY_PS_FLUSH_ARCHIVE_INDEX)
+    post_delete.disconnect(
+        sender=Entry,
+        dispatch_uid=ENTRY_PD_FLUSH_ARCHIVE_INDEX)
+    m2m_changed.disconnect(
+        sender=Entry.sites.through,
+        dispatch_uid=ENTRY_SC_FLUSH_ARCHIVE_INDEX)
+    entries_were_updated.disconnect(
+        sender=Entry,
+        dispatch_uid=ENTRY_WU_FLUSH_ARCHIVE_INDEX)
+    post_save.disconnect(
+        sender=Entry,
+        dispatch_uid=ENTRY_PS_FLUSH_CACHED_COUNTS)
+    post_delete.disconnect(
+        sender=Entry,
+        dispatch_uid=ENTRY_PD_FLUSH_CACHED_COUNTS)
+    m2m_changed.disconnect(
+        sender=Entry.sites.through,
+        dispatch_uid=ENTRY_SC_FLUSH_CACHED_COUNTS)
+    m2m_changed.disconnect(
+        sender=Entry.categories.through,
+        dispatch_uid=ENTRY_CC_FLUSH_CACHED_COUNTS)
+    m2m_changed.disconnect(
+        sender=Entry.authors.through,
+        dispatch_uid=ENTRY_AC_FLUSH_CACHED_COUNTS)
+    entries_were_updated.disconnect(
+        sender=Entry,
+        dispatch_uid=ENTRY_WU_FLUSH_CACHED_COUNTS)
+    post_save.disconnect(
+        sender=Category,
+        dispatch_uid=CATEGORY_PS_FLUSH_CACHED_COUNTS)
+    post_delete.disconnect(
+        sender=Category,
+        dispatch_uid=CATEGORY_PD_FLUSH_CACHED_COUNTS)
 
 
 def connect_discussion_signals():
@@ -183,6 +408,9 @@ def connect_discussion_signals():
     comment_was_flagged.connect(
         count_discussions_handler, sender=comment_model,
         dispatch_uid=COMMENT_WF_COUNT_DISCUSSIONS)
+    comment_was_flagged.connect(
+        train_spam_classifier_handler, sender=comment_model,
+        dispatch_uid=COMMENT_WF_TRAIN_SPAM_CLASSIFIER)
     comment_was_posted.connect(
         count_comments_handler, sender=comment_model,
         dispatch_uid=COMMENT_WP_COUNT_COMMENTS)
@@ -192,6 +420,21 @@ def connect_discussion_signals():
     trackback_was_posted.connect(
         count_trackbacks_handler, sender=comment_model,
         dispatch_uid=TRACKBACK_WF_COUNT_TRACKBACKS)
+    post_save.connect(
+        flush_discussions_handler, sender=comment_model,
+        dispatch_uid=COMMENT_PS_FLUSH_DISCUSSIONS)
+    post_delete.connect(
+        flush_discussions_handler, sender=comment_model,
+        dispatch_uid=COMMENT_PD_FLUSH_DISCUSSIONS)
+    comment_was_flagged.connect(
+        flush_discussions_handler, sender=comment_model,
+        dispatch_uid=COMMENT_WF_FLUSH_DISCUSSIONS)
+    pingback_was_posted.connect(
+        flush_discussions_handler, sender=comment_model,
+        dispatch_uid=PINGBACK_WP_FLUSH_DISCUSSIONS)
+    trackback_was_posted.connect(
+        flush_discussions_handler, sender=comment_model,
+        dispatch_uid=TRACKBACK_WP_FLUSH_DISCUSSIONS)
 
 
 def disconnect_discussion_signals():
@@ -208,6 +451,9 @@ def disconnect_discussion_signals():
     comment_was_flagged.disconnect(
         sender=comment_model,
         dispatch_uid=COMMENT_WF_COUNT_DISCUSSIONS)
+    comment_was_flagged.disconnect(
+        sender=comment_model,
+        dispatch_uid=COMMENT_WF_TRAIN_SPAM_CLASSIFIER)
     comment_was_posted.disconnect(
         sender=comment_model,
         dispatch_uid=COMMENT_WP_COUNT_COMMENTS)
@@ -217,3 +463,18 @@ def disconnect_discussion_signals():
     trackback_was_posted.disconnect(
         sender=comment_model,
         dispatch_uid=TRACKBACK_WF_COUNT_TRACKBACKS)
+    post_save.disconnect(
+        sender=comment_model,
+        dispatch_uid=COMMENT_PS_FLUSH_DISCUSSIONS)
+    post_delete.disconnect(
+        sender=comment_model,
+        dispatch_uid=COMMENT_PD_FLUSH_DISCUSSIONS)
+    comment_was_flagged.disconnect(
+        sender=comment_model,
+        dispatch_uid=COMMENT_WF_FLUSH_DISCUSSIONS)
+    pingback_was_posted.disconnect(
+        sender=comment_model,
+        dispatch_uid=PINGBACK_WP_FLUSH_DISCUSSIONS)
+    trackback_was_posted.disconnect(
+        sender=comment_model,
+        dispatch_uid=TRACKBACK_WP_FLUSH_DISCUSSIONS)
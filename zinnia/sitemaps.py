@@ -1,7 +1,5 @@
 """Sitemaps for Zinnia"""
 from django.contrib.sitemaps import Sitemap
-from django.db.models import Count
-from django.db.models import Max
 from django.urls import reverse
 
 from tagging.models import Tag
@@ -63,9 +61,10 @@ class EntryRelatedSitemap(ZinniaSitemap):
         Build a queryset of items with published entries and annotated
         with the number of entries and the latest modification date.
         """
-        return self.model.published.annotate(
-            count_entries_published=Count('entries')).annotate(
-            last_update=Max('entries__last_update')).order_by(
+        published = self.model.published
+        return published.with_count_entries_published().annotate(
+            last_update=published.entries_published_aggregate(
+                'MAX', 'last_update')).order_by(
             '-count_entries_published', '-last_update', '-pk')
 
     def cache_infos(self, queryset):
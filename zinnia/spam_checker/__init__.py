@@ -1,10 +1,33 @@
 """Spam checker for Zinnia"""
+import time
 import warnings
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from functools import lru_cache
+from hashlib import sha1
 from importlib import import_module
+from logging import getLogger
+from threading import Lock
 
+from django.core.cache import InvalidCacheBackendError
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.utils.encoding import force_bytes
 
+from zinnia.instrumentation import instrument_cache
 from zinnia.settings import SPAM_CHECKER_BACKENDS
+from zinnia.settings import SPAM_CHECKER_CACHE_TIMEOUT
+from zinnia.settings import SPAM_CHECKER_MAX_WORKERS
+from zinnia.settings import SPAM_CHECKER_TIMEOUT
+
+SPAM_CHECKER_CACHE_PREFIX = 'zinnia:spam_checker'
+
+_executor = None
+_executor_lock = Lock()
+_statistics = {}
+_statistics_lock = Lock()
 
 
 def get_spam_checker(backend_path):
@@ -25,19 +48,224 @@ def get_spam_checker(backend_path):
     return backend
 
 
+@lru_cache()
+def get_spam_checkers(backends):
+    """
+    Resolve once a tuple of backend paths into two tuples
+    of (backend_path, backend) pairs, the local checkers
+    and the remote checkers.
+
+    A backend module is considered as local if it
+    defines ``LOCAL = True``.
+    """
+    local_checkers = []
+    remote_checkers = []
+    for backend_path in backends:
+        spam_checker = get_spam_checker(backend_path)
+        if spam_checker is None:
+            continue
+        if getattr(import_module(backend_path), 'LOCAL', False):
+            local_checkers.append((backend_path, spam_checker))
+        else:
+            remote_checkers.append((backend_path, spam_checker))
+    return tuple(local_checkers), tuple(remote_checkers)
+
+
+def get_executor():
+    """
+    Return the thread pool shared by the remote spam checkers.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=SPAM_CHECKER_MAX_WORKERS)
+    return _executor
+
+
+def record_statistics(backend_path, verdict, duration=None):
+    """
+    Update the counters of a backend,
+    ``verdict`` is True, False, None if the check failed,
+    or ``'timeout'`` if the result has not been awaited.
+    """
+    with _statistics_lock:
+        stats = _statistics.setdefault(backend_path, {
+            'calls': 0, 'spams': 0, 'hams': 0,
+            'failures': 0, 'timeouts': 0, 'total_time': 0.0})
+        if verdict == 'timeout':
+            stats['timeouts'] += 1
+            return
+        stats['calls'] += 1
+        stats['total_time'] += duration
+        if verdict is None:
+            stats['failures'] += 1
+        elif verdict:
+            stats['spams'] += 1
+        else:
+            stats['hams'] += 1
+
+
+def get_statistics():
+    """
+    Return a copy of the counters of each backend,
+    with the average latency in seconds.
+    """
+    with _statistics_lock:
+        statistics = {}
+        for backend_path, stats in _statistics.items():
+            stats = dict(stats)
+            stats['average_time'] = (stats['calls'] and
+                                     stats['total_time'] / stats['calls'])
+            statistics[backend_path] = stats
+    return statistics
+
+
+def reset_statistics():
+    """
+    Reset the counters of all the backends.
+    """
+    with _statistics_lock:
+        _statistics.clear()
+
+
+def run_spam_checker(backend_path, spam_checker,
+                     content, content_object, request):
+    """
+    Run a spam checker and record its latency and verdict.
+    """
+    start = time.perf_counter()
+    try:
+        is_spam = bool(spam_checker(content, content_object, request))
+    except Exception:
+        record_statistics(backend_path, None, time.perf_counter() - start)
+        raise
+    record_statistics(backend_path, is_spam, time.perf_counter() - start)
+    return is_spam
+
+
+def run_remote_spam_checker(backend_path, spam_checker,
+                            content, content_object, request):
+    """
+    Run a spam checker inside a worker thread,
+    and close the database connections opened by the thread.
+    """
+    try:
+        return run_spam_checker(backend_path, spam_checker,
+                                content, content_object, request)
+    finally:
+        connections.close_all()
+
+
+def check_remote_spam_checkers(remote_checkers, content,
+                               content_object, request):
+    """
+    Run concurrently the remote spam checkers and return
+    as soon as one of them find a spam.
+    Return None if a checker has failed or timed out
+    and no spam has been found.
+    """
+    logger = getLogger('zinnia.spam_checker')
+    executor = get_executor()
+    futures = {}
+    for backend_path, spam_checker in remote_checkers:
+        future = executor.submit(run_remote_spam_checker,
+                                 backend_path, spam_checker,
+                                 content, content_object, request)
+        futures[future] = backend_path
+
+    result = False
+    pending = set(futures)
+    deadline = time.perf_counter() + SPAM_CHECKER_TIMEOUT
+    while pending:
+        done, pending = wait(pending,
+                             timeout=max(deadline - time.perf_counter(), 0),
+                             return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            try:
+                if future.result():
+                    for other in pending:
+                        other.cancel()
+                    return True
+            except Exception:
+                logger.exception('%s has failed', futures[future])
+                result = None
+
+    for future in pending:
+        future.cancel()
+        logger.warning('%s has timed out', futures[future])
+        record_statistics(futures[future], 'timeout')
+        result = None
+    return result
+
+
+def get_cache_backend():
+    """
+    Try to access to ``spam_checker`` cache value,
+    if fail use the ``default`` cache backend config.
+    """
+    try:
+        spam_checker_cache = caches['spam_checker']
+    except InvalidCacheBackendError:
+        spam_checker_cache = caches['default']
+    return instrument_cache(spam_checker_cache)
+
+
+def get_cache_key(content, content_object, backends):
+    """
+    Build the cache key of a verdict, by hashing the backends used,
+    the object commented and the submitted fields of the content.
+    """
+    parts = list(backends) + [
+        '%s.%s' % (content_object.__class__.__name__,
+                   getattr(content_object, 'pk', ''))]
+    for field in ('user_name', 'user_email', 'user_url',
+                  'ip_address', 'comment'):
+        parts.append(str(getattr(content, field, '') or ''))
+    return '%s:%s' % (SPAM_CHECKER_CACHE_PREFIX,
+                      sha1(force_bytes('\x00'.join(parts))).hexdigest())
+
+
 def check_is_spam(content, content_object, request,
                   backends=None):
     """
     Return True if the content is a spam, else False.
+
+    The local backends are run first, then the remote
+    backends are run concurrently with a timeout.
+    The verdicts are cached to skip repeated submissions.
     """
     if backends is None:
         backends = SPAM_CHECKER_BACKENDS
 
-    for backend_path in backends:
-        spam_checker = get_spam_checker(backend_path)
-        if spam_checker is not None:
-            is_spam = spam_checker(content, content_object, request)
-            if is_spam:
-                return True
+    backends = tuple(backends)
+    if not backends:
+        return False
+
+    cache = get_cache_backend()
+    cache_key = get_cache_key(content, content_object, backends)
+    if SPAM_CHECKER_CACHE_TIMEOUT:
+        is_spam = cache.get(cache_key)
+        if is_spam is not None:
+            return is_spam
+
+    local_checkers, remote_checkers = get_spam_checkers(backends)
+    is_spam = False
+    for backend_path, spam_checker in local_checkers:
+        if run_spam_checker(backend_path, spam_checker,
+                            content, content_object, request):
+            is_spam = True
+            break
+
+    if not is_spam and remote_checkers:
+        is_spam = check_remote_spam_checkers(
+            remote_checkers, content, content_object, request)
+        if is_spam is None:
+            # A checker has not answered, the verdict is not cached
+            return False
 
-    return False
+    if SPAM_CHECKER_CACHE_TIMEOUT:
+        cache.set(cache_key, is_spam, SPAM_CHECKER_CACHE_TIMEOUT)
+    return is_spam
@@ -1,5 +1,7 @@
 """All is spam, spam checker backend for Zinnia"""
 
+LOCAL = True
+
 
 def backend(*ka):
     """
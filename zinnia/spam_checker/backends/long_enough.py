@@ -1,6 +1,8 @@
 """Long enough spam checker backend for Zinnia"""
 from zinnia.settings import COMMENT_MIN_WORDS
 
+LOCAL = True
+
 
 def backend(comment, content_object, request):
     """
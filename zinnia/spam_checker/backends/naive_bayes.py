@@ -0,0 +1,192 @@
+"""Naive Bayes spam checker backend for Zinnia"""
+import uuid
+from collections import defaultdict
+from math import exp
+from math import log
+
+from django.db import transaction
+from django.db.models import F
+from django.utils.crypto import salted_hmac
+
+import regex as re
+
+from zinnia.models.spam import SpamToken
+from zinnia.settings import SPAM_CLASSIFIER_MIN_TRAINING
+from zinnia.settings import SPAM_CLASSIFIER_THRESHOLD
+from zinnia.spam_checker import get_cache_backend
+
+LOCAL = True
+
+TOKENS = re.compile(r'[\p{L}\p{N}_$@.-]{2,40}')
+
+TOTAL_TOKEN = ':total'
+
+BATCH_SIZE = 500
+
+CLASSIFIER_GENERATION_CACHE_KEY = 'zinnia:naive_bayes_generation'
+
+LOADED_CLASSIFIER = {'generation': None, 'classifier': None}
+
+
+def tokenize(comment):
+    """
+    Return the set of tokens found in a comment,
+    the author's fields are prefixed to be counted apart
+    and hashed to store no personal data.
+    """
+    tokens = set(TOKENS.findall(str(comment.comment).lower()))
+    for field in ('user_name', 'user_url', 'user_email'):
+        value = getattr(comment, field, '')
+        if value:
+            tokens.add('%s:%s' % (field, salted_hmac(
+                'zinnia.spam_checker.naive_bayes',
+                value.lower()).hexdigest()))
+    return tokens
+
+
+class NaiveBayesClassifier(object):
+    """
+    Naive Bayes classifier over the presence of tokens,
+    the statistics are stored as {token: [spam count, ham count]}.
+    """
+
+    def __init__(self, tokens=None, spams=0, hams=0):
+        self.tokens = tokens or {}
+        self.spams = spams
+        self.hams = hams
+
+    def train(self, tokens, is_spam):
+        """
+        Count the tokens of a spam or a ham.
+        """
+        index = 0 if is_spam else 1
+        for token in tokens:
+            self.tokens.setdefault(token, [0, 0])[index] += 1
+        if is_spam:
+            self.spams += 1
+        else:
+            self.hams += 1
+
+    @property
+    def is_trained(self):
+        """
+        Check if enough spams and hams have been counted
+        to classify a content.
+        """
+        return (self.spams >= SPAM_CLASSIFIER_MIN_TRAINING and
+                self.hams >= SPAM_CLASSIFIER_MIN_TRAINING)
+
+    def spam_probability(self, tokens):
+        """
+        Return the probability of the tokens to be a spam,
+        with Laplace smoothing on the counts.
+        """
+        spams = self.spams + 2.0
+        hams = self.hams + 2.0
+        score = log(spams / hams)
+        for token in tokens:
+            counts = self.tokens.get(token)
+            if counts is not None:
+                score += (log((counts[0] + 1) / spams) -
+                          log((counts[1] + 1) / hams))
+        if score > 0:
+            return 1.0 / (1.0 + exp(-score))
+        return exp(score) / (1.0 + exp(score))
+
+    def is_spam(self, tokens, threshold=SPAM_CLASSIFIER_THRESHOLD):
+        """
+        Classify the tokens as spam or ham.
+        """
+        if not self.is_trained:
+            return False
+        return self.spam_probability(tokens) >= threshold
+
+    def prune(self, min_count=2):
+        """
+        Remove the rare tokens to keep the statistics compact.
+        """
+        self.tokens = dict((token, counts)
+                           for token, counts in self.tokens.items()
+                           if sum(counts) >= min_count)
+
+
+def load_classifier(tokens=None):
+    """
+    Return a classifier with the statistics of the tokens,
+    or of all the tokens if omitted, and the numbers
+    of spams and hams stored in the database.
+    """
+    queryset = SpamToken.objects.all()
+    if tokens is not None:
+        queryset = queryset.filter(token__in=set(tokens) | {TOTAL_TOKEN})
+    statistics = dict(
+        (token, [spams, hams]) for token, spams, hams in
+        queryset.values_list('token', 'spams', 'hams'))
+    spams, hams = statistics.pop(TOTAL_TOKEN, [0, 0])
+    return NaiveBayesClassifier(statistics, spams, hams)
+
+
+def save_classifier(classifier):
+    """
+    Add the statistics of a classifier to the database,
+    the counts being incremented by atomic updates
+    to not lose the trainings done concurrently.
+    """
+    increments = {TOTAL_TOKEN: [classifier.spams, classifier.hams]}
+    increments.update(classifier.tokens)
+    tokens_by_increment = defaultdict(list)
+    for token, counts in increments.items():
+        tokens_by_increment[tuple(counts)].append(token)
+
+    with transaction.atomic():
+        SpamToken.objects.bulk_create(
+            [SpamToken(token=token) for token in increments],
+            batch_size=BATCH_SIZE, ignore_conflicts=True)
+        for (spams, hams), tokens in tokens_by_increment.items():
+            for i in range(0, len(tokens), BATCH_SIZE):
+                SpamToken.objects.filter(
+                    token__in=tokens[i:i + BATCH_SIZE]).update(
+                    spams=F('spams') + spams, hams=F('hams') + hams)
+    flush_classifier()
+
+
+def flush_classifier():
+    """
+    Invalidate the classifiers loaded by the processes
+    by starting a new generation of the statistics.
+    """
+    generation = uuid.uuid4().hex
+    get_cache_backend().set(CLASSIFIER_GENERATION_CACHE_KEY, generation, None)
+    return generation
+
+
+def get_classifier():
+    """
+    Return the classifier with all the statistics stored in the
+    database, loaded once by process and reloaded when a new
+    generation of the statistics has been started by a training.
+    """
+    generation = get_cache_backend().get(CLASSIFIER_GENERATION_CACHE_KEY)
+    if generation is None:
+        generation = flush_classifier()
+    if LOADED_CLASSIFIER['generation'] != generation:
+        LOADED_CLASSIFIER['classifier'] = load_classifier()
+        LOADED_CLASSIFIER['generation'] = generation
+    return LOADED_CLASSIFIER['classifier']
+
+
+def train(comment, is_spam):
+    """
+    Train incrementally the classifier with a comment.
+    """
+    classifier = NaiveBayesClassifier()
+    classifier.train(tokenize(comment), is_spam)
+    save_classifier(classifier)
+
+
+def backend(comment, content_object, request):
+    """
+    Backend classifying the comment with the statistics
+    learned on the comments previously moderated.
+    """
+    return get_classifier().is_spam(tokenize(comment))
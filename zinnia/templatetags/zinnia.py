@@ -11,7 +11,6 @@ from django.db.models import Count
 from django.db.models import Q
 from django.template import Library
 from django.template.defaultfilters import stringfilter
-from django.template.loader import select_template
 from django.utils import timezone
 from django.utils.encoding import smart_str
 from django.utils.html import conditional_escape
@@ -23,6 +22,7 @@ from django_comments.models import CommentFlag
 from tagging.models import Tag
 from tagging.utils import calculate_cloud
 
+from ..archives import get_archive_index
 from ..breadcrumbs import retrieve_breadcrumbs
 from ..calendar import Calendar
 from ..comparison import EntryPublishedVectorBuilder
@@ -30,6 +30,7 @@ from ..context import get_context_first_matching_object
 from ..context import get_context_first_object
 from ..context import get_context_loop_positions
 from ..flags import PINGBACK, TRACKBACK
+from ..instrumentation import instrument_library
 from ..managers import DRAFT
 from ..managers import tags_published
 from ..models.author import Author
@@ -37,7 +38,7 @@ from ..models.category import Category
 from ..models.entry import Entry
 from ..settings import ENTRY_LOOP_TEMPLATES
 from ..settings import PROTOCOL
-from ..templating import loop_template_list
+from ..templating import get_loop_template_resolver
 
 
 WIDONT_REGEXP = re.compile(
@@ -56,8 +57,8 @@ def get_categories(context, template='zinnia/tags/categories.html'):
     Return the published categories.
     """
     return {'template': template,
-            'categories': Category.published.all().order_by('title').annotate(
-                count_entries_published=Count('entries')),
+            'categories': Category.published.with_count_entries_published(
+                ).order_by('title'),
             'context_category': context.get('category')}
 
 
@@ -78,8 +79,7 @@ def get_authors(context, template='zinnia/tags/authors.html'):
     Return the published authors.
     """
     return {'template': template,
-            'authors': Author.published.all().annotate(
-                count_entries_published=Count('entries')),
+            'authors': Author.published.with_count_entries_published(),
             'context_author': context.get('author')}
 
 
@@ -118,7 +118,7 @@ def get_random_entries(number=5, template='zinnia/tags/entries_random.html'):
     Return random entries.
     """
     return {'template': template,
-            'entries': Entry.published.order_by('?')[:number]}
+            'entries': Entry.published.random(number)}
 
 
 @register.inclusion_tag('zinnia/tags/dummy.html')
@@ -155,8 +155,7 @@ def get_archives_entries(template='zinnia/tags/entries_archives.html'):
     Return archives entries.
     """
     return {'template': template,
-            'archives': Entry.published.datetimes(
-                'publication_date', 'month', order='DESC')}
+            'archives': get_archive_index().months[::-1]}
 
 
 @register.inclusion_tag('zinnia/tags/dummy.html')
@@ -166,8 +165,7 @@ def get_archives_entries_tree(
     Return archives entries as a tree.
     """
     return {'template': template,
-            'archives': Entry.published.datetimes(
-                'publication_date', 'day', order='ASC')}
+            'archives': get_archive_index().days}
 
 
 @register.inclusion_tag('zinnia/tags/dummy.html', takes_context=True)
@@ -197,17 +195,11 @@ def get_calendar_entries(context, year=None, month=None,
     else:
         current_month = date(year, month, 1)
 
-    dates = list(map(
-        lambda x: settings.USE_TZ and timezone.localtime(x).date() or x.date(),
-        Entry.published.datetimes('publication_date', 'month')))
-
-    if current_month not in dates:
-        dates.append(current_month)
-        dates.sort()
-    index = dates.index(current_month)
-
-    previous_month = index > 0 and dates[index - 1] or None
-    next_month = index != len(dates) - 1 and dates[index + 1] or None
+    archive_index = get_archive_index()
+    previous_month = archive_index.get_previous(
+        archive_index.months, current_month)
+    next_month = archive_index.get_next(
+        archive_index.months, current_month)
     calendar = Calendar()
 
     return {'template': template,
@@ -217,7 +209,8 @@ def get_calendar_entries(context, year=None, month=None,
                 current_month.year,
                 current_month.month,
                 previous_month=previous_month,
-                next_month=next_month)}
+                next_month=next_month,
+                archive_index=archive_index)}
 
 
 @register.inclusion_tag('zinnia/tags/dummy.html')
@@ -266,17 +259,29 @@ def get_recent_linkbacks(number=5,
 @register.inclusion_tag('zinnia/tags/dummy.html', takes_context=True)
 def zinnia_pagination(context, page, begin_pages=1, end_pages=1,
                       before_pages=2, after_pages=2,
-                      template='zinnia/tags/pagination.html'):
+                      template='zinnia/tags/pagination.html',
+                      keyset_template='zinnia/tags/keyset_pagination.html'):
     """
     Return a Digg-like pagination,
-    by splitting long list of page into 3 blocks of pages.
+    by splitting long list of page into 3 blocks of pages,
+    or the previous and next links of a keyset pagination.
     """
     get_string = ''
     for key, value in context['request'].GET.items():
-        if key != 'page':
+        if key not in ('page', 'after', 'before'):
             get_string += '&%s=%s' % (key, value)
 
-    page_range = list(page.paginator.page_range)
+    if getattr(page.paginator, 'keyset', False):
+        return {'template': keyset_template,
+                'page': page,
+                'GET_string': get_string}
+
+    num_pages = page.paginator.num_pages
+    if getattr(page.paginator, 'is_estimated', False):
+        # Past the estimated count, the pages are numbered
+        # up to the current page and the next one
+        num_pages = max(num_pages, page.number + int(page.has_next()))
+    page_range = list(range(1, num_pages + 1))
     begin = page_range[:begin_pages]
     end = page_range[-end_pages:]
     middle = page_range[max(page.number - before_pages - 1, 0):
@@ -339,11 +344,8 @@ def zinnia_loop_template(context, default_template):
          'year', 'month', 'week', 'day'])
     context_positions = get_context_loop_positions(context)
 
-    templates = loop_template_list(
-        context_positions, context_object, matching,
-        default_template, ENTRY_LOOP_TEMPLATES)
-
-    return select_template(templates)
+    return get_loop_template_resolver(ENTRY_LOOP_TEMPLATES).resolve(
+        context_positions, context_object, matching, default_template)
 
 
 @register.simple_tag
@@ -508,3 +510,6 @@ def zinnia_statistics(template='zinnia/tags/statistics.html'):
             'entries_per_month': entries_per_month,
             'comments_per_entry': comments_per_entry,
             'linkbacks_per_entry': linkbacks_per_entry}
+
+
+instrument_library(register)
@@ -1,7 +1,23 @@
 """Templates module for Zinnia"""
 import os
+from functools import lru_cache
 
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError
+from django.core.cache import caches
+from django.template import TemplateDoesNotExist
+from django.template import engines
 from django.template.defaultfilters import slugify
+from django.template.loader import get_template
+from django.template.loader import select_template
+
+from zinnia.instrumentation import instrument_cache
+
+LOOP_TEMPLATE_CACHE_SIZE = 256
+TEMPLATE_NAME_CACHE_SIZE = 1024
+TEMPLATE_INDEX_CACHE_KEY = 'zinnia:template_index'
+
+loop_template_resolvers = {}
 
 
 def append_position(path, position, separator=''):
@@ -40,3 +56,169 @@ def loop_template_list(loop_positions, instance, instance_type,
     templates.append(default_template)
 
     return templates
+
+
+class LoopTemplateResolver(object):
+    """
+    Memoize the templates selected from a registry
+    by their position within a loop and the filtering context.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.maxsize = LOOP_TEMPLATE_CACHE_SIZE + 16 * sum(
+            len(positions) for positions in registry.values())
+        self.select = lru_cache(self.maxsize)(self.select)
+
+    def select(self, loop_positions, instance_string, instance_type,
+               default_template):
+        """
+        Return the first existing template of the loop template list.
+        """
+        return select_template(loop_template_list(
+            loop_positions, instance_string, instance_type,
+            default_template, self.registry))
+
+    def resolve(self, loop_positions, instance, instance_type,
+                default_template):
+        """
+        Return the template selected for a position and an instance,
+        reloaded from its name in DEBUG to get the changes of the file.
+        """
+        template = self.select(loop_positions, str(instance),
+                               instance_type, default_template)
+        if settings.DEBUG:
+            return get_template(template.origin.template_name)
+        return template
+
+    def cache_clear(self):
+        """
+        Forget the selected templates.
+        """
+        self.select.cache_clear()
+
+
+def get_loop_template_resolver(registry):
+    """
+    Return the resolver of the loop templates of a registry.
+    """
+    resolver = loop_template_resolvers.get(id(registry))
+    if resolver is None or resolver.registry is not registry:
+        loop_template_resolvers.clear()
+        resolver = loop_template_resolvers[id(registry)] = \
+            LoopTemplateResolver(registry)
+    return resolver
+
+
+def get_cache_backend():
+    """
+    Try to access to ``templates`` cache value,
+    if fail use the ``default`` cache backend config.
+    """
+    try:
+        templates_cache = caches['templates']
+    except InvalidCacheBackendError:
+        templates_cache = caches['default']
+    return instrument_cache(templates_cache)
+
+
+def get_template_directories():
+    """
+    Return the directories of the template loaders,
+    or None if a loader is not based on directories.
+    """
+    directories = []
+    for engine in engines.all():
+        django_engine = getattr(engine, 'engine', None)
+        if django_engine is None:
+            directories.extend(engine.template_dirs)
+            continue
+        loaders = list(django_engine.template_loaders)
+        while loaders:
+            loader = loaders.pop(0)
+            if hasattr(loader, 'loaders'):
+                loaders.extend(loader.loaders)
+            elif hasattr(loader, 'get_dirs'):
+                directories.extend(loader.get_dirs())
+            else:
+                return None
+    return directories
+
+
+def build_template_index():
+    """
+    Scan the template directories and return the set
+    of the existing template names, or None if they cannot be scanned.
+    """
+    directories = get_template_directories()
+    if directories is None:
+        return None
+    template_names = set()
+    for directory in directories:
+        directory = str(directory)
+        for root, dirs, files in os.walk(directory):
+            path = os.path.relpath(root, directory).replace(os.sep, '/')
+            for filename in files:
+                template_names.add(
+                    filename if path == '.' else '%s/%s' % (path, filename))
+    return frozenset(template_names)
+
+
+def get_template_index():
+    """
+    Return the cached set of the existing template names.
+    """
+    return get_cache_backend().get(TEMPLATE_INDEX_CACHE_KEY)
+
+
+def set_template_index(template_names):
+    """
+    Cache the set of the existing template names.
+    """
+    get_cache_backend().set(TEMPLATE_INDEX_CACHE_KEY, template_names, None)
+
+
+def flush_template_index():
+    """
+    Remove the cached set of the existing template names.
+    """
+    get_cache_backend().delete(TEMPLATE_INDEX_CACHE_KEY)
+
+
+@lru_cache(TEMPLATE_NAME_CACHE_SIZE)
+def select_template_name(template_names):
+    """
+    Return the name of the first existing template
+    of a tuple of template names.
+    """
+    return select_template(template_names).origin.template_name
+
+
+def resolve_template_names(template_names):
+    """
+    Reduce a list of template names to the first existing one,
+    from the template index if cached, or by probing the loaders
+    once per list of names. In DEBUG the list is returned as is.
+    """
+    if settings.DEBUG:
+        return template_names
+    template_index = get_template_index()
+    if template_index is not None:
+        for template_name in template_names:
+            if template_name in template_index:
+                return [template_name]
+        return template_names
+    try:
+        return [select_template_name(tuple(template_names))]
+    except TemplateDoesNotExist:
+        return template_names
+
+
+def reset_template_caches(**kwargs):
+    """
+    Forget the selected templates when the templates
+    or their configuration are reloaded.
+    """
+    if kwargs.get('setting', 'TEMPLATES') in ('TEMPLATES', 'DEBUG'):
+        loop_template_resolvers.clear()
+        select_template_name.cache_clear()
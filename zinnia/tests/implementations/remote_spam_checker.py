@@ -0,0 +1,12 @@
+"""Remote spam checker backend for testing Zinnia"""
+import time
+
+
+def backend(comment, content_object, request):
+    """
+    Remote spam checker backend for testing Zinnia,
+    slowed down if the comment asks for it.
+    """
+    if 'slow' in comment.comment:
+        time.sleep(0.5)
+    return 'spam' in comment.comment
@@ -35,6 +35,33 @@ TEMPLATES = [
     }
 ]
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'archives': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+    'discussions': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+    'markups': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+    'paginator': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+    'previews': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+    'templates': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+    'xmlrpc': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+}
+
 SILENCED_SYSTEM_CHECKS = ['1_6.W001']
 
 INSTALLED_APPS = [
@@ -0,0 +1,8 @@
+"""Test urls for the zinnia project with language prefixes"""
+from django.conf.urls import include
+from django.conf.urls import url
+from django.conf.urls.i18n import i18n_patterns
+
+urlpatterns = i18n_patterns(
+    url(r'^', include('zinnia.urls')),
+)
@@ -5,6 +5,8 @@ from __future__ import unicode_literals
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth.models import User
 from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed
 from django.test import RequestFactory
 from django.test import TestCase
 from django.test.utils import override_settings
@@ -13,8 +15,10 @@ from django.utils import timezone
 from django.utils.translation import activate
 from django.utils.translation import deactivate
 
+from tagging.models import Tag
+
+from zinnia import ping
 from zinnia import settings
-from zinnia.admin import entry as entry_admin
 from zinnia.admin.category import CategoryAdmin
 from zinnia.admin.entry import EntryAdmin
 from zinnia.managers import PUBLISHED
@@ -22,6 +26,7 @@ from zinnia.models.author import Author
 from zinnia.models.category import Category
 from zinnia.models.entry import Entry
 from zinnia.signals import disconnect_entry_signals
+from zinnia.signals import entries_were_updated
 from zinnia.tests.utils import datetime
 from zinnia.tests.utils import skip_if_custom_user
 from zinnia.url_shortener.backends.default import base36
@@ -253,6 +258,10 @@ class EntryAdminTestCase(BaseAdminTestCase):
         field = self.admin.formfield_for_manytomany(
             Entry.authors.field, self.request)
         self.assertEqual(field.queryset.count(), 3)
+        self.assertNotIn('DISTINCT', str(field.queryset.query))
+        self.assertIn('EXISTS', str(field.queryset.query))
+        self.assertEqual(field.widget.get_url(),
+                         '/admin/zinnia/entry/authors_autocomplete/')
 
     def test_get_readonly_fields(self):
         user = User.objects.create_user(
@@ -282,7 +291,9 @@ class EntryAdminTestCase(BaseAdminTestCase):
              'ping_directories',
              'put_on_top',
              'mark_featured',
-             'unmark_featured'])
+             'unmark_featured',
+             'add_categories',
+             'add_sites'])
         settings.PING_DIRECTORIES = False
         self.assertEqual(
             list(self.admin.get_actions(self.request).keys()),
@@ -291,7 +302,9 @@ class EntryAdminTestCase(BaseAdminTestCase):
              'close_trackbacks',
              'put_on_top',
              'mark_featured',
-             'unmark_featured'])
+             'unmark_featured',
+             'add_categories',
+             'add_sites'])
         self.request.user = root
         self.assertEqual(
             list(self.admin.get_actions(self.request).keys()),
@@ -304,7 +317,18 @@ class EntryAdminTestCase(BaseAdminTestCase):
              'close_trackbacks',
              'put_on_top',
              'mark_featured',
-             'unmark_featured'])
+             'unmark_featured',
+             'add_categories',
+             'add_sites'])
+        Category.objects.create(title='Category', slug='cat')
+        with self.assertNumQueries(0):
+            actions = self.admin.get_actions(self.request)
+        self.assertEqual(
+            actions['add_categories'][2],
+            'Add the selected entries to a category')
+        self.assertEqual(
+            actions['add_sites'][2],
+            'Publish the selected entries on a site')
         settings.PING_DIRECTORIES = original_ping_directories
 
     def test_get_actions_in_popup_mode_issue_291(self):
@@ -325,6 +349,80 @@ class EntryAdminTestCase(BaseAdminTestCase):
         self.admin.make_mine(self.request, Entry.objects.all())
         self.assertEqual(user.entries.count(), 1)
         self.assertEqual(len(self.request._messages.messages), 1)
+        for i in range(5):
+            Entry.objects.create(title='Entry %s' % i, slug='entry-%s' % i)
+        with self.assertNumQueries(4):
+            self.admin.make_mine(self.request, Entry.objects.all())
+        self.assertEqual(user.entries.count(), 6)
+        with self.assertNumQueries(2):
+            self.admin.make_mine(self.request, Entry.objects.all())
+
+    def test_add_related(self):
+        signals = []
+
+        def receiver(sender, **kwargs):
+            signals.append((kwargs['action'], kwargs['instance'],
+                            kwargs['pk_set']))
+
+        category = Category.objects.create(title='Category', slug='cat')
+        other_entry = Entry.objects.create(title='Other', slug='other')
+        self.entry.categories.add(category)
+        m2m_changed.connect(receiver, sender=Entry.categories.through)
+        self.request.user = User.objects.create_superuser(
+            'root', 'root@exemple.com', 'toor')
+        request = self.request_factory.post('/', {
+            'action': 'add_categories', 'index': 0,
+            '_selected_action': [self.entry.pk, other_entry.pk],
+            'related': category.pk, 'apply': 'Apply'})
+        request.user = self.request.user
+        request._messages = TestMessageBackend()
+        action = self.admin.get_actions(request)['add_categories'][0]
+        self.assertEqual(
+            action(self.admin, request, Entry.objects.all()), None)
+        self.assertEqual(len(request._messages.messages), 1)
+        self.assertEqual(category.entries.count(), 2)
+        self.assertEqual(signals,
+                         [('pre_add', other_entry, {category.pk}),
+                          ('post_add', other_entry, {category.pk})])
+
+        original_m2m_signals = settings.ADMIN_M2M_SIGNALS
+        settings.ADMIN_M2M_SIGNALS = False
+        site = Site.objects.get_current()
+        self.assertEqual(
+            self.admin.add_related(self.request, Entry.objects.all(),
+                                   'sites', site),
+            sorted([self.entry.pk, other_entry.pk]))
+        self.assertEqual(site.entries.count(), 2)
+        self.assertEqual(len(signals), 2)
+        settings.ADMIN_M2M_SIGNALS = original_m2m_signals
+        m2m_changed.disconnect(receiver, sender=Entry.categories.through)
+
+    def test_add_related_intermediate_form(self):
+        category = Category.objects.create(title='Category', slug='cat')
+        request = self.request_factory.post('/', {
+            'action': 'add_categories', 'index': 0,
+            '_selected_action': [self.entry.pk]})
+        request.user = User.objects.create_superuser(
+            'root', 'root@exemple.com', 'toor')
+        response = self.admin.add_categories(request, Entry.objects.all())
+        self.assertEqual(response.template_name,
+                         'admin/zinnia/entry/add_related.html')
+        self.assertEqual(response.context_data['action'], 'add_categories')
+        self.assertEqual(response.context_data['selected'],
+                         [str(self.entry.pk)])
+        self.assertEqual(response.context_data['entries_count'], 1)
+        self.assertFalse(response.context_data['form'].is_bound)
+        self.assertEqual(category.entries.count(), 0)
+
+        request = self.request_factory.post('/', {
+            'action': 'add_sites', 'index': 0,
+            '_selected_action': [self.entry.pk],
+            'related': 404, 'apply': 'Apply'})
+        request.user = User.objects.create_superuser(
+            'admin', 'admin@exemple.com', 'toor')
+        response = self.admin.add_sites(request, Entry.objects.all())
+        self.assertTrue(response.context_data['form'].errors)
+        self.assertEqual(self.entry.sites.count(), 0)
 
     def test_make_published(self):
         original_ping_directories = settings.PING_DIRECTORIES
@@ -397,17 +495,37 @@ class EntryAdminTestCase(BaseAdminTestCase):
         self.assertEqual(Entry.objects.filter(featured=True).count(), 0)
         self.assertEqual(len(self.request._messages.messages), 2)
 
+    def test_update_entries(self):
+        updates = []
+
+        def receiver(sender, **kwargs):
+            updates.append(kwargs)
+
+        entries_were_updated.connect(receiver)
+        Entry.objects.create(title='Other', slug='other')
+        self.request._messages = TestMessageBackend()
+        self.admin.close_comments(self.request, Entry.objects.all())
+        entries_were_updated.disconnect(receiver)
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(sorted(updates[0]['entries']),
+                         sorted(Entry.objects.values_list('pk', flat=True)))
+        self.assertEqual(updates[0]['fields'], ['comment_enabled'])
+        self.assertEqual(updates[0]['request'], self.request)
+
     def test_ping_directories(self):
         class FakePinger(object):
             def __init__(self, *ka, **kw):
                 self.results = [{'flerror': False, 'message': 'OK'},
                                 {'flerror': True, 'message': 'KO'}]
 
+            def is_alive(self):
+                return False
+
             def join(self):
                 pass
 
-        original_pinger = entry_admin.DirectoryPinger
-        entry_admin.DirectoryPinger = FakePinger
+        original_pinger = ping.DirectoryPinger
+        ping.DirectoryPinger = FakePinger
         original_ping_directories = settings.PING_DIRECTORIES
         settings.PING_DIRECTORIES = ['http://ping.com/ping']
 
@@ -415,12 +533,18 @@ class EntryAdminTestCase(BaseAdminTestCase):
         self.admin.ping_directories(self.request, Entry.objects.all(), False)
         self.assertEqual(len(self.request._messages.messages), 0)
         self.admin.ping_directories(self.request, Entry.objects.all())
-        self.assertEqual(len(self.request._messages.messages), 2)
+        self.assertEqual(len(self.request._messages.messages), 1)
         self.assertEqual(self.request._messages.messages,
-                         [(20, 'http://ping.com/ping : KO', ''),
-                          (20, 'http://ping.com/ping directory succesfully '
-                           'pinged 1 entries.', '')])
-        entry_admin.DirectoryPinger = original_pinger
+                         [(20, 'Directories are being pinged, see <a href='
+                           '"/admin/zinnia/entry/ping_status/">the status '
+                           'of the pings</a>.', '')])
+        job = ping.ping_dispatcher.get_jobs()[0]
+        self.assertEqual(job.directory, 'http://ping.com/ping')
+        self.assertEqual(job.entries, [str(self.entry)])
+        self.assertFalse(job.is_running)
+        self.assertEqual(job.success, 1)
+        self.assertEqual(job.errors, ['KO'])
+        ping.DirectoryPinger = original_pinger
         settings.PING_DIRECTORIES = original_ping_directories
 
 
@@ -497,6 +621,95 @@ class FunctionnalAdminTestCase(TestCase):
             reverse('admin:zinnia_entry_change', args=[self.entry.pk])
         )
 
+    def test_admin_entry_update_tags(self):
+        self.entry.tags = 'zinnia test'
+        self.entry.save()
+        response = self.client.get(
+            reverse('admin:zinnia_entry_change', args=[self.entry.pk]))
+        self.assertContains(
+            response, '<option value="test" selected>test</option>',
+            html=True)
+        self.assertContains(
+            response, '<option value="zinnia" selected>zinnia</option>',
+            html=True)
+        self.assertContains(response, 'select2.full', count=1)
+        self.assertNotContains(response, 'zinnia/admin/select2/')
+
+    def test_admin_entry_ping_status(self):
+        self.assert_admin(
+            reverse('admin:zinnia_entry_ping_status')
+        )
+
+    def test_admin_entry_add_categories(self):
+        url = reverse('admin:zinnia_entry_changelist')
+        data = {'action': 'add_categories', 'index': 0,
+                '_selected_action': [self.entry.pk]}
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'name="apply"')
+        self.assertContains(response, 'value="%s"' % self.entry.pk)
+        self.assertEqual(self.entry.categories.count(), 0)
+
+    def test_admin_entry_authors_autocomplete(self):
+        url = reverse('admin:zinnia_entry_authors_autocomplete')
+        Author.objects.create_user('user', 'user@example.com')
+        for i in range(3):
+            author = Author.objects.create_user(
+                'author-%s' % i, 'author-%s@example.com' % i)
+            self.entry.authors.add(author)
+        response = self.client.get(url)
+        self.assertEqual(response.json(), {
+            'results': [{'id': str(self.author.pk), 'text': 'admin'}] + [
+                {'id': str(author.pk), 'text': author.username}
+                for author in self.entry.authors.order_by('username')],
+            'pagination': {'more': False}})
+        original_paginate_by = EntryAdmin.authors_paginate_by
+        EntryAdmin.authors_paginate_by = 2
+        response = self.client.get(url, {'term': 'author', 'page': 1})
+        self.assertEqual(
+            [result['text'] for result in response.json()['results']],
+            ['author-0', 'author-1'])
+        self.assertTrue(response.json()['pagination']['more'])
+        response = self.client.get(url, {'term': 'author', 'page': 2})
+        self.assertEqual(response.json(), {
+            'results': [{'id': str(author.pk), 'text': 'author-2'}],
+            'pagination': {'more': False}})
+        EntryAdmin.authors_paginate_by = original_paginate_by
+
+    def test_admin_entry_tags_autocomplete(self):
+        url = reverse('admin:zinnia_entry_tags_autocomplete')
+        cache.clear()
+        Tag.objects.create(name='unused')
+        self.entry.tags = 'zinnia, test, tag-1, tag-2, tag-3, Tag-4'
+        self.entry.save()
+        response = self.client.get(url)
+        self.assertEqual(
+            [result['text'] for result in response.json()['results']],
+            ['Tag-4', 'tag-1', 'tag-2', 'tag-3', 'test', 'zinnia'])
+        original_paginate_by = EntryAdmin.tags_paginate_by
+        EntryAdmin.tags_paginate_by = 2
+        response = self.client.get(url, {'term': 'TAG', 'page': 1})
+        self.assertEqual(response.json(), {
+            'results': [{'id': 'Tag-4', 'text': 'Tag-4'},
+                        {'id': 'tag-1', 'text': 'tag-1'}],
+            'pagination': {'more': True}})
+        response = self.client.get(url, {'term': 'tag', 'page': 'x'})
+        self.assertEqual(response.json()['results'][0]['text'], 'Tag-4')
+        response = self.client.get(url, {'term': 'tag', 'page': 2})
+        self.assertEqual(
+            [result['text'] for result in response.json()['results']],
+            ['tag-2', 'tag-3'])
+        self.assertFalse(response.json()['pagination']['more'])
+        self.entry.tags = 'zinnia'
+        self.entry.save()
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {'term': 'tag', 'page': 2})
+        self.assertEqual(len(response.json()['results']), 2)
+        cache.clear()
+        response = self.client.get(url, {'term': 'tag', 'page': 2})
+        self.assertEqual(response.json()['results'], [])
+        EntryAdmin.tags_paginate_by = original_paginate_by
+
     def test_admin_category_update(self):
         self.assert_admin(
             reverse('admin:zinnia_category_change', args=[self.category.pk])
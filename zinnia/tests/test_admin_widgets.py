@@ -1,7 +1,10 @@
 """Test cases for Zinnia's admin widgets"""
+from django.http import QueryDict
 from django.test import TestCase
 from django.test.utils import override_settings
 
+from tagging.utils import parse_tag_input
+
 from zinnia.admin.widgets import MPTTFilteredSelectMultiple
 from zinnia.admin.widgets import MiniTextarea
 from zinnia.admin.widgets import TagAutoComplete
@@ -173,70 +176,64 @@ class TagAutoCompleteTestCase(TestCase):
     def setUp(self):
         disconnect_entry_signals()
 
-    def test_get_tags(self):
+    def test_get_url(self):
         widget = TagAutoComplete()
-        self.assertEqual(
-            widget.get_tags(),
-            [])
-
-        params = {'title': 'My entry',
-                  'tags': 'zinnia, test',
-                  'slug': 'my-entry'}
-        Entry.objects.create(**params)
-        self.assertEqual(
-            widget.get_tags(),
-            ['test', 'zinnia'])
+        self.assertEqual(widget.get_url(),
+                         '/admin/zinnia/entry/tags_autocomplete/')
 
     def test_render(self):
         widget = TagAutoComplete()
-        params = {'title': 'My entry',
-                  'tags': 'zinnia, test',
-                  'slug': 'my-entry'}
-        Entry.objects.create(**params)
+        Entry.objects.create(title='My entry', tags='zinnia, test',
+                             slug='my-entry')
+        with self.assertNumQueries(0):
+            output = widget.render('tag', '"new tag", test,')
         self.assertHTMLEqual(
-            widget.render('tag', 'test,'),
-            '<input class="vTextField" name="tag" type="text" value="test," />'
-            '\n<script type="text/javascript">\n(function($) {'
-            '\n  $(document).ready(function() {'
-            '\n    $("#id_tag").select2({'
-            '\n       width: "element",'
-            '\n       maximumInputLength: 50,'
-            '\n       tokenSeparators: [",", " "],'
-            '\n       tags: ["test", "zinnia"]'
-            '\n     });\n    });'
-            '\n}(django.jQuery));\n</script>')
-
-    def test_render_tag_with_apostrophe(self):
-        widget = TagAutoComplete()
-        params = {'title': 'My entry',
-                  'tags': "zinnia, test, apos'trophe",
-                  'slug': 'my-entry'}
-        Entry.objects.create(**params)
-        self.maxDiff = None
+            output,
+            '<select name="tag" class="admin-autocomplete" multiple'
+            ' data-ajax--cache="true" data-ajax--delay="250"'
+            ' data-ajax--type="GET"'
+            ' data-ajax--url="/admin/zinnia/entry/tags_autocomplete/"'
+            ' data-theme="admin-autocomplete" data-allow-clear="true"'
+            ' data-placeholder="" data-tags="true"'
+            ' data-token-separators=\'[",", " "]\''
+            ' data-maximum-input-length="50">'
+            '<option value="new tag" selected>new tag</option>'
+            '<option value="test" selected>test</option>'
+            '</select>')
         self.assertHTMLEqual(
-            widget.render('tag', 'test,'),
-            '<input class="vTextField" name="tag" type="text" value="test," />'
-            '\n<script type="text/javascript">\n(function($) {'
-            '\n  $(document).ready(function() {'
-            '\n    $("#id_tag").select2({'
-            '\n       width: "element",'
-            '\n       maximumInputLength: 50,'
-            '\n       tokenSeparators: [",", " "],'
-            '\n       tags: ["apos\'trophe", "test", "zinnia"]'
-            '\n     });\n    });'
-            '\n}(django.jQuery));\n</script>')
+            widget.render('tag', ['test']),
+            widget.render('tag', 'test'))
+
+    def test_value_from_datadict(self):
+        widget = TagAutoComplete()
+        data = QueryDict(mutable=True)
+        data.setlist('tag', ['test', 'new tag', 'a,b'])
+        self.assertEqual(widget.value_from_datadict(data, {}, 'tag'),
+                         'test, "new tag", "a,b"')
+        self.assertEqual(
+            parse_tag_input(widget.value_from_datadict(data, {}, 'tag')),
+            ['a,b', 'new tag', 'test'])
+        self.assertEqual(
+            widget.value_from_datadict(QueryDict(), {}, 'tag'), '')
+        self.assertEqual(
+            widget.value_from_datadict({'tag': 'test'}, {}, 'tag'), 'test')
 
     @override_settings(STATIC_URL='/s/')
     def test_media(self):
         medias = TagAutoComplete().media
         self.assertEqual(
             medias._css,
-            {'all': ['/s/zinnia/admin/select2/css/select2.css']}
+            {'screen': ['admin/css/vendor/select2/select2.min.css',
+                        'admin/css/autocomplete.css']}
         )
         self.assertEqual(
             medias._js,
-            ['/s/zinnia/admin/select2/js/select2.js']
+            ['admin/js/vendor/jquery/jquery.min.js',
+             'admin/js/vendor/select2/select2.full.min.js',
+             'admin/js/jquery.init.js',
+             'admin/js/autocomplete.js']
         )
+        self.assertIn('/s/admin/js/autocomplete.js', str(medias))
 
 
 class MiniTextareaTestCase(TestCase):
@@ -0,0 +1,177 @@
+"""Test cases for Zinnia's archive index"""
+from datetime import date
+from datetime import timedelta
+
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from zinnia import settings
+from zinnia.archives import ARCHIVE_INDEX_CACHE_KEY
+from zinnia.archives import ArchiveIndex
+from zinnia.archives import flush_archive_index
+from zinnia.archives import get_archive_index
+from zinnia.archives import get_cache_backend
+from zinnia.managers import PUBLISHED
+from zinnia.models.entry import Entry
+from zinnia.signals import connect_entry_signals
+from zinnia.signals import disconnect_entry_signals
+from zinnia.signals import entries_were_updated
+from zinnia.tests.utils import datetime
+
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'archives': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'archives',
+    }
+}
+
+
+class ArchiveIndexTestCase(TestCase):
+
+    def setUp(self):
+        self.index = ArchiveIndex([date(2013, 6, 2), date(2012, 1, 1),
+                                   date(2012, 3, 15), date(2012, 1, 1)])
+
+    def test_init(self):
+        self.assertEqual(self.index.days, [date(2012, 1, 1),
+                                           date(2012, 3, 15),
+                                           date(2013, 6, 2)])
+        self.assertEqual(self.index.months, [date(2012, 1, 1),
+                                             date(2012, 3, 1),
+                                             date(2013, 6, 1)])
+        self.assertEqual(self.index.years, [date(2012, 1, 1),
+                                            date(2013, 1, 1)])
+
+    def test_is_expired(self):
+        self.assertFalse(self.index.is_expired)
+        index = ArchiveIndex([], timezone.now() + timedelta(hours=1))
+        self.assertFalse(index.is_expired)
+        index = ArchiveIndex([], timezone.now() - timedelta(hours=1))
+        self.assertTrue(index.is_expired)
+
+    def test_get_previous_next(self):
+        days = self.index.days
+        self.assertEqual(self.index.get_previous(days, date(2012, 1, 1)),
+                         None)
+        self.assertEqual(self.index.get_next(days, date(2012, 1, 1)),
+                         date(2012, 3, 15))
+        self.assertEqual(self.index.get_previous(days, date(2014, 1, 1)),
+                         date(2013, 6, 2))
+        self.assertEqual(self.index.get_next(days, date(2014, 1, 1)),
+                         None)
+        self.assertEqual(
+            self.index.get_previous_next(date(2012, 3, 15)),
+            {'year': [None, date(2013, 1, 1)],
+             'week': [date(2011, 12, 26), date(2013, 5, 27)],
+             'month': [date(2012, 1, 1), date(2013, 6, 1)],
+             'day': [date(2012, 1, 1), date(2013, 6, 2)]})
+
+    def test_get_month_days(self):
+        self.assertEqual(self.index.get_month_days(2012, 1),
+                         [date(2012, 1, 1)])
+        self.assertEqual(self.index.get_month_days(2012, 2), [])
+        self.assertEqual(self.index.get_month_days(2013, 12), [])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class GetArchiveIndexTestCase(TestCase):
+
+    def setUp(self):
+        disconnect_entry_signals()
+        flush_archive_index()
+        self.site = Site.objects.get_current()
+
+    def create_published_entry(self, slug, publication_date, **kwargs):
+        entry = Entry.objects.create(
+            title=slug, slug=slug, status=PUBLISHED,
+            publication_date=publication_date, **kwargs)
+        entry.sites.add(self.site)
+        return entry
+
+    def test_get_archive_index(self):
+        self.create_published_entry('entry-1', datetime(2012, 1, 1, 12))
+        with self.assertNumQueries(2):
+            index = get_archive_index()
+        self.assertEqual(index.days, [date(2012, 1, 1)])
+        self.create_published_entry('entry-2', datetime(2013, 1, 1, 12))
+        with self.assertNumQueries(0):
+            index = get_archive_index()
+        self.assertEqual(index.days, [date(2012, 1, 1)])
+        flush_archive_index()
+        with self.assertNumQueries(2):
+            index = get_archive_index()
+        self.assertEqual(index.days, [date(2012, 1, 1), date(2013, 1, 1)])
+
+    def test_get_archive_index_expiration(self):
+        now = timezone.now()
+        self.create_published_entry(
+            'entry-1', datetime(2012, 1, 1, 12),
+            end_publication=now + timedelta(minutes=1))
+        self.create_published_entry(
+            'entry-2', datetime(2013, 1, 1, 12),
+            start_publication=now + timedelta(hours=1))
+        index = get_archive_index()
+        self.assertEqual(index.days, [date(2012, 1, 1)])
+        self.assertEqual(index.expiration, now + timedelta(minutes=1))
+        Entry.objects.filter(slug='entry-1').update(
+            end_publication=now - timedelta(minutes=1))
+        Entry.objects.filter(slug='entry-2').update(
+            start_publication=now - timedelta(minutes=1))
+        with self.assertNumQueries(0):
+            self.assertEqual(get_archive_index().days, [date(2012, 1, 1)])
+        cache = get_cache_backend()
+        indexes = cache.get(ARCHIVE_INDEX_CACHE_KEY)
+        for index in indexes.values():
+            index.expiration = now
+        cache.set(ARCHIVE_INDEX_CACHE_KEY, indexes)
+        with self.assertNumQueries(2):
+            self.assertEqual(get_archive_index().days, [date(2013, 1, 1)])
+
+    @override_settings(USE_TZ=True, TIME_ZONE='Europe/Paris')
+    def test_get_archive_index_timezones(self):
+        self.create_published_entry('entry-1', datetime(2012, 1, 1, 23))
+        self.assertEqual(get_archive_index().days, [date(2012, 1, 2)])
+        with timezone.override('UTC'):
+            self.assertEqual(get_archive_index().days, [date(2012, 1, 1)])
+
+    def test_flush_archive_index_signals(self):
+        entry = self.create_published_entry(
+            'entry-1', datetime(2012, 1, 1, 12))
+        original_save_ping_directories = settings.SAVE_PING_DIRECTORIES
+        original_save_ping_external_urls = settings.SAVE_PING_EXTERNAL_URLS
+        settings.SAVE_PING_DIRECTORIES = False
+        settings.SAVE_PING_EXTERNAL_URLS = False
+        connect_entry_signals()
+        get_archive_index()
+
+        entry.comment_count = 2
+        entry.save(update_fields=['comment_count'])
+        with self.assertNumQueries(0):
+            get_archive_index()
+        entry.save()
+        with self.assertNumQueries(2):
+            get_archive_index()
+        entry.sites.clear()
+        self.assertEqual(get_archive_index().days, [])
+        entry.sites.add(self.site)
+        self.assertEqual(get_archive_index().days, [date(2012, 1, 1)])
+
+        entries_were_updated.send(sender=Entry, entries=[entry.pk],
+                                  fields=['featured'], request=None)
+        with self.assertNumQueries(0):
+            get_archive_index()
+        entries_were_updated.send(sender=Entry, entries=[entry.pk],
+                                  fields=['status'], request=None)
+        with self.assertNumQueries(2):
+            get_archive_index()
+        entry.delete()
+        self.assertEqual(get_archive_index().days, [])
+        disconnect_entry_signals()
+        settings.SAVE_PING_DIRECTORIES = original_save_ping_directories
+        settings.SAVE_PING_EXTERNAL_URLS = original_save_ping_external_urls
@@ -0,0 +1,126 @@
+"""Test cases for Zinnia's benchmark harness"""
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from zinnia.benchmark import INCLUSION_TAGS
+from zinnia.benchmark import benchmark_entry_save
+from zinnia.benchmark import measure
+from zinnia.benchmark import run_benchmarks
+from zinnia.corpus import generate_corpus
+from zinnia.models.author import Author
+from zinnia.models.entry import Entry
+from zinnia.signals import connect_entry_signals
+from zinnia.signals import disconnect_entry_signals
+
+
+@override_settings(
+    TEMPLATES=[
+        {
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'OPTIONS': {
+                'loaders': [
+                    'zinnia.tests.utils.VoidLoader',
+                ]
+            }
+        }
+    ]
+)
+class BenchmarkTestCase(TestCase):
+
+    def setUp(self):
+        disconnect_entry_signals()
+
+    def test_measure(self):
+        calls = []
+
+        def function():
+            calls.append(Entry.objects.count())
+            return 'result'
+
+        result, metrics = measure(function, repeat=3)
+        self.assertEqual(result, 'result')
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(metrics['queries'], 1)
+        self.assertEqual(metrics['warm_queries'], 1)
+        self.assertTrue(metrics['time'] > 0)
+        self.assertTrue(metrics['peak_memory'] > 0)
+        result, metrics = measure(function, repeat=0)
+        self.assertEqual(metrics['time'], None)
+
+    def test_run_benchmarks(self):
+        generate_corpus(entries=20, discussions=60, categories=8,
+                        authors=3, sites=2, tags=10)
+        results = run_benchmarks(repeat=1)
+        groups = set(result['group'] for result in results)
+        self.assertEqual(groups, set(['url', 'tag', 'sitemap', 'published',
+                                      'random', 'xmlrpc', 'save',
+                                      'markup', 'preview']))
+        urls = dict((result['name'], result) for result in results
+                    if result['group'] == 'url')
+        self.assertEqual(urls['entry_detail']['status'], 200)
+        self.assertEqual(urls['category_detail']['status'], 200)
+        self.assertEqual(urls['tag_feed']['status'], 200)
+        self.assertEqual(urls['entry_shortlink']['status'], 301)
+        for result in urls.values():
+            self.assertTrue(result['status'] in (200, 301, 302, 404))
+        self.assertEqual(
+            len([result for result in results if result['group'] == 'tag']),
+            len(INCLUSION_TAGS))
+        published = dict(((result['target'], result['name']), result)
+                         for result in results
+                         if result['group'] == 'published')
+        for model in ('Category', 'Author'):
+            sizes = set(published[model, name]['size'] for name in (
+                'exists', 'exists_count', 'join_distinct', 'join_count'))
+            self.assertEqual(len(sizes), 1)
+        self.assertEqual(
+            [(result['name'], result['target'], result['size'])
+             for result in results if result['group'] == 'random'],
+            [('random', 1, 1), ('order_by_random', 1, 1),
+             ('random', 5, 5), ('order_by_random', 5, 5)])
+        recent_posts = [(result['target'], result['size'])
+                        for result in results if result['group'] == 'xmlrpc']
+        self.assertEqual([target for target, size in recent_posts],
+                         [1, 10, 50])
+        self.assertEqual(recent_posts[0][1], 1)
+        self.assertTrue(recent_posts[1][1] <= recent_posts[2][1])
+        self.assertFalse(Author.objects.filter(is_staff=True).exists())
+
+    def test_benchmark_entry_save(self):
+        generate_corpus(entries=5, discussions=0, categories=2,
+                        authors=1, sites=1, tags=5)
+        entry = Entry.published.order_by('pk').first()
+        last_update = entry.last_update
+        connect_entry_signals()
+        self.addCleanup(disconnect_entry_signals)
+        results = benchmark_entry_save(entry, repeat=1)
+        self.assertEqual([result['name'] for result in results],
+                         ['signals', 'suppressed'])
+        for result in results:
+            self.assertEqual(result['group'], 'save')
+            self.assertTrue(result['queries'] > 0)
+            self.assertTrue(result['time'] > 0)
+        self.assertEqual(Entry.objects.get(pk=entry.pk).last_update,
+                         last_update)
+        self.assertEqual(benchmark_entry_save(None, repeat=1), [])
+
+    def test_run_benchmarks_empty(self):
+        results = run_benchmarks(repeat=0)
+        urls = dict((result['name'], result) for result in results
+                    if result['group'] == 'url')
+        self.assertEqual(urls['entry_archive_index']['status'], 200)
+        self.assertFalse('entry_detail' in urls)
+
+    def test_run_benchmark_command(self):
+        out = StringIO()
+        call_command('run_benchmark', sizes='10', repeat=0, stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['environment']['repeat'], 0)
+        self.assertEqual(len(report['runs']), 1)
+        self.assertEqual(report['runs'][0]['corpus']['entries'], 10)
+        self.assertTrue(report['runs'][0]['results'])
+        self.assertEqual(Entry.objects.count(), 0)
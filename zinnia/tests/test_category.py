@@ -65,10 +65,85 @@ class CategoryTestCase(TestCase):
         self.categories[3].save()
 
         category = Category.objects.get(slug='category-2')
-        with self.assertNumQueries(1):
+        with self.assertNumQueries(0):
             self.assertEqual(category.tree_path, 'category-1/category-2')
 
         category = Category.objects.get(slug='category-4')
-        with self.assertNumQueries(1):
+        with self.assertNumQueries(0):
             self.assertEqual(category.tree_path,
                              'category-1/category-2/category-3/category-4')
+
+    def test_tree_path_consistency(self):
+        parent = self.categories[0]
+        child = self.categories[1]
+        child.parent = parent
+        child.save()
+        grandchild = Category.objects.create(
+            title='Category 3', slug='category-3', parent=child)
+        self.assertEqual(grandchild.tree_path,
+                         'category-1/category-2/category-3')
+
+        parent.slug = 'category-0'
+        parent.save()
+        self.assertEqual(
+            list(Category.objects.order_by('slug').values_list(
+                'tree_path', flat=True)),
+            ['category-0', 'category-0/category-2',
+             'category-0/category-2/category-3'])
+
+        child = Category.objects.get(slug='category-2')
+        child.move_to(None)
+        self.assertEqual(Category.objects.get(slug='category-3').tree_path,
+                         'category-2/category-3')
+
+        child.parent = Category.objects.get(slug='category-0')
+        child.save(update_fields=['parent'])
+        self.assertEqual(Category.objects.get(slug='category-3').tree_path,
+                         'category-0/category-2/category-3')
+
+        Category.objects.get(slug='category-0').delete()
+        self.assertEqual(
+            list(Category.objects.order_by('slug').values_list(
+                'tree_path', flat=True)),
+            ['category-2', 'category-2/category-3'])
+
+    def test_tree_path_move_to(self):
+        parent = self.categories[0]
+        child = self.categories[1]
+        child.parent = parent
+        child.save()
+        Category.objects.create(
+            title='Category 3', slug='category-3', parent=child)
+        other = Category.objects.create(title='Category 4', slug='category-4')
+        stale_child = Category.objects.get(slug='category-2')
+        parent.slug = 'category-0'
+        parent.save()
+
+        stale_child.move_to(other)
+        self.assertEqual(
+            list(Category.objects.order_by('slug').values_list(
+                'slug', 'tree_path')),
+            [('category-0', 'category-0'),
+             ('category-2', 'category-4/category-2'),
+             ('category-3', 'category-4/category-2/category-3'),
+             ('category-4', 'category-4')])
+        self.assertEqual(stale_child.tree_path, 'category-4/category-2')
+
+        Category.objects.move_node(
+            Category.objects.get(slug='category-2'),
+            Category.objects.get(slug='category-0'), 'left')
+        self.assertEqual(
+            list(Category.objects.order_by('slug').values_list(
+                'slug', 'tree_path')),
+            [('category-0', 'category-0'),
+             ('category-2', 'category-2'),
+             ('category-3', 'category-2/category-3'),
+             ('category-4', 'category-4')])
+        self.assertEqual(
+            Category.objects.get(slug='category-3').get_absolute_url(),
+            '/categories/category-2/category-3/')
+
+        Category.objects.filter(slug='category-2').delete()
+        self.assertEqual(
+            Category.objects.get(slug='category-3').tree_path,
+            'category-3')
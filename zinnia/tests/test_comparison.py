@@ -178,6 +178,32 @@ class ComparisonTestCase(TestCase):
         with self.assertNumQueries(0):
             self.assertEqual(len(v.get_related(e1, 5)), 2)
 
+    def test_cache_flush_objects(self):
+        e1 = Entry.objects.create(title='My entry number 1',
+                                  content='My content number 1',
+                                  slug='my-entry-number-1')
+        e2 = Entry.objects.create(title='My entry 1',
+                                  content='My content 1',
+                                  slug='my-entry-1')
+        e3 = Entry.objects.create(title='Other title',
+                                  content='Other content',
+                                  slug='other-entry')
+        v = CachedModelVectorBuilder(
+            queryset=Entry.objects.all(), fields=['title', 'content'])
+        v.cache_flush()
+        self.addCleanup(v.cache_flush)
+        related = dict((e.pk, v.get_related(e, 5)) for e in (e1, e2, e3))
+        self.assertEqual(
+            sorted(v.cache.keys()),
+            sorted(['%s:5' % e1.pk, '%s:5' % e2.pk,
+                    '%s:5' % e3.pk, 'columns_dataset']))
+        v.cache_flush_objects([e2.pk])
+        self.assertEqual(
+            sorted(v.cache.keys()),
+            sorted(['%s:5' % pk for pk, objects in related.items()
+                    if pk != e2.pk and e2 not in objects]))
+        self.assertIn(e2, related[e1.pk])
+
     def test_raw_clean(self):
         v = ModelVectorBuilder(queryset=Entry.objects.none(), fields=['title'])
         self.assertEqual(v.raw_clean('<p>HTML Content</p>'),
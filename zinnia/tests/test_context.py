@@ -6,6 +6,7 @@ from django.test import TestCase
 from zinnia.context import get_context_first_matching_object
 from zinnia.context import get_context_first_object
 from zinnia.context import get_context_loop_positions
+from zinnia.paginator import KeysetPage
 
 
 class ContextTestCase(TestCase):
@@ -50,3 +51,8 @@ class ContextTestCase(TestCase):
         self.assertEqual(
             get_context_loop_positions(context),
             (25, 5))
+        context = Context({'forloop': {'counter': 5},
+                           'page_obj': KeysetPage([], None, True, True)})
+        self.assertEqual(
+            get_context_loop_positions(context),
+            (5, 5))
@@ -0,0 +1,124 @@
+"""Test cases for Zinnia's synthetic corpus generator"""
+import random
+from io import StringIO
+
+from django.contrib.sites.models import Site
+from django.core.management import CommandError
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+
+import django_comments as comments
+
+from tagging.models import Tag
+
+from zinnia.corpus import build_vocabulary
+from zinnia.corpus import generate_content
+from zinnia.corpus import generate_corpus
+from zinnia.corpus import scale_corpus
+from zinnia.flags import PINGBACK
+from zinnia.flags import TRACKBACK
+from zinnia.models.author import Author
+from zinnia.models.category import Category
+from zinnia.models.entry import Entry
+from zinnia.signals import disconnect_entry_signals
+from zinnia.tests.utils import skip_if_lib_not_available
+
+
+class CorpusTestCase(TestCase):
+
+    def setUp(self):
+        disconnect_entry_signals()
+
+    def test_build_vocabulary(self):
+        vocabulary = build_vocabulary(random.Random(42), 100)
+        self.assertEqual(len(vocabulary), 100)
+        self.assertEqual(vocabulary, sorted(set(vocabulary)))
+        self.assertEqual(vocabulary,
+                         build_vocabulary(random.Random(42), 100))
+
+    def test_generate_content(self):
+        vocabulary = build_vocabulary(random.Random(42), 100)
+        content = generate_content(random.Random(1), vocabulary, 5, 'html')
+        self.assertEqual(content, generate_content(
+            random.Random(1), vocabulary, 5, 'html'))
+        self.assertEqual(content.count('<p>'), 5)
+        self.assertEqual(content.count('<h2>'), 1)
+        self.assertEqual(content.count('<strong>'), 5)
+        self.assertEqual(content.count('<a href="http://example.com/'), 5)
+        content = generate_content(random.Random(1), vocabulary, 5,
+                                   'markdown')
+        self.assertEqual(content.count('## '), 1)
+        self.assertEqual(content.count('](http://example.com/'), 5)
+
+    @skip_if_lib_not_available('docutils')
+    def test_generate_content_restructuredtext(self):
+        from docutils.core import publish_doctree
+        vocabulary = build_vocabulary(random.Random(42), 100)
+        content = generate_content(random.Random(1), vocabulary, 9,
+                                   'restructuredtext')
+        document = publish_doctree(content, settings_overrides={
+            'report_level': 5})
+        self.assertFalse(document.parse_messages)
+
+    def test_generate_corpus(self):
+        corpus = generate_corpus(entries=20, discussions=60, categories=8,
+                                 authors=3, sites=2, tags=10)
+        self.assertEqual(corpus['entries'], 20)
+        self.assertEqual(Entry.objects.count(), 20)
+        self.assertEqual(Category.objects.count(), 8)
+        self.assertEqual(Author.objects.count(), 3)
+        self.assertEqual(Site.objects.count(), 2)
+        self.assertTrue(Entry.published.count())
+
+        for category in Category.objects.all():
+            self.assertEqual(category.tree_path, category.build_tree_path())
+            self.assertEqual(category.level, len(category.get_ancestors()))
+
+        discussions = comments.get_model().objects.all()
+        self.assertEqual(discussions.count(), corpus['discussions'])
+        for entry in Entry.objects.all():
+            self.assertEqual(entry.comments.count(), entry.comment_count)
+            self.assertEqual(entry.pingbacks.count(), entry.pingback_count)
+            self.assertEqual(entry.trackbacks.count(),
+                             entry.trackback_count)
+            self.assertTrue(entry.authors.count())
+            self.assertTrue(entry.categories.count())
+            self.assertEqual(
+                sorted(entry.tags_list),
+                sorted(tag.name for tag in Tag.objects.get_for_object(entry)))
+        self.assertEqual(
+            discussions.filter(flags__flag=PINGBACK).count() +
+            discussions.filter(flags__flag=TRACKBACK).count(),
+            sum(Entry.objects.values_list('pingback_count', flat=True)) +
+            sum(Entry.objects.values_list('trackback_count', flat=True)))
+
+    def test_generate_corpus_deterministic(self):
+        values = []
+        for i in range(2):
+            with transaction.atomic():
+                generate_corpus(entries=5, discussions=10, categories=3,
+                                authors=1, sites=1, tags=5, seed=7)
+                values.append(list(Entry.objects.order_by(
+                    'slug').values_list('title', 'content', 'tags',
+                                        'status', 'comment_count')))
+                transaction.set_rollback(True)
+        self.assertEqual(values[0], values[1])
+        self.assertEqual(Entry.objects.count(), 0)
+
+    def test_scale_corpus(self):
+        self.assertEqual(scale_corpus(100000),
+                         {'entries': 100000, 'discussions': 500000,
+                          'categories': 5000, 'authors': 1000,
+                          'sites': 3, 'tags': 10000})
+        self.assertEqual(scale_corpus(10)['categories'], 5)
+
+    def test_generate_corpus_command(self):
+        out = StringIO()
+        call_command('generate_corpus', entries=10, categories=4,
+                     stdout=out)
+        self.assertTrue('10 entries' in out.getvalue())
+        self.assertTrue('4 categories' in out.getvalue())
+        self.assertEqual(Entry.objects.count(), 10)
+        self.assertRaises(CommandError, call_command,
+                          'generate_corpus', stdout=out)
@@ -0,0 +1,111 @@
+"""Test cases for Zinnia's discussion lists"""
+from django.contrib.sites.models import Site
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils import timezone
+
+import django_comments as comments
+from django_comments.models import CommentFlag
+
+from zinnia.discussions import build_discussion_lists
+from zinnia.discussions import flush_discussion_lists
+from zinnia.discussions import get_discussion_lists
+from zinnia.flags import PINGBACK
+from zinnia.flags import TRACKBACK
+from zinnia.models.author import Author
+from zinnia.models.entry import Entry
+from zinnia.signals import connect_discussion_signals
+from zinnia.signals import disconnect_discussion_signals
+from zinnia.signals import disconnect_entry_signals
+from zinnia.tests.utils import skip_if_custom_user
+
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'discussions': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'discussions',
+    }
+}
+
+
+@skip_if_custom_user
+@override_settings(CACHES=LOCMEM_CACHES)
+class DiscussionListsTestCase(TestCase):
+
+    def setUp(self):
+        disconnect_entry_signals()
+        disconnect_discussion_signals()
+        self.site = Site.objects.get_current()
+        self.author = Author.objects.create_user(
+            username='webmaster', email='webmaster@example.com')
+        self.entry = Entry.objects.create(
+            title='My entry', content='My content', slug='my-entry')
+        flush_discussion_lists(self.entry.pk)
+
+    def create_discussion(self, name, flag=None, **kwargs):
+        discussion = comments.get_model().objects.create(
+            comment=name, content_object=self.entry,
+            submit_date=timezone.now(), site=self.site, **kwargs)
+        if flag:
+            discussion.flags.create(user=self.author, flag=flag)
+        return discussion
+
+    def check_discussion_lists(self, discussion_lists, expected):
+        self.assertEqual(
+            dict((key, [discussion.comment for discussion in discussions])
+                 for key, discussions in discussion_lists.items()),
+            expected)
+
+    def test_build_discussion_lists(self):
+        self.create_discussion('Comment 1')
+        self.create_discussion('Comment 2', is_public=False)
+        self.create_discussion('Comment 3', CommentFlag.MODERATOR_APPROVAL,
+                               user=self.author)
+        self.create_discussion('Comment 4', CommentFlag.SUGGEST_REMOVAL)
+        self.create_discussion('Pingback 1', PINGBACK)
+        self.create_discussion('Trackback 1', TRACKBACK)
+        with self.assertNumQueries(1):
+            discussion_lists = build_discussion_lists(self.entry)
+            self.assertEqual(
+                discussion_lists['comments'][1].user.username, 'webmaster')
+        self.check_discussion_lists(
+            discussion_lists,
+            {'comments': ['Comment 1', 'Comment 3'],
+             'pingbacks': ['Pingback 1'],
+             'trackbacks': ['Trackback 1']})
+        for key in ('comments', 'pingbacks', 'trackbacks'):
+            self.assertEqual(
+                [discussion.pk for discussion in discussion_lists[key]],
+                list(getattr(self.entry, key).values_list('pk', flat=True)))
+
+    def test_get_discussion_lists(self):
+        self.create_discussion('Comment 1')
+        with self.assertNumQueries(1):
+            get_discussion_lists(self.entry)
+        self.create_discussion('Comment 2')
+        with self.assertNumQueries(0):
+            self.check_discussion_lists(
+                self.entry.discussion_lists,
+                {'comments': ['Comment 1'],
+                 'pingbacks': [], 'trackbacks': []})
+        flush_discussion_lists(self.entry.pk)
+        self.check_discussion_lists(
+            get_discussion_lists(self.entry),
+            {'comments': ['Comment 1', 'Comment 2'],
+             'pingbacks': [], 'trackbacks': []})
+
+    def test_flush_discussions_signals(self):
+        connect_discussion_signals()
+        comment = self.create_discussion('Comment 1')
+        self.assertEqual(len(get_discussion_lists(self.entry)['comments']), 1)
+        comment.is_public = False
+        comment.save()
+        self.assertEqual(len(get_discussion_lists(self.entry)['comments']), 0)
+        pingback = self.create_discussion('Pingback 1', PINGBACK)
+        self.assertEqual(len(get_discussion_lists(self.entry)['pingbacks']), 1)
+        pingback.delete()
+        self.assertEqual(len(get_discussion_lists(self.entry)['pingbacks']), 0)
+        disconnect_discussion_signals()
@@ -20,6 +20,7 @@ from zinnia.managers import PUBLISHED
 from zinnia.models.author import Author
 from zinnia.models.entry import Entry
 from zinnia.models_bases import entry
+from zinnia.models_bases.entry import build_entry_url
 from zinnia.signals import disconnect_discussion_signals
 from zinnia.signals import disconnect_entry_signals
 from zinnia.tests.utils import datetime
@@ -566,3 +567,33 @@ class EntryAbsoluteUrlTestCase(TestCase):
                                     '/2013/01/01/my-entry/')
         self.check_get_absolute_url(datetime(2013, 1, 1, 23, 0),
                                     '/2013/01/02/my-entry/')
+
+    @override_settings(USE_TZ=True, TIME_ZONE='Europe/Paris')
+    def test_get_absolute_url_memoized(self):
+        build_entry_url.cache_clear()
+        entry = Entry.objects.create(
+            title='My entry', slug='my-entry',
+            publication_date=datetime(2013, 1, 1, 23, 0))
+        url = entry.get_absolute_url()
+        self.assertEqual(entry.get_absolute_url(), url)
+        self.assertEqual(build_entry_url.cache_info().hits, 1)
+        with timezone.override('UTC'):
+            self.assertEqual(entry.get_absolute_url(),
+                             '/2013/01/01/my-entry/')
+        entry.slug = 'my-new-entry'
+        entry.save()
+        self.assertEqual(entry.get_absolute_url(),
+                         '/2013/01/02/my-new-entry/')
+
+    @override_settings(ROOT_URLCONF='zinnia.tests.implementations.urls.i18n')
+    def test_get_absolute_url_memoized_language(self):
+        entry = Entry.objects.create(
+            title='My entry', slug='my-entry',
+            publication_date=datetime(2013, 1, 1, 12, 0))
+        activate('en')
+        self.assertEqual(entry.get_absolute_url(),
+                         '/en/2013/01/01/my-entry/')
+        activate('fr')
+        self.assertEqual(entry.get_absolute_url(),
+                         '/fr/2013/01/01/my-entry/')
+        deactivate()
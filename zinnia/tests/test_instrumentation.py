@@ -0,0 +1,169 @@
+"""Test cases for Zinnia's instrumentation"""
+from django.contrib.sites.models import Site
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.template import Context
+from django.template import Engine
+from django.template import Library
+from django.template import Template
+from django.test import RequestFactory
+from django.test import TestCase
+
+from zinnia import instrumentation
+from zinnia import metrics
+from zinnia import middleware
+from zinnia.instrumentation import InstrumentedCache
+from zinnia.instrumentation import Report
+from zinnia.instrumentation import current_report
+from zinnia.instrumentation import instrument
+from zinnia.instrumentation import instrument_cache
+from zinnia.instrumentation import instrument_library
+from zinnia.instrumentation import instrumented
+from zinnia.metrics.backends import memory
+from zinnia.middleware import InstrumentationMiddleware
+
+
+def count_sites():
+    return Site.objects.count()
+
+
+class InstrumentationTestCase(TestCase):
+
+    def setUp(self):
+        self.original_instrumentation = instrumentation.INSTRUMENTATION
+        instrumentation.INSTRUMENTATION = True
+        self.report = Report()
+        self.token = current_report.set(self.report)
+
+    def tearDown(self):
+        current_report.reset(self.token)
+        instrumentation.INSTRUMENTATION = self.original_instrumentation
+
+    def test_instrument(self):
+        self.assertEqual(instrument('tag', 'count', count_sites), 1)
+        self.assertEqual(instrument('tag', 'count', count_sites), 1)
+        record = self.report.records['tag', 'count']
+        self.assertEqual(record.calls, 2)
+        self.assertEqual(record.queries, 2)
+        self.assertTrue(record.time >= record.query_time > 0)
+        self.assertEqual(self.report.stack, [])
+        current_report.set(None)
+        self.assertEqual(instrument('tag', 'other', count_sites), 1)
+        self.assertFalse(('tag', 'other') in self.report.records)
+
+    def test_instrument_nested(self):
+        def nested():
+            return instrument('tag', 'inner', count_sites) + count_sites()
+
+        self.assertEqual(instrument('tag', 'outer', nested), 2)
+        self.assertEqual(self.report.records['tag', 'outer'].queries, 2)
+        self.assertEqual(self.report.records['tag', 'inner'].queries, 1)
+
+    def test_instrumented(self):
+        function = instrumented('mixin')(count_sites)
+        self.assertFalse(function is count_sites)
+        self.assertEqual(function(), 1)
+        self.assertEqual(
+            self.report.records['mixin', 'count_sites'].as_dict()['calls'], 1)
+        instrumentation.INSTRUMENTATION = False
+        self.assertTrue(instrumented('mixin')(count_sites) is count_sites)
+
+    def test_instrument_library(self):
+        library = Library()
+        library.simple_tag(count_sites)
+        self.assertTrue(instrument_library(library) is library)
+        engine = Engine()
+        engine.template_libraries['test'] = library
+        template = Template('{% load test %}{% count_sites %}',
+                            engine=engine)
+        self.assertEqual(template.render(Context()), '1')
+        record = self.report.records['tag', 'count_sites']
+        self.assertEqual(record.calls, 1)
+        self.assertEqual(record.queries, 1)
+
+    def test_instrument_cache(self):
+        cache = caches['default']
+        cache.set('key', 'value')
+        instrumented_cache = instrument_cache(cache)
+        self.assertTrue(isinstance(instrumented_cache, InstrumentedCache))
+
+        def read():
+            return (instrumented_cache.get('key'),
+                    instrumented_cache.get('missing', 'default'),
+                    instrumented_cache.get_many(['key', 'missing']))
+
+        self.assertEqual(instrument('tag', 'cache', read),
+                         ('value', 'default', {'key': 'value'}))
+        record = self.report.records['tag', 'cache']
+        self.assertEqual(record.cache_hits, 2)
+        self.assertEqual(record.cache_misses, 2)
+        instrumented_cache.set('key', 'other')
+        self.assertEqual(cache.get('key'), 'other')
+        current_report.set(None)
+        self.assertEqual(instrumented_cache.get('missing', 'default'),
+                         'default')
+        cache.delete('key')
+        instrumentation.INSTRUMENTATION = False
+        self.assertTrue(instrument_cache(cache) is cache)
+
+
+class InstrumentationMiddlewareTestCase(TestCase):
+
+    def setUp(self):
+        self.original_instrumentation = middleware.INSTRUMENTATION
+        self.original_backends = metrics.METRICS_BACKENDS
+        middleware.INSTRUMENTATION = True
+        metrics.METRICS_BACKENDS = ['zinnia.metrics.backends.memory',
+                                    'zinnia.metrics.backends.logger']
+        del memory.packets[:]
+        self.request = RequestFactory().get('/')
+
+    def tearDown(self):
+        middleware.INSTRUMENTATION = self.original_instrumentation
+        metrics.METRICS_BACKENDS = self.original_backends
+        del memory.packets[:]
+
+    def test_disabled(self):
+        middleware.INSTRUMENTATION = False
+        self.assertRaises(MiddlewareNotUsed, InstrumentationMiddleware,
+                          lambda request: HttpResponse())
+
+    def test_call(self):
+        def get_response(request):
+            instrument('tag', 'count_sites', count_sites)
+            response = HttpResponse()
+            response['Server-Timing'] = 'app;dur=1'
+            return response
+
+        with self.assertLogs('zinnia.instrumentation', 'INFO') as logs:
+            response = InstrumentationMiddleware(get_response)(self.request)
+        self.assertEqual(current_report.get(), None)
+        server_timing = response['Server-Timing'].split(', ')
+        self.assertEqual(len(server_timing), 3)
+        self.assertEqual(server_timing[0], 'app;dur=1')
+        self.assertTrue(server_timing[1].startswith('zinnia.request;dur='))
+        self.assertTrue(server_timing[2].startswith(
+            'zinnia.tag.count_sites;dur='))
+        self.assertTrue('desc="calls=1 queries=1 query_time='
+                        in server_timing[2])
+        self.assertEqual(len(logs.records), 2)
+        self.assertEqual(logs.records[1].metrics['name'], 'count_sites')
+        self.assertEqual(logs.records[1].path, '/')
+        self.assertEqual(len(memory.packets), 1)
+        self.assertTrue('zinnia.tag.count_sites.queries:1|c'
+                        in memory.packets[0])
+
+    def test_call_not_instrumented(self):
+        response = InstrumentationMiddleware(
+            lambda request: HttpResponse())(self.request)
+        self.assertFalse(response.has_header('Server-Timing'))
+        self.assertEqual(memory.packets, [])
+
+    def test_zinnia_view(self):
+        with self.settings(MIDDLEWARE=[
+                'zinnia.middleware.InstrumentationMiddleware']):
+            response = self.client.get('/humans.txt')
+        self.assertTrue(response['Server-Timing'].startswith(
+            'zinnia.request.zinnia.humans;dur='))
+        self.assertEqual(len(memory.packets), 1)
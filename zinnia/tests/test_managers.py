@@ -1,9 +1,12 @@
 """Test cases for Zinnia's managers"""
 from django.contrib.sites.models import Site
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from tagging.models import Tag
 
+from zinnia.managers import DRAFT
 from zinnia.managers import PUBLISHED
 from zinnia.managers import entries_published
 from zinnia.managers import tags_published
@@ -73,6 +76,29 @@ class ManagersTestCase(TestCase):
         self.entry_2.save()
         self.assertEqual(Category.published.count(), 3)
 
+    def test_related_published_manager_with_count_entries_published(self):
+        self.assertEqual(
+            [(category.slug, category.count_entries_published)
+             for category in Category.published.with_count_entries_published(
+             ).order_by('slug')],
+            [('category-1', 1), ('category-2', 1)])
+        self.entry_2.status = PUBLISHED
+        self.entry_2.save()
+        self.assertEqual(
+            [(author.username, author.count_entries_published)
+             for author in Author.published.with_count_entries_published(
+             ).order_by('username')],
+            [('contributor', 1), ('webmaster', 2)])
+
+    def test_related_published_manager_query(self):
+        with CaptureQueriesContext(connection) as context:
+            list(Category.published.with_count_entries_published())
+        self.assertEqual(len(context.captured_queries), 1)
+        sql = context.captured_queries[0]['sql']
+        self.assertIn('EXISTS', sql)
+        self.assertNotIn('DISTINCT', sql)
+        self.assertNotIn('GROUP BY', sql)
+
     def test_entries_published(self):
         self.assertEqual(entries_published(Entry.objects.all()).count(), 1)
         self.entry_2.status = PUBLISHED
@@ -123,6 +149,31 @@ class ManagersTestCase(TestCase):
         self.entry_1.sites.clear()
         self.assertEqual(Entry.published.on_site().count(), 0)
 
+    def test_entry_published_manager_random(self):
+        with self.assertNumQueries(2):
+            self.assertEqual(Entry.published.random(), [self.entry_1])
+        self.assertEqual(Entry.published.random(5), [self.entry_1])
+        self.entry_2.status = PUBLISHED
+        self.entry_2.save()
+        params = {'title': 'My entry 3', 'content': 'My content 3',
+                  'slug': 'my-entry-3', 'status': PUBLISHED}
+        entry_3 = Entry.objects.create(**params)
+        entry_3.sites.add(self.sites[0])
+        picked = set()
+        for i in range(30):
+            entries = Entry.published.random(2)
+            self.assertEqual(len(entries), 2)
+            self.assertNotEqual(entries[0], entries[1])
+            picked.update(entries)
+        self.assertEqual(picked, set([self.entry_1, self.entry_2, entry_3]))
+        with self.assertNumQueries(3):
+            self.assertEqual(len(Entry.published.random(2)), 2)
+        self.assertEqual(len(Entry.published.random(5)), 3)
+        self.assertEqual(Entry.published.random(0), [])
+        Entry.objects.update(status=DRAFT)
+        with self.assertNumQueries(1):
+            self.assertEqual(Entry.published.random(), [])
+
     def test_entry_published_manager_basic_search(self):
         self.assertEqual(Entry.published.basic_search('My ').count(), 1)
         self.entry_2.status = PUBLISHED
@@ -1,16 +1,37 @@
 """Test cases for Zinnia's markups"""
 import builtins
+import threading
 import warnings
+from io import StringIO
 
+from django.core.management import call_command
 from django.test import TestCase
+from django.test.utils import override_settings
 
 from zinnia import markups
+from zinnia.markups import cached_html_format
+from zinnia.markups import converters
+from zinnia.markups import get_cache_backend
+from zinnia.markups import get_cache_key
 from zinnia.markups import html_format
+from zinnia.markups import html_format_many
 from zinnia.markups import markdown
+from zinnia.markups import render_many
 from zinnia.markups import restructuredtext
 from zinnia.markups import textile
+from zinnia.models.entry import Entry
 from zinnia.tests.utils import skip_if_lib_not_available
 
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'markups': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'markups',
+    }
+}
+
 
 class MarkupsTestCase(TestCase):
     text = 'Hello *World* !'
@@ -81,6 +102,56 @@ class MarkupsTestCase(TestCase):
         )
 
 
+class MarkupConvertersTestCase(TestCase):
+
+    def setUp(self):
+        converters.clear()
+
+    def test_get(self):
+        self.assertEqual(converters.get('key', list), [])
+        converter = converters.get('key', list)
+        self.assertTrue(converters.get('key', dict) is converter)
+        thread_converters = []
+        thread = threading.Thread(target=lambda: thread_converters.append(
+            converters.get('key', list)))
+        thread.start()
+        thread.join()
+        self.assertFalse(thread_converters[0] is converter)
+        converters.clear()
+        self.assertFalse(converters.get('key', list) is converter)
+
+    @skip_if_lib_not_available('textile')
+    def test_textile_isolation(self):
+        text = 'Note[#n1]\n\nnote#n1. Note\n\nnotelist.'
+        html = textile(text)
+        other_html = textile(text)
+        self.assertIn('>1</span>', other_html)
+        self.assertNotIn('>2</span>', other_html)
+        self.assertNotEqual(html, other_html)
+        self.assertEqual(len(converters.converters), 0)
+
+    @skip_if_lib_not_available('markdown')
+    def test_markdown_reset(self):
+        extensions = ['markdown.extensions.footnotes']
+        text = 'Note[^1]\n\n[^1]: Footnote'
+        html = markdown(text, extensions)
+        self.assertEqual(markdown('Hello', extensions), '<p>Hello</p>')
+        self.assertEqual(markdown(text, extensions), html)
+        self.assertEqual(len(converters.converters), 1)
+        markdown('Hello')
+        self.assertEqual(len(converters.converters), 2)
+
+    @skip_if_lib_not_available('docutils')
+    def test_restructuredtext_reset(self):
+        text = 'Title\n=====\n\nContent'
+        html = restructuredtext(text)
+        self.assertEqual(restructuredtext(text), html)
+        self.assertEqual(restructuredtext('Hello').strip(), '<p>Hello</p>')
+        self.assertEqual(len(converters.converters), 1)
+        restructuredtext('Hello', {'cloak_email_addresses': True})
+        self.assertEqual(len(converters.converters), 2)
+
+
 class MarkupFailImportTestCase(TestCase):
     exclude_list = ['textile', 'markdown', 'docutils']
 
@@ -146,6 +217,85 @@ class HtmlFormatTestCase(TestCase):
             '<p>Hello<br />world!</p>'
         )
 
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_cached_html_format(self):
+        markups.MARKUP_LANGUAGE = None
+        cache = get_cache_backend()
+        cache.clear()
+        self.assertEqual(cached_html_format(''), '')
+        self.assertEqual(cached_html_format('Content'), '<p>Content</p>')
+        self.assertEqual(cache.get(get_cache_key('Content')),
+                         '<p>Content</p>')
+        cache.set(get_cache_key('Content'), '<p>Cached</p>')
+        self.assertEqual(cached_html_format('Content'), '<p>Cached</p>')
+        entry = Entry(content='Content', lead='Lead')
+        self.assertEqual(entry.html_content, '<p>Cached</p>')
+        self.assertEqual(entry.html_lead, '<p>Lead</p>')
+        cache.clear()
+
+    def test_get_cache_key(self):
+        original_extensions = markups.MARKDOWN_EXTENSIONS
+        original_settings = markups.RESTRUCTUREDTEXT_SETTINGS
+        markups.MARKUP_LANGUAGE = 'markdown'
+        key = get_cache_key('Content')
+        self.assertTrue(key.startswith('zinnia:markup:markdown:'))
+        markups.MARKDOWN_EXTENSIONS = ['markdown.extensions.toc']
+        self.assertNotEqual(get_cache_key('Content'), key)
+        markups.MARKUP_LANGUAGE = 'restructuredtext'
+        key = get_cache_key('Content')
+        markups.RESTRUCTUREDTEXT_SETTINGS = {'cloak_email_addresses': True}
+        self.assertNotEqual(get_cache_key('Content'), key)
+        markups.MARKDOWN_EXTENSIONS = original_extensions
+        markups.RESTRUCTUREDTEXT_SETTINGS = original_settings
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_html_format_many(self):
+        markups.MARKUP_LANGUAGE = None
+        cache = get_cache_backend()
+        cache.delete_many([get_cache_key('Content'),
+                           get_cache_key('Content</p>')])
+        self.assertEqual(html_format_many(['Content', 'Content</p>']),
+                         ['<p>Content</p>', 'Content</p>'])
+        self.assertEqual(cache.get(get_cache_key('Content')),
+                         '<p>Content</p>')
+        cache.set(get_cache_key('Content'), '<p>Cached</p>')
+        self.assertEqual(html_format_many(['Content', 'Content']),
+                         ['<p>Cached</p>', '<p>Cached</p>'])
+        markups.MARKUP_LANGUAGE = 'html'
+        self.assertEqual(html_format_many(['Content']),
+                         ['<p>Content</p>'])
+        cache.delete(get_cache_key('Content'))
+        markups.MARKUP_LANGUAGE = None
+        cache.delete(get_cache_key('Content'))
+
+    def test_render_many(self):
+        markups.MARKUP_LANGUAGE = None
+        values = ['Content %i' % i for i in range(5)] + ['Content</p>']
+        expected = ['<p>Content %i</p>' % i for i in range(5)] + [
+            'Content</p>']
+        self.assertEqual(render_many(values), expected)
+        self.assertEqual(render_many(values, processes=2), expected)
+        self.assertEqual(render_many([], processes=2), [])
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_warm_markup_cache(self):
+        markups.MARKUP_LANGUAGE = None
+        Entry.objects.create(title='1', slug='1', content='Content 1',
+                             lead='Lead 1')
+        Entry.objects.create(title='2', slug='2', content='Content 2')
+        cache = get_cache_backend()
+        keys = [get_cache_key(value)
+                for value in ('Content 1', 'Lead 1', 'Content 2')]
+        cache.delete_many(keys)
+        out = StringIO()
+        call_command('warm_markup_cache', batch_size=1, stdout=out)
+        self.assertEqual(out.getvalue(), '3 contents rendered.\n')
+        self.assertEqual(cache.get_many(keys),
+                         {keys[0]: '<p>Content 1</p>',
+                          keys[1]: '<p>Lead 1</p>',
+                          keys[2]: '<p>Content 2</p>'})
+        cache.delete_many(keys)
+
     @skip_if_lib_not_available('textile')
     def test_html_content_textitle(self):
         markups.MARKUP_LANGUAGE = 'textile'
@@ -2,6 +2,7 @@
 from tempfile import TemporaryFile
 from xmlrpc.client import Binary
 from xmlrpc.client import Fault
+from xmlrpc.client import MultiCall
 from xmlrpc.client import ServerProxy
 
 from django.contrib.sites.models import Site
@@ -21,7 +22,10 @@ from zinnia.signals import disconnect_entry_signals
 from zinnia.tests.utils import TestTransport
 from zinnia.tests.utils import datetime
 from zinnia.tests.utils import skip_if_custom_user
+from zinnia.xmlrpc import metaweblog
 from zinnia.xmlrpc.metaweblog import authenticate
+from zinnia.xmlrpc.metaweblog import get_cache_backend
+from zinnia.xmlrpc.metaweblog import get_or_create_categories
 from zinnia.xmlrpc.metaweblog import post_structure
 
 
@@ -87,6 +91,65 @@ class MetaWeblogTestCase(TestCase):
                                       'zinnia.change_entry'),
                          self.webmaster)
 
+    @override_settings(CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'xmlrpc': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'xmlrpc'}})
+    def test_authenticate_cache(self):
+        get_cache_backend().clear()
+        self.assertRaises(Fault, authenticate, 'webmaster', 'badpassword')
+        with self.assertNumQueries(1):
+            self.assertEqual(authenticate('webmaster', 'password'),
+                             self.webmaster)
+        with self.assertNumQueries(1):
+            self.assertEqual(authenticate('webmaster', 'password'),
+                             self.webmaster)
+        self.assertRaises(Fault, authenticate, 'webmaster', 'badpassword')
+
+        self.assertRaises(Fault, authenticate, 'contributor', 'password')
+        self.contributor.is_staff = True
+        self.contributor.save()
+        authenticate('contributor', 'password')
+        with self.assertNumQueries(3):
+            self.assertRaises(Fault, authenticate, 'contributor',
+                              'password', 'zinnia.change_entry')
+        with self.assertNumQueries(1):
+            self.assertRaises(Fault, authenticate, 'contributor',
+                              'password', 'zinnia.change_entry')
+        self.contributor.is_staff = False
+        self.contributor.save()
+        self.assertRaises(Fault, authenticate, 'contributor', 'password')
+
+        self.webmaster.set_password('new-password')
+        self.webmaster.save()
+        self.assertRaises(Fault, authenticate, 'webmaster', 'password')
+        self.assertEqual(authenticate('webmaster', 'new-password'),
+                         self.webmaster)
+
+        original_timeout = metaweblog.XMLRPC_AUTH_CACHE_TIMEOUT
+        metaweblog.XMLRPC_AUTH_CACHE_TIMEOUT = 0
+        get_cache_backend().clear()
+        authenticate('webmaster', 'new-password')
+        self.assertEqual(len(get_cache_backend()._cache), 0)
+        metaweblog.XMLRPC_AUTH_CACHE_TIMEOUT = original_timeout
+
+    def test_authenticate_multicall(self):
+        multicall = MultiCall(self.server)
+        multicall.blogger.getUsersBlogs('apikey', 'webmaster', 'password')
+        multicall.wp.getAuthors('apikey', 'webmaster', 'password')
+        multicall.wp.getAuthors('apikey', 'webmaster', 'password')
+        with self.assertNumQueries(3):
+            results = list(multicall())
+        self.assertEqual(results[0][0]['blogName'], 'example.com')
+        self.assertEqual(len(results[1]), 1)
+        self.assertEqual(len(results[2]), 1)
+        results = self.server.system.multicall([
+            {'methodName': 'wp.getAuthors',
+             'params': ['apikey', 'webmaster', 'badpassword']}])
+        self.assertEqual(results[0]['faultCode'], 801)
+
     def test_get_users_blogs(self):
         self.assertRaises(Fault, self.server.blogger.getUsersBlogs,
                           'apikey', 'contributor', 'password')
@@ -208,8 +271,15 @@ class MetaWeblogTestCase(TestCase):
     def test_get_recent_posts(self):
         self.assertRaises(Fault, self.server.metaWeblog.getRecentPosts,
                           1, 'contributor', 'password', 10)
-        self.assertEqual(len(self.server.metaWeblog.getRecentPosts(
-            1, 'webmaster', 'password', 10)), 2)
+        with self.assertNumQueries(4):
+            posts = self.server.metaWeblog.getRecentPosts(
+                1, 'webmaster', 'password', 10)
+        self.assertEqual(len(posts), 2)
+        self.assertEqual(posts[0]['categories'], ['Category 1'])
+        self.assertEqual(posts[0]['description'], '<p>My content 2</p>')
+        self.assertEqual(posts[0]['userid'], 'webmaster')
+        self.assertEqual(posts[1]['categories'], ['Category 1', 'Category 2'])
+        self.assertEqual(posts[1]['link'], posts[1]['permaLink'])
 
     def test_delete_post(self):
         self.assertRaises(Fault, self.server.blogger.deletePost,
@@ -322,6 +392,48 @@ class MetaWeblogTestCase(TestCase):
         self.assertEqual(entry.creation_date, datetime(2000, 1, 1))
         self.assertEqual(entry.publication_date, datetime(2000, 1, 1))
 
+    def test_get_or_create_categories(self):
+        child = Category.objects.create(title='Child', slug='child',
+                                        parent=self.categories[1])
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                get_or_create_categories(['Category 2', 'Child']),
+                [self.categories[1], child])
+        categories = get_or_create_categories(
+            ['Zeta', 'Category 1', 'Alpha', 'Zeta'])
+        self.assertEqual([category.title for category in categories],
+                         ['Zeta', 'Category 1', 'Alpha'])
+        self.assertEqual(Category.objects.count(), 5)
+        self.assertEqual(
+            [(category.title, category.tree_id, category.level,
+              category.lft, category.rght)
+             for category in Category.objects.order_by('tree_id', 'lft')],
+            [('Alpha', 1, 0, 1, 2),
+             ('Category 1', 2, 0, 1, 2),
+             ('Category 2', 3, 0, 1, 4),
+             ('Child', 3, 1, 2, 3),
+             ('Zeta', 4, 0, 1, 2)])
+        self.assertEqual([category.tree_path for category in categories],
+                         ['zeta', 'category-1', 'alpha'])
+        self.assertEqual(categories[0].get_absolute_url(),
+                         '/categories/zeta/')
+        self.assertEqual(Category.objects.get(slug='alpha').get_absolute_url(),
+                         '/categories/alpha/')
+        self.assertEqual(get_or_create_categories(''), [])
+
+    def test_edit_post_categories(self):
+        post = post_structure(self.entry_1, self.site)
+        self.server.metaWeblog.editPost(
+            self.entry_1.pk, 'webmaster', 'password', post, 1)
+        self.assertEqual(list(self.entry_1.categories.all()),
+                         self.categories)
+        post['categories'] = ['Category 2', 'New category']
+        self.server.metaWeblog.editPost(
+            self.entry_1.pk, 'webmaster', 'password', post, 1)
+        self.assertEqual(
+            [category.title for category in self.entry_1.categories.all()],
+            ['Category 2', 'New category'])
+
     def test_new_media_object(self):
         file_ = TemporaryFile()
         file_.write('My test content'.encode('utf-8'))
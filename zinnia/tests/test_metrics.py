@@ -0,0 +1,106 @@
+"""Test cases for Zinnia's metrics backends"""
+import socket
+import warnings
+
+from django.test import RequestFactory
+from django.test import TestCase
+
+from zinnia import metrics
+from zinnia.metrics import load_metrics_backend
+from zinnia.metrics import metric_name
+from zinnia.metrics import send_metrics
+from zinnia.metrics.backends import memory
+from zinnia.metrics.backends import statsd
+from zinnia.metrics.backends.statsd import build_packets
+from zinnia.metrics.backends.statsd import format_metrics
+
+RECORD = {'kind': 'tag', 'name': 'get_tag_cloud', 'calls': 1,
+          'queries': 2, 'query_time': 1.5, 'time': 3.25,
+          'cache_hits': 1, 'cache_misses': 0}
+
+
+class MetricsTestCase(TestCase):
+
+    def setUp(self):
+        self.original_backends = metrics.METRICS_BACKENDS
+        self.request = RequestFactory().get('/')
+        del memory.packets[:]
+
+    def tearDown(self):
+        metrics.METRICS_BACKENDS = self.original_backends
+        del memory.packets[:]
+
+    def test_metric_name(self):
+        self.assertEqual(metric_name('zinnia', 'request', 'zinnia:humans'),
+                         'zinnia.request.zinnia.humans')
+        self.assertEqual(metric_name('zinnia', 'request', '/2010/01/'),
+                         'zinnia.request._2010_01')
+        self.assertEqual(metric_name('a|b', 'c@d'), 'a_b.c_d')
+
+    def test_load_metrics_backend(self):
+        self.assertEqual(load_metrics_backend(
+            'zinnia.metrics.backends.memory'), memory.backend)
+        with warnings.catch_warnings(record=True) as w:
+            self.assertEqual(load_metrics_backend(
+                'zinnia.metrics.backends.unknown'), None)
+            self.assertEqual(
+                str(w[-1].message),
+                'zinnia.metrics.backends.unknown backend cannot be imported')
+
+    def test_send_metrics(self):
+        metrics.METRICS_BACKENDS = ['zinnia.metrics.backends.memory',
+                                    'zinnia.metrics.backends.unknown']
+        with warnings.catch_warnings(record=True):
+            send_metrics([RECORD], self.request)
+        self.assertEqual(memory.packets, [format_metrics([RECORD])])
+
+    def test_format_metrics(self):
+        self.assertEqual(format_metrics([RECORD], 'blog'), [
+            'blog.tag.get_tag_cloud.calls:1|c',
+            'blog.tag.get_tag_cloud.queries:2|c',
+            'blog.tag.get_tag_cloud.cache_hits:1|c',
+            'blog.tag.get_tag_cloud.cache_misses:0|c',
+            'blog.tag.get_tag_cloud.query_time:1.5|ms',
+            'blog.tag.get_tag_cloud.time:3.25|ms'])
+
+    def test_build_packets(self):
+        self.assertEqual(build_packets([]), [])
+        self.assertEqual(build_packets(['a:1|c', 'b:2|c']),
+                         [b'a:1|c\nb:2|c'])
+        lines = ['%s:1|c' % ('x' * 100) for i in range(30)]
+        packets = build_packets(lines)
+        self.assertEqual(len(packets), 3)
+        for packet in packets:
+            self.assertTrue(len(packet) <= statsd.MAX_PACKET_SIZE)
+        self.assertEqual(b'\n'.join(packets).decode('utf-8').split('\n'),
+                         lines)
+
+    def test_statsd_backend(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(('127.0.0.1', 0))
+        server.settimeout(5)
+        original_host = statsd.METRICS_STATSD_HOST
+        original_port = statsd.METRICS_STATSD_PORT
+        statsd.METRICS_STATSD_HOST, statsd.METRICS_STATSD_PORT = \
+            server.getsockname()
+        try:
+            statsd.backend([RECORD], self.request)
+            packet = server.recv(statsd.MAX_PACKET_SIZE)
+        finally:
+            server.close()
+            statsd.get_socket().close()
+            statsd.get_socket.cache_clear()
+            statsd.METRICS_STATSD_HOST = original_host
+            statsd.METRICS_STATSD_PORT = original_port
+        self.assertEqual(packet.decode('utf-8').split('\n'),
+                         format_metrics([RECORD]))
+
+    def test_statsd_backend_error(self):
+        original_host = statsd.METRICS_STATSD_HOST
+        statsd.METRICS_STATSD_HOST = 'invalid host name'
+        try:
+            statsd.backend([RECORD], self.request)
+        finally:
+            statsd.get_socket().close()
+            statsd.get_socket.cache_clear()
+            statsd.METRICS_STATSD_HOST = original_host
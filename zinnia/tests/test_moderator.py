@@ -13,6 +13,7 @@ from django_comments.moderation import moderator as moderator_stack
 from zinnia.managers import PUBLISHED
 from zinnia.models.author import Author
 from zinnia.models.entry import Entry
+from zinnia.models.outbox import QueuedMail
 from zinnia.moderator import EntryCommentModerator
 from zinnia.signals import connect_discussion_signals
 from zinnia.signals import disconnect_discussion_signals
@@ -160,6 +161,48 @@ class CommentModeratorTestCase(TestCase):
             set(mail.outbox[1].bcc),
             set(['user_1@example.com', 'user_2@example.com']))
 
+    def test_do_email_reply_recipients_query(self):
+        for i in range(3):
+            comments.get_model().objects.create(
+                comment='My Comment %i' % i, is_public=True,
+                user_email='user_%i@example.com' % (i % 2),
+                content_object=self.entry, submit_date=timezone.now(),
+                site=self.site)
+        comment = comments.get_model().objects.create(
+            comment='My Comment', user=self.author, is_public=True,
+            content_object=self.entry, submit_date=timezone.now(),
+            site=self.site)
+        moderator = EntryCommentModerator(Entry)
+        moderator.email_reply = True
+        moderator.mail_comment_notification_recipients = []
+        with self.assertNumQueries(2):
+            moderator.do_email_reply(comment, self.entry, self.site)
+        self.assertEqual(
+            set(mail.outbox[0].bcc),
+            set(['user_0@example.com', 'user_1@example.com']))
+
+    def test_email_queue(self):
+        comments.get_model().objects.create(
+            comment='My Comment 1', user_email='user@example.com',
+            content_object=self.entry, is_public=True,
+            submit_date=timezone.now(), site=self.site)
+        comment = comments.get_model().objects.create(
+            comment='My Comment 2', user_email='other@example.com',
+            content_object=self.entry, is_public=True,
+            submit_date=timezone.now(), site=self.site)
+        moderator = EntryCommentModerator(Entry)
+        moderator.email_reply = True
+        moderator.email_authors = True
+        moderator.mail_comment_notification_recipients = [
+            'webmaster@example.com']
+        moderator.mail_comment_queue = True
+        moderator.email(comment, self.entry, 'request')
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(
+            list(QueuedMail.objects.values_list('recipient', flat=True)),
+            ['admin@example.com', 'user@example.com',
+             'webmaster@example.com'])
+
     def test_moderate(self):
         comment = comments.get_model().objects.create(
             comment='My Comment', user=self.author, is_public=True,
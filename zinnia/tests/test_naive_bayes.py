@@ -0,0 +1,211 @@
+"""Test cases for Zinnia's naive Bayes spam checker"""
+from io import StringIO
+
+from django.contrib.sites.models import Site
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+import django_comments as comments
+from django_comments.models import CommentFlag
+from django_comments.signals import comment_was_flagged
+
+from zinnia import settings
+from zinnia.managers import PUBLISHED
+from zinnia.models.author import Author
+from zinnia.models.entry import Entry
+from zinnia.models.spam import SpamToken
+from zinnia.signals import NAIVE_BAYES_BACKEND
+from zinnia.signals import connect_discussion_signals
+from zinnia.signals import disconnect_discussion_signals
+from zinnia.signals import disconnect_entry_signals
+from zinnia.spam_checker.backends import naive_bayes
+from zinnia.spam_checker.backends.naive_bayes import NaiveBayesClassifier
+from zinnia.spam_checker.backends.naive_bayes import TOTAL_TOKEN
+from zinnia.spam_checker.backends.naive_bayes import backend
+from zinnia.spam_checker.backends.naive_bayes import flush_classifier
+from zinnia.spam_checker.backends.naive_bayes import get_classifier
+from zinnia.spam_checker.backends.naive_bayes import load_classifier
+from zinnia.spam_checker.backends.naive_bayes import save_classifier
+from zinnia.spam_checker.backends.naive_bayes import tokenize
+from zinnia.tests.utils import skip_if_custom_user
+
+SPAMS = ['Buy cheap pills online at http://pills.example.com',
+         'Cheap pills, best price, buy now',
+         'Casino bonus, win money now at http://casino.example.com']
+HAMS = ['Thank you for this great article about Django',
+        'I think the article misses a point about the templates',
+        'Great article, the part about the templates helped me']
+
+
+class FakeComment(object):
+
+    def __init__(self, comment, user_name='', user_email=''):
+        self.comment = comment
+        self.user_name = user_name
+        self.user_email = user_email
+
+
+class NaiveBayesClassifierTestCase(TestCase):
+    """Test cases for zinnia.spam_checker.backends.naive_bayes"""
+
+    def setUp(self):
+        self.original_min_training = naive_bayes.SPAM_CLASSIFIER_MIN_TRAINING
+        naive_bayes.SPAM_CLASSIFIER_MIN_TRAINING = 2
+        self.classifier = NaiveBayesClassifier()
+        for spam in SPAMS:
+            self.classifier.train(tokenize(FakeComment(spam)), True)
+        for ham in HAMS:
+            self.classifier.train(tokenize(FakeComment(ham)), False)
+
+    def tearDown(self):
+        naive_bayes.SPAM_CLASSIFIER_MIN_TRAINING = self.original_min_training
+
+    def test_tokenize(self):
+        tokens = tokenize(FakeComment('Buy, buy http://a.com !', 'Bob',
+                                      'bob@example.com'))
+        self.assertEqual(len(tokens), 5)
+        self.assertEqual(set(token for token in tokens if ':' not in token),
+                         set(['buy', 'http', 'a.com']))
+        self.assertFalse([token for token in tokens if 'bob' in token])
+        self.assertEqual(tokenize(FakeComment('', 'BOB')),
+                         tokenize(FakeComment('', 'bob')))
+
+    def test_is_trained(self):
+        self.assertTrue(self.classifier.is_trained)
+        self.assertFalse(NaiveBayesClassifier().is_trained)
+        self.assertFalse(NaiveBayesClassifier().is_spam(
+            tokenize(FakeComment(SPAMS[0]))))
+
+    def test_is_spam(self):
+        self.assertTrue(self.classifier.is_spam(
+            tokenize(FakeComment('Buy cheap pills now'))))
+        self.assertFalse(self.classifier.is_spam(
+            tokenize(FakeComment('Great article about the templates'))))
+        probability = self.classifier.spam_probability(
+            tokenize(FakeComment('Unknown words only')))
+        self.assertTrue(0 < probability < 1)
+
+    def test_prune(self):
+        tokens_count = len(self.classifier.tokens)
+        self.classifier.prune(2)
+        self.assertTrue(len(self.classifier.tokens) < tokens_count)
+        self.assertEqual(self.classifier.tokens['pills'], [2, 0])
+
+    def test_save_load_classifier(self):
+        save_classifier(self.classifier)
+        tokens = ['pills', 'article', 'unknown']
+        with self.assertNumQueries(1):
+            classifier = load_classifier(tokens)
+        self.assertEqual(classifier.spams, 3)
+        self.assertEqual(classifier.hams, 3)
+        self.assertEqual(classifier.tokens,
+                         {'pills': [2, 0], 'article': [0, 3]})
+        save_classifier(self.classifier)
+        classifier = load_classifier(tokens)
+        self.assertEqual(classifier.spams, 6)
+        self.assertEqual(classifier.tokens,
+                         {'pills': [4, 0], 'article': [0, 6]})
+        self.assertEqual(SpamToken.objects.count(),
+                         len(self.classifier.tokens) + 1)
+
+    def test_get_classifier(self):
+        flush_classifier()
+        with self.assertNumQueries(1):
+            classifier = get_classifier()
+        self.assertEqual(classifier.spams, 0)
+        with self.assertNumQueries(0):
+            self.assertTrue(get_classifier() is classifier)
+        save_classifier(self.classifier)
+        with self.assertNumQueries(1):
+            classifier = get_classifier()
+        self.assertEqual(classifier.spams, 3)
+        self.assertEqual(classifier.tokens['pills'], [2, 0])
+        with self.assertNumQueries(0):
+            self.assertTrue(classifier.is_spam(
+                tokenize(FakeComment('Buy cheap pills now'))))
+
+
+@skip_if_custom_user
+class NaiveBayesBackendTestCase(TestCase):
+    """Test cases for the naive Bayes backend and its training"""
+
+    def setUp(self):
+        disconnect_entry_signals()
+        disconnect_discussion_signals()
+        self.original_min_training = naive_bayes.SPAM_CLASSIFIER_MIN_TRAINING
+        self.original_backends = settings.SPAM_CHECKER_BACKENDS
+        naive_bayes.SPAM_CLASSIFIER_MIN_TRAINING = 2
+        settings.SPAM_CHECKER_BACKENDS = [NAIVE_BAYES_BACKEND]
+        flush_classifier()
+
+        self.site = Site.objects.get_current()
+        self.author = Author.objects.create(username='admin',
+                                            email='admin@example.com')
+        self.entry = Entry.objects.create(title='My test entry',
+                                          slug='my-test-entry',
+                                          status=PUBLISHED)
+        self.entry.sites.add(self.site)
+
+    def tearDown(self):
+        naive_bayes.SPAM_CLASSIFIER_MIN_TRAINING = self.original_min_training
+        settings.SPAM_CHECKER_BACKENDS = self.original_backends
+        disconnect_discussion_signals()
+
+    def create_comments(self):
+        for spam in SPAMS:
+            comments.get_model().objects.create(
+                comment=spam, is_public=False, is_removed=True,
+                content_object=self.entry, site=self.site,
+                submit_date=timezone.now())
+        for ham in HAMS:
+            comments.get_model().objects.create(
+                comment=ham, is_public=True,
+                content_object=self.entry, site=self.site,
+                submit_date=timezone.now())
+
+    def test_train_on_moderation(self):
+        connect_discussion_signals()
+        comment_klass = comments.get_model()
+        for text, flag in [(SPAMS[0], CommentFlag.MODERATOR_DELETION),
+                           (SPAMS[1], CommentFlag.MODERATOR_DELETION),
+                           (HAMS[0], CommentFlag.MODERATOR_APPROVAL),
+                           (HAMS[1], CommentFlag.MODERATOR_APPROVAL),
+                           (HAMS[2], CommentFlag.SUGGEST_REMOVAL)]:
+            comment = comment_klass.objects.create(
+                comment=text, content_object=self.entry, site=self.site,
+                submit_date=timezone.now())
+            comment_flag = comment.flags.create(user=self.author, flag=flag)
+            comment_was_flagged.send(
+                sender=comment_klass, comment=comment, flag=comment_flag,
+                created=True, request=None)
+
+        totals = SpamToken.objects.get(token=TOTAL_TOKEN)
+        self.assertEqual(totals.spams, 2)
+        self.assertEqual(totals.hams, 2)
+        self.assertEqual(SpamToken.objects.get(token='pills').spams, 2)
+        self.assertTrue(backend(FakeComment('Cheap pills now'),
+                                self.entry, None))
+        self.assertFalse(backend(FakeComment('Thank you for the article'),
+                                 self.entry, None))
+
+    def test_spam_train_command(self):
+        self.create_comments()
+        out = StringIO()
+        call_command('spam_train', stdout=out)
+        self.assertTrue('trained on 3 spams and 3 hams' in out.getvalue())
+        self.assertEqual(SpamToken.objects.get(token=TOTAL_TOKEN).spams, 3)
+        self.assertTrue(backend(FakeComment('Cheap pills now'),
+                                self.entry, None))
+        call_command('spam_train', stdout=out)
+        self.assertEqual(SpamToken.objects.get(token=TOTAL_TOKEN).spams, 3)
+
+    def test_spam_train_command_evaluate(self):
+        self.create_comments()
+        out = StringIO()
+        call_command('spam_train', evaluate=True, test_ratio=0.5,
+                     stdout=out)
+        self.assertTrue('Trained on 3 comments, tested on 3 comments'
+                        in out.getvalue())
+        self.assertTrue('microseconds per comment' in out.getvalue())
+        self.assertFalse(SpamToken.objects.exists())
@@ -0,0 +1,88 @@
+"""Test cases for Zinnia's outbox"""
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase
+
+from zinnia.models.outbox import QueuedMail
+from zinnia.outbox import queue_mail
+from zinnia.outbox import send_queued_mails
+
+
+class FailingEmailBackend(EmailBackend):
+    """Email backend failing to send the messages"""
+
+    def send_messages(self, messages):
+        raise IOError('Connection refused')
+
+
+class PartialEmailBackend(EmailBackend):
+    """Email backend failing to send the messages to b@example.com"""
+
+    def send_messages(self, messages):
+        self.queued = QueuedMail.objects.count()
+        if messages[0].to == ['b@example.com']:
+            raise IOError('Mailbox unavailable')
+        return super(PartialEmailBackend, self).send_messages(messages)
+
+
+class OutboxTestCase(TestCase):
+    """Test cases for zinnia.outbox"""
+
+    def test_queue_mail(self):
+        queue_mail('Subject', 'Message',
+                   ['b@example.com', 'a@example.com', 'a@example.com'])
+        self.assertEqual(
+            list(QueuedMail.objects.values_list(
+                'recipient', 'subject', 'message')),
+            [('a@example.com', 'Subject', 'Message'),
+             ('b@example.com', 'Subject', 'Message')])
+
+    def test_send_queued_mails(self):
+        self.assertEqual(send_queued_mails(), 0)
+        queue_mail('Subject 1', 'Message 1', ['a@example.com'])
+        queue_mail('Subject 2', 'Message 2',
+                   ['a@example.com', 'b@example.com'])
+        self.assertEqual(send_queued_mails(), 2)
+        self.assertEqual(QueuedMail.objects.count(), 0)
+        self.assertEqual(len(mail.outbox), 2)
+        digest, single = mail.outbox
+        self.assertEqual(digest.to, ['a@example.com'])
+        self.assertEqual(digest.subject, '[example.com] 2 new notifications')
+        self.assertEqual(
+            digest.body,
+            'Subject 1\n=========\n\nMessage 1\n\n'
+            'Subject 2\n=========\n\nMessage 2')
+        self.assertEqual(single.to, ['b@example.com'])
+        self.assertEqual(single.subject, 'Subject 2')
+        self.assertEqual(single.body, 'Message 2')
+
+    def test_send_queued_mails_limit(self):
+        queue_mail('Subject', 'Message',
+                   ['a@example.com', 'b@example.com'])
+        self.assertEqual(send_queued_mails(limit=1), 1)
+        self.assertEqual(mail.outbox[0].to, ['a@example.com'])
+        self.assertEqual(
+            list(QueuedMail.objects.values_list('recipient', flat=True)),
+            ['b@example.com'])
+
+    def test_send_queued_mails_error(self):
+        queue_mail('Subject', 'Message', ['a@example.com'])
+        self.assertRaises(IOError, send_queued_mails,
+                          connection=FailingEmailBackend())
+        self.assertEqual(QueuedMail.objects.count(), 1)
+        self.assertEqual(send_queued_mails(), 1)
+        self.assertEqual(QueuedMail.objects.count(), 0)
+
+    def test_send_queued_mails_partial_error(self):
+        queue_mail('Subject', 'Message',
+                   ['a@example.com', 'b@example.com', 'c@example.com'])
+        connection = PartialEmailBackend()
+        self.assertRaises(IOError, send_queued_mails,
+                          connection=connection)
+        self.assertEqual(connection.queued, 0)
+        self.assertEqual([message.to for message in mail.outbox],
+                         [['a@example.com'], ['c@example.com']])
+        self.assertEqual(
+            list(QueuedMail.objects.values_list(
+                'recipient', 'subject', 'message')),
+            [('b@example.com', 'Subject', 'Message')])
@@ -0,0 +1,186 @@
+"""Test cases for Zinnia's paginators"""
+from django.contrib.sites.models import Site
+from django.core.paginator import EmptyPage
+from django.core.paginator import InvalidPage
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from zinnia import settings
+from zinnia.managers import PUBLISHED
+from zinnia.models.category import Category
+from zinnia.models.entry import Entry
+from zinnia.paginator import CachedCountPaginator
+from zinnia.paginator import KeysetPaginator
+from zinnia.paginator import flush_cached_counts
+from zinnia.paginator import get_count_generation
+from zinnia.signals import connect_entry_signals
+from zinnia.signals import disconnect_entry_signals
+from zinnia.signals import entries_were_updated
+from zinnia.tests.utils import datetime
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'paginator': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'paginator',
+    }
+}
+
+
+class KeysetPaginatorTestCase(TestCase):
+
+    def setUp(self):
+        disconnect_entry_signals()
+        site = Site.objects.get_current()
+        self.entries = []
+        for i, day in enumerate([1, 2, 2, 2, 3, 4, 5]):
+            entry = Entry.objects.create(
+                title='Entry %s' % i, slug='entry-%s' % i,
+                status=PUBLISHED,
+                publication_date=datetime(2010, 1, day, 12))
+            entry.sites.add(site)
+            self.entries.append(entry)
+        self.ordered_entries = sorted(
+            self.entries, key=lambda e: (e.publication_date, e.pk),
+            reverse=True)
+        self.paginator = KeysetPaginator(Entry.published.all(), 3)
+
+    def test_cursor(self):
+        entry = self.entries[2]
+        cursor = self.paginator.encode_cursor(entry)
+        self.assertEqual(self.paginator.decode_cursor(cursor),
+                         (entry.publication_date, entry.pk))
+        for cursor in ('', 'invalid', 'aW52YWxpZA', 'MjAxMHwx'):
+            self.assertRaises(InvalidPage,
+                              self.paginator.decode_cursor, cursor)
+
+    def test_page(self):
+        with self.assertNumQueries(1):
+            page = self.paginator.page()
+        self.assertEqual(page.object_list, self.ordered_entries[:3])
+        self.assertEqual(page.number, None)
+        self.assertFalse(page.has_previous())
+        self.assertTrue(page.has_next())
+        self.assertEqual(page.previous_cursor, None)
+
+        pages = [page]
+        while page.has_next():
+            with self.assertNumQueries(1):
+                page = self.paginator.page(after=page.next_cursor)
+            pages.append(page)
+        self.assertEqual(
+            [entry for page in pages for entry in page.object_list],
+            self.ordered_entries)
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(len(pages[-1]), 1)
+        self.assertTrue(pages[-1].has_previous())
+        self.assertEqual(pages[-1].next_cursor, None)
+
+        while page.has_previous():
+            with self.assertNumQueries(1):
+                page = self.paginator.page(before=page.previous_cursor)
+            self.assertEqual(page.object_list, pages.pop(-2).object_list)
+        self.assertTrue(page.has_next())
+        self.assertEqual(page.object_list, self.ordered_entries[:3])
+
+    def test_page_before_newest(self):
+        cursor = self.paginator.encode_cursor(self.ordered_entries[0])
+        page = self.paginator.page(before=cursor)
+        self.assertEqual(page.object_list, self.ordered_entries[:3])
+        self.assertFalse(page.has_previous())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedCountPaginatorTestCase(TestCase):
+
+    def setUp(self):
+        disconnect_entry_signals()
+        flush_cached_counts()
+        self.site = Site.objects.get_current()
+        for i in range(5):
+            self.create_published_entry('entry-%s' % i)
+
+    def create_published_entry(self, slug):
+        entry = Entry.objects.create(
+            title=slug, slug=slug, status=PUBLISHED)
+        entry.sites.add(self.site)
+        return entry
+
+    def test_count(self):
+        queryset = Entry.published.all()
+        with self.assertNumQueries(1):
+            self.assertEqual(CachedCountPaginator(queryset, 2).count, 5)
+        with self.assertNumQueries(1):
+            self.assertEqual(CachedCountPaginator(queryset, 2).count, 5)
+        with self.assertNumQueries(1):
+            self.assertEqual(CachedCountPaginator(
+                queryset, 2, cache_key='key').count, 5)
+        self.create_published_entry('entry-5')
+        with self.assertNumQueries(0):
+            self.assertEqual(CachedCountPaginator(
+                queryset, 2, cache_key='key').count, 5)
+        with self.assertNumQueries(1):
+            self.assertEqual(CachedCountPaginator(
+                queryset, 2, cache_key='other').count, 6)
+        flush_cached_counts()
+        with self.assertNumQueries(1):
+            self.assertEqual(CachedCountPaginator(
+                queryset, 2, cache_key='key').count, 6)
+
+    def test_count_threshold(self):
+        queryset = Entry.published.order_by('slug')
+        paginator = CachedCountPaginator(queryset, 2, threshold=3)
+        self.assertTrue(paginator.is_estimated)
+        self.assertEqual(paginator.count, 3)
+        self.assertEqual(paginator.num_pages, 2)
+        page = paginator.page(2)
+        self.assertEqual([e.slug for e in page], ['entry-2', 'entry-3'])
+        self.assertTrue(page.has_next())
+        page = paginator.page(page.next_page_number())
+        self.assertEqual(page.number, 3)
+        self.assertEqual([e.slug for e in page], ['entry-4'])
+        self.assertFalse(page.has_next())
+        self.assertRaises(EmptyPage, paginator.page, 4)
+        self.assertRaises(EmptyPage, paginator.page, 0)
+        self.assertRaises(InvalidPage, paginator.page, 'invalid')
+        paginator = CachedCountPaginator(queryset, 2, threshold=5)
+        self.assertFalse(paginator.is_estimated)
+        self.assertEqual(paginator.count, 5)
+        self.assertRaises(EmptyPage, paginator.page, 4)
+        paginator = CachedCountPaginator(queryset, 2, threshold=10)
+        self.assertFalse(paginator.is_estimated)
+        self.assertEqual(paginator.count, 5)
+
+    def test_flush_cached_counts_signals(self):
+        original_save_ping_directories = settings.SAVE_PING_DIRECTORIES
+        original_save_ping_external_urls = settings.SAVE_PING_EXTERNAL_URLS
+        settings.SAVE_PING_DIRECTORIES = False
+        settings.SAVE_PING_EXTERNAL_URLS = False
+        connect_entry_signals()
+        entry = Entry.objects.get(slug='entry-0')
+
+        generation = get_count_generation()
+        entry.comment_count = 2
+        entry.save(update_fields=['comment_count'])
+        entries_were_updated.send(sender=Entry, entries=[entry.pk],
+                                  fields=['featured'], request=None)
+        self.assertEqual(get_count_generation(), generation)
+        actions = [
+            lambda: entry.save(),
+            lambda: entry.categories.add(
+                Category.objects.create(title='Tests', slug='tests')),
+            lambda: Category.objects.get(slug='tests').delete(),
+            lambda: entry.sites.clear(),
+            lambda: entries_were_updated.send(
+                sender=Entry, entries=[entry.pk],
+                fields=['status'], request=None),
+            lambda: entry.delete()]
+        for action in actions:
+            generation = get_count_generation()
+            action()
+            self.assertNotEqual(get_count_generation(), generation)
+        disconnect_entry_signals()
+        settings.SAVE_PING_DIRECTORIES = original_save_ping_directories
+        settings.SAVE_PING_EXTERNAL_URLS = original_save_ping_external_urls
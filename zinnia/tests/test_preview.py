@@ -1,8 +1,11 @@
 # coding=utf-8
 """Test cases for Zinnia's preview"""
 from django.test import TestCase
+from django.test.utils import override_settings
 
 from zinnia.preview import HTMLPreview
+from zinnia.preview import get_cache_backend
+from zinnia.preview import get_html_preview
 
 
 class HTMLPreviewTestCase(TestCase):
@@ -83,3 +86,48 @@ class HTMLPreviewTestCase(TestCase):
         preview = HTMLPreview('', '')
         self.assertEqual(str(preview), '')
         self.assertEqual(preview.has_more, False)
+
+    def test_truncate_plain_text(self):
+        text = 'Hello  World,\nhello dude'
+        preview = HTMLPreview(text, splitters=[],
+                              max_words=2, more_string=' ...')
+        self.assertEqual(str(preview), 'Hello  World, ...')
+        self.assertEqual(preview.has_more, True)
+        self.assertEqual(preview.total_words, 4)
+        self.assertEqual(preview.displayed_words, 2)
+        preview = HTMLPreview(text, splitters=[],
+                              max_words=4, more_string=' ...')
+        self.assertEqual(str(preview), text)
+        self.assertEqual(preview.has_more, False)
+
+
+@override_settings(
+    CACHES={'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'previews': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'previews'}})
+class GetHTMLPreviewTestCase(TestCase):
+
+    def setUp(self):
+        get_cache_backend().clear()
+
+    def test_get_html_preview(self):
+        text = '<p>Hello World</p><!-- more --><p>Hello dude</p>'
+        preview = get_html_preview(text)
+        self.assertEqual(str(preview), '<p>Hello World ...</p>')
+        self.assertEqual(preview.total_words, 3)
+        self.assertEqual(get_cache_backend().get(preview.cache_key),
+                         {'preview': '<p>Hello World ...</p>',
+                          'total_words': 3, 'displayed_words': 2})
+
+        get_cache_backend().set(preview.cache_key, {
+            'preview': 'Cached', 'total_words': 8, 'displayed_words': 1})
+        preview = get_html_preview(text)
+        self.assertEqual(str(preview), 'Cached')
+        self.assertEqual(preview.has_more, True)
+        self.assertEqual(preview.remaining_words, 7)
+
+        preview = get_html_preview(text, '<p>Lead</p>')
+        self.assertEqual(str(preview), '<p>Lead</p>')
+        self.assertEqual(preview.total_words, 4)
@@ -3,14 +3,22 @@ from django.test import TestCase
 
 import zinnia.signals
 from zinnia import settings
+from zinnia.comparison import EntryPublishedVectorBuilder
 from zinnia.managers import DRAFT
 from zinnia.managers import PUBLISHED
 from zinnia.models.entry import Entry
+from zinnia.signals import connect_entry_signals
 from zinnia.signals import disable_for_loaddata
 from zinnia.signals import disconnect_discussion_signals
 from zinnia.signals import disconnect_entry_signals
+from zinnia.signals import flush_archive_index_handler
+from zinnia.signals import flush_cached_counts_handler
+from zinnia.signals import flush_discussions_handler
+from zinnia.signals import flush_entry_caches
+from zinnia.signals import flush_similar_cache_entries_handler
 from zinnia.signals import ping_directories_handler
 from zinnia.signals import ping_external_urls_handler
+from zinnia.signals import suppress_signals
 
 
 class SignalsTestCase(TestCase):
@@ -33,6 +41,50 @@ class SignalsTestCase(TestCase):
         call()
         self.assertEqual(self.top, 1)
         # Okay the command is executed
+        make_top(raw=True)
+        self.assertEqual(self.top, 1)
+
+    def test_suppress_signals(self):
+        self.top = 0
+
+        @disable_for_loaddata
+        def make_top(**kwargs):
+            self.top += 1
+
+        @suppress_signals()
+        def bulk():
+            make_top()
+
+        with suppress_signals():
+            make_top()
+            with suppress_signals():
+                make_top()
+            make_top()
+        bulk()
+        self.assertEqual(self.top, 0)
+        make_top()
+        self.assertEqual(self.top, 1)
+
+        original_ping_directories = settings.PING_DIRECTORIES
+        original_save_ping_directories = settings.SAVE_PING_DIRECTORIES
+        original_save_ping_external_urls = settings.SAVE_PING_EXTERNAL_URLS
+        settings.PING_DIRECTORIES = ('toto',)
+        settings.SAVE_PING_DIRECTORIES = True
+        settings.SAVE_PING_EXTERNAL_URLS = False
+        original_pinger = zinnia.signals.DirectoryPinger
+        zinnia.signals.DirectoryPinger = lambda *ka, **kw: make_top()
+        connect_entry_signals()
+        entry = Entry.objects.create(title='My entry', slug='my-entry',
+                                     status=PUBLISHED)
+        self.assertEqual(self.top, 2)
+        with suppress_signals():
+            entry.save()
+        self.assertEqual(self.top, 2)
+        disconnect_entry_signals()
+        zinnia.signals.DirectoryPinger = original_pinger
+        settings.PING_DIRECTORIES = original_ping_directories
+        settings.SAVE_PING_DIRECTORIES = original_save_ping_directories
+        settings.SAVE_PING_EXTERNAL_URLS = original_save_ping_external_urls
 
     def test_ping_directories_handler(self):
         # Set up a stub around DirectoryPinger
@@ -92,3 +144,49 @@ class SignalsTestCase(TestCase):
 
         # Remove stub
         zinnia.signals.ExternalUrlsPinger = self.original_pinger
+
+    def test_flush_similar_cache_entries_handler(self):
+        vectors = EntryPublishedVectorBuilder()
+        self.addCleanup(vectors.cache_flush)
+        cache = {'1:5': [], '2:5': [], 'columns_dataset': ([], {})}
+
+        vectors.cache_flush()
+        vectors.cache = dict(cache)
+        flush_similar_cache_entries_handler(
+            sender=Entry, entries=[1], fields=['featured'])
+        self.assertEqual(sorted(vectors.cache.keys()),
+                         ['1:5', '2:5', 'columns_dataset'])
+        flush_similar_cache_entries_handler(
+            sender=Entry, entries=[1], fields=['content'])
+        self.assertEqual(list(vectors.cache.keys()), ['2:5'])
+
+        vectors.cache = dict(cache)
+        flush_similar_cache_entries_handler(
+            sender=Entry, entries=[1], fields=['status'])
+        self.assertEqual(vectors.cache, {})
+
+    def test_flush_handlers_suppressed(self):
+        flushes = []
+        originals = {}
+        for name in ('flush_archive_index', 'flush_cached_counts',
+                     'flush_discussion_lists'):
+            originals[name] = getattr(zinnia.signals, name)
+            setattr(zinnia.signals, name,
+                    lambda *ka, name=name: flushes.append(name))
+        entry = Entry.objects.create(title='My entry', slug='my-entry')
+        kwargs = {'instance': entry, 'entry': entry}
+
+        with suppress_signals():
+            flush_archive_index_handler(sender=Entry, **kwargs)
+            flush_cached_counts_handler(sender=Entry, **kwargs)
+            flush_discussions_handler(sender=Entry, **kwargs)
+        flush_archive_index_handler(sender=Entry, raw=True, **kwargs)
+        self.assertEqual(flushes, [])
+        flush_entry_caches()
+        self.assertEqual(flushes, ['flush_archive_index',
+                                   'flush_cached_counts'])
+        flush_discussions_handler(sender=Entry, **kwargs)
+        self.assertEqual(flushes[-1], 'flush_discussion_lists')
+
+        for name, original in originals.items():
+            setattr(zinnia.signals, name, original)
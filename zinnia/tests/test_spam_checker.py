@@ -1,15 +1,40 @@
 """Test cases for Zinnia's spam_checker"""
 import warnings
 
+from django.core.cache import cache
 from django.test import TestCase
 
+from zinnia import spam_checker
+from zinnia.spam_checker import check_is_spam
 from zinnia.spam_checker import get_spam_checker
+from zinnia.spam_checker import get_spam_checkers
+from zinnia.spam_checker import get_statistics
+from zinnia.spam_checker import reset_statistics
 from zinnia.spam_checker.backends.all_is_spam import backend
 
+LONG_ENOUGH = 'zinnia.spam_checker.backends.long_enough'
+ALL_IS_SPAM = 'zinnia.spam_checker.backends.all_is_spam'
+REMOTE = 'zinnia.tests.implementations.remote_spam_checker'
+
+
+class FakeComment(object):
+
+    def __init__(self, comment):
+        self.comment = comment
+        self.user_name = 'Jim Bob'
+
+
+class FakeEntry(object):
+    pk = 1
+
 
 class SpamCheckerTestCase(TestCase):
     """Test cases for zinnia.spam_checker"""
 
+    def setUp(self):
+        cache.clear()
+        reset_statistics()
+
     def test_get_spam_checker(self):
         with warnings.catch_warnings(record=True) as w:
             self.assertEqual(get_spam_checker('mymodule.myclass'), None)
@@ -30,3 +55,73 @@ class SpamCheckerTestCase(TestCase):
         self.assertEqual(
             get_spam_checker('zinnia.spam_checker.backends.all_is_spam'),
             backend)
+
+    def test_get_spam_checkers(self):
+        with warnings.catch_warnings(record=True):
+            local_checkers, remote_checkers = get_spam_checkers(
+                (REMOTE, 'mymodule.myclass', ALL_IS_SPAM, LONG_ENOUGH))
+        self.assertEqual([path for path, checker in local_checkers],
+                         [ALL_IS_SPAM, LONG_ENOUGH])
+        self.assertEqual([path for path, checker in remote_checkers],
+                         [REMOTE])
+        self.assertEqual(local_checkers[0][1], backend)
+
+    def test_check_is_spam(self):
+        entry = FakeEntry()
+        self.assertFalse(check_is_spam(
+            FakeComment('spam'), entry, None, []))
+        self.assertFalse(check_is_spam(
+            FakeComment('This is a valid comment'), entry, None,
+            [LONG_ENOUGH, REMOTE]))
+        self.assertTrue(check_is_spam(
+            FakeComment('Short'), entry, None,
+            [LONG_ENOUGH, REMOTE]))
+        self.assertTrue(check_is_spam(
+            FakeComment('This is a spam comment'), entry, None,
+            [LONG_ENOUGH, REMOTE]))
+        statistics = get_statistics()
+        self.assertEqual(statistics[LONG_ENOUGH]['calls'], 3)
+        self.assertEqual(statistics[LONG_ENOUGH]['spams'], 1)
+        self.assertEqual(statistics[LONG_ENOUGH]['hams'], 2)
+        self.assertEqual(statistics[REMOTE]['calls'], 2)
+        self.assertEqual(statistics[REMOTE]['spams'], 1)
+        self.assertEqual(statistics[REMOTE]['hams'], 1)
+        self.assertTrue(statistics[REMOTE]['average_time'] >= 0)
+
+    def test_check_is_spam_local_first(self):
+        self.assertTrue(check_is_spam(
+            FakeComment('This is a spam comment'), FakeEntry(), None,
+            [REMOTE, ALL_IS_SPAM]))
+        statistics = get_statistics()
+        self.assertEqual(statistics[ALL_IS_SPAM]['spams'], 1)
+        self.assertFalse(REMOTE in statistics)
+
+    def test_check_is_spam_cache(self):
+        comment = FakeComment('Short')
+        self.assertTrue(check_is_spam(comment, FakeEntry(), None,
+                                      [LONG_ENOUGH]))
+        self.assertTrue(check_is_spam(comment, FakeEntry(), None,
+                                      [LONG_ENOUGH]))
+        self.assertEqual(get_statistics()[LONG_ENOUGH]['calls'], 1)
+        comment.user_name = 'John Doe'
+        self.assertTrue(check_is_spam(comment, FakeEntry(), None,
+                                      [LONG_ENOUGH]))
+        self.assertEqual(get_statistics()[LONG_ENOUGH]['calls'], 2)
+
+        original_cache_timeout = spam_checker.SPAM_CHECKER_CACHE_TIMEOUT
+        spam_checker.SPAM_CHECKER_CACHE_TIMEOUT = 0
+        self.assertTrue(check_is_spam(comment, FakeEntry(), None,
+                                      [LONG_ENOUGH]))
+        self.assertEqual(get_statistics()[LONG_ENOUGH]['calls'], 3)
+        spam_checker.SPAM_CHECKER_CACHE_TIMEOUT = original_cache_timeout
+
+    def test_check_is_spam_timeout(self):
+        original_timeout = spam_checker.SPAM_CHECKER_TIMEOUT
+        spam_checker.SPAM_CHECKER_TIMEOUT = 0.05
+        comment = FakeComment('This is a slow spam comment')
+        self.assertFalse(check_is_spam(comment, FakeEntry(), None,
+                                       [REMOTE]))
+        self.assertEqual(get_statistics()[REMOTE]['timeouts'], 1)
+        spam_checker.SPAM_CHECKER_TIMEOUT = original_timeout
+        self.assertTrue(check_is_spam(comment, FakeEntry(), None,
+                                      [REMOTE]))
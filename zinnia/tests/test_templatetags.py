@@ -24,6 +24,9 @@ from zinnia.managers import PUBLISHED
 from zinnia.models.author import Author
 from zinnia.models.category import Category
 from zinnia.models.entry import Entry
+from zinnia.paginator import CachedCountPaginator
+from zinnia.paginator import KeysetPage
+from zinnia.paginator import KeysetPaginator
 from zinnia.signals import disconnect_discussion_signals
 from zinnia.signals import disconnect_entry_signals
 from zinnia.signals import flush_similar_cache_handler
@@ -195,18 +198,18 @@ class TemplateTagsTestCase(TestCase):
         self.assertEqual(len(context['entries']), 0)
 
     def test_get_random_entries(self):
-        with self.assertNumQueries(0):
+        with self.assertNumQueries(1):
             context = get_random_entries()
         self.assertEqual(len(context['entries']), 0)
         self.assertEqual(context['template'],
                          'zinnia/tags/entries_random.html')
 
         self.publish_entry()
-        with self.assertNumQueries(0):
+        with self.assertNumQueries(2):
             context = get_random_entries(3, 'custom_template.html')
         self.assertEqual(len(context['entries']), 1)
         self.assertEqual(context['template'], 'custom_template.html')
-        with self.assertNumQueries(0):
+        with self.assertNumQueries(1):
             context = get_random_entries(0)
         self.assertEqual(len(context['entries']), 0)
 
@@ -315,7 +318,7 @@ class TemplateTagsTestCase(TestCase):
             sender=Entry, dispatch_uid='flush_cache')
 
     def test_get_archives_entries(self):
-        with self.assertNumQueries(0):
+        with self.assertNumQueries(2):
             context = get_archives_entries()
         self.assertEqual(len(context['archives']), 0)
         self.assertEqual(context['template'],
@@ -331,22 +334,22 @@ class TemplateTagsTestCase(TestCase):
         second_entry = Entry.objects.create(**params)
         second_entry.sites.add(self.site)
 
-        with self.assertNumQueries(0):
+        with self.assertNumQueries(2):
             context = get_archives_entries('custom_template.html')
         self.assertEqual(len(context['archives']), 2)
 
         self.assertEqual(
             context['archives'][0],
-            self.make_local(self.entry.publication_date).replace(
-                day=1, hour=0))
+            self.make_local(self.entry.publication_date).date().replace(
+                day=1))
         self.assertEqual(
             context['archives'][1],
-            self.make_local(second_entry.publication_date).replace(
-                day=1, hour=0))
+            self.make_local(second_entry.publication_date).date().replace(
+                day=1))
         self.assertEqual(context['template'], 'custom_template.html')
 
     def test_get_archives_tree(self):
-        with self.assertNumQueries(0):
+        with self.assertNumQueries(2):
             context = get_archives_entries_tree()
         self.assertEqual(len(context['archives']), 0)
         self.assertEqual(context['template'],
@@ -362,17 +365,17 @@ class TemplateTagsTestCase(TestCase):
         second_entry = Entry.objects.create(**params)
         second_entry.sites.add(self.site)
 
-        with self.assertNumQueries(0):
+        with self.assertNumQueries(2):
             context = get_archives_entries_tree('custom_template.html')
         self.assertEqual(len(context['archives']), 2)
         self.assertEqual(
             context['archives'][0],
             self.make_local(
-                second_entry.publication_date).replace(hour=0))
+                second_entry.publication_date).date())
         self.assertEqual(
             context['archives'][1],
             self.make_local(
-                self.entry.publication_date).replace(hour=0))
+                self.entry.publication_date).date())
         self.assertEqual(context['template'], 'custom_template.html')
 
     def test_get_calendar_entries_no_params(self):
@@ -753,6 +756,46 @@ class TemplateTagsTestCase(TestCase):
         self.assertEqual(list(context['middle']), [])
         self.assertEqual(list(context['end']), [5, 6, 7])
 
+    def test_zinnia_pagination_keyset(self):
+        class FakeRequest(object):
+            def __init__(self, get_dict):
+                self.GET = get_dict
+
+        source_context = Context({'request': FakeRequest(
+            {'after': 'cursor', 'key': 'val'})})
+        page = KeysetPage([], KeysetPaginator(Entry.objects.all(), 10))
+        with self.assertNumQueries(0):
+            context = zinnia_pagination(source_context, page)
+        self.assertEqual(context, {
+            'template': 'zinnia/tags/keyset_pagination.html',
+            'page': page, 'GET_string': '&key=val'})
+
+    def test_zinnia_pagination_estimated(self):
+        class FakeRequest(object):
+            def __init__(self, get_dict):
+                self.GET = get_dict
+
+        for i in range(7):
+            Entry.objects.create(title=str(i), slug='entry-%i' % i)
+        source_context = Context({'request': FakeRequest({})})
+        paginator = CachedCountPaginator(
+            Entry.objects.filter(slug__startswith='entry-'), 1, threshold=2)
+        context = zinnia_pagination(
+            source_context, paginator.page(1),
+            begin_pages=1, end_pages=1, before_pages=1, after_pages=1)
+        self.assertEqual(list(context['begin']), [1, 2])
+        context = zinnia_pagination(
+            source_context, paginator.page(5),
+            begin_pages=1, end_pages=1, before_pages=1, after_pages=1)
+        self.assertEqual(list(context['begin']), [1])
+        self.assertEqual(list(context['middle']), [])
+        self.assertEqual(list(context['end']), [4, 5, 6])
+        context = zinnia_pagination(
+            source_context, paginator.page(7),
+            begin_pages=1, end_pages=1, before_pages=1, after_pages=1)
+        self.assertEqual(list(context['middle']), [])
+        self.assertEqual(list(context['end']), [6, 7])
+
     def test_zinnia_pagination_on_my_website(self):
         """
         Reproduce the issue encountred on my website,
@@ -1,8 +1,36 @@
 """Test cases for Zinnia Template"""
+from io import StringIO
+
+from django.core.management import CommandError
+from django.core.management import call_command
+from django.template import TemplateDoesNotExist
 from django.test import TestCase
+from django.test.utils import override_settings
 
+from zinnia.templating import LoopTemplateResolver
 from zinnia.templating import append_position
+from zinnia.templating import build_template_index
+from zinnia.templating import flush_template_index
+from zinnia.templating import get_loop_template_resolver
+from zinnia.templating import get_template_index
 from zinnia.templating import loop_template_list
+from zinnia.templating import resolve_template_names
+from zinnia.templating import select_template_name
+from zinnia.templating import set_template_index
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'templates': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'templates',
+    }
+}
+
+VOID_TEMPLATES = [{
+    'BACKEND': 'django.template.backends.django.DjangoTemplates',
+    'OPTIONS': {'loaders': ['zinnia.tests.utils.VoidLoader']}}]
 
 
 class TemplateTestCase(TestCase):
@@ -52,3 +80,93 @@ class TemplateTestCase(TestCase):
         self.assertEqual(
             append_position('/path/template.html', 1, '-'),
             '/path/template-1.html')
+
+    def test_loop_template_resolver(self):
+        resolver = LoopTemplateResolver(
+            {'default': {1: 'zinnia/_entry_detail.html'}})
+        self.assertEqual(resolver.maxsize, 272)
+        template = resolver.resolve(
+            (1, 1), None, None, 'zinnia/template.html')
+        self.assertEqual(template.origin.template_name,
+                         'zinnia/_entry_detail.html')
+        self.assertEqual(resolver.select.cache_info().misses, 1)
+        self.assertEqual(resolver.resolve(
+            (1, 1), None, None, 'zinnia/template.html'), template)
+        self.assertEqual(resolver.select.cache_info().hits, 1)
+        with override_settings(DEBUG=True):
+            debug_template = resolver.resolve(
+                (1, 1), None, None, 'zinnia/template.html')
+        self.assertNotEqual(debug_template, template)
+        self.assertEqual(debug_template.origin.template_name,
+                         'zinnia/_entry_detail.html')
+        self.assertEqual(resolver.select.cache_info().hits, 2)
+        self.assertRaises(TemplateDoesNotExist, resolver.resolve,
+                          (2, 2), None, None, 'zinnia/template.html')
+        resolver.cache_clear()
+        self.assertEqual(resolver.select.cache_info().currsize, 0)
+
+    def test_get_loop_template_resolver(self):
+        registry = {}
+        resolver = get_loop_template_resolver(registry)
+        self.assertEqual(resolver.registry, registry)
+        self.assertEqual(get_loop_template_resolver(registry), resolver)
+        self.assertNotEqual(get_loop_template_resolver({}), resolver)
+        registry = {}
+        resolver = get_loop_template_resolver(registry)
+        with override_settings(TEMPLATES=[]):
+            self.assertNotEqual(
+                get_loop_template_resolver(registry), resolver)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TemplateIndexTestCase(TestCase):
+    """Tests cases for the resolution of the template names"""
+
+    def setUp(self):
+        flush_template_index()
+        select_template_name.cache_clear()
+
+    def test_build_template_index(self):
+        template_index = build_template_index()
+        self.assertTrue('zinnia/entry_list.html' in template_index)
+        self.assertTrue('zinnia/archives/entry_archive.html'
+                        not in template_index)
+        with override_settings(TEMPLATES=VOID_TEMPLATES):
+            self.assertEqual(build_template_index(), None)
+
+    def test_resolve_template_names(self):
+        template_names = ['zinnia/archives/entry_archive.html',
+                          'zinnia/entry_archive.html',
+                          'entry_archive.html']
+        self.assertEqual(resolve_template_names(template_names),
+                         ['zinnia/entry_archive.html'])
+        self.assertEqual(select_template_name.cache_info().misses, 1)
+        self.assertEqual(resolve_template_names(template_names),
+                         ['zinnia/entry_archive.html'])
+        self.assertEqual(select_template_name.cache_info().hits, 1)
+        self.assertEqual(resolve_template_names(['404.html']),
+                         ['404.html'])
+        with override_settings(DEBUG=True):
+            self.assertEqual(resolve_template_names(template_names),
+                             template_names)
+
+        set_template_index(frozenset(['entry_archive.html']))
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_template_names(template_names),
+                             ['entry_archive.html'])
+        self.assertEqual(select_template_name.cache_info().misses, 0)
+        self.assertEqual(resolve_template_names(['404.html']),
+                         ['404.html'])
+
+    def test_warm_template_cache(self):
+        out = StringIO()
+        call_command('warm_template_cache', stdout=out)
+        template_index = get_template_index()
+        self.assertTrue('zinnia/entry_list.html' in template_index)
+        self.assertTrue('%i templates cached' % len(template_index)
+                        in out.getvalue())
+        call_command('warm_template_cache', clear=True, stdout=out)
+        self.assertEqual(get_template_index(), None)
+        with override_settings(TEMPLATES=VOID_TEMPLATES):
+            self.assertRaises(CommandError, call_command,
+                              'warm_template_cache', stdout=out)
@@ -3,9 +3,11 @@ import warnings
 
 from django.test import TestCase
 from django.test.utils import override_settings
+from django.utils import translation
 
 from zinnia import url_shortener as us_settings
 from zinnia.url_shortener import get_url_shortener
+from zinnia.url_shortener import load_url_shortener
 from zinnia.url_shortener.backends import default
 
 
@@ -14,9 +16,11 @@ class URLShortenerTestCase(TestCase):
 
     def setUp(self):
         self.original_backend = us_settings.URL_SHORTENER_BACKEND
+        load_url_shortener.cache_clear()
 
     def tearDown(self):
         us_settings.URL_SHORTENER_BACKEND = self.original_backend
+        load_url_shortener.cache_clear()
 
     def test_get_url_shortener(self):
         us_settings.URL_SHORTENER_BACKEND = 'mymodule.myclass'
@@ -40,6 +44,15 @@ class URLShortenerTestCase(TestCase):
                                             '.backends.default'
         self.assertEqual(get_url_shortener(), default.backend)
 
+    def test_get_url_shortener_loaded_once(self):
+        us_settings.URL_SHORTENER_BACKEND = 'mymodule.myclass'
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            get_url_shortener()
+            get_url_shortener()
+        self.assertEqual(len(w), 1)
+        self.assertEqual(load_url_shortener.cache_info().hits, 1)
+
 
 class FakeEntry(object):
     """Fake entry with only 'pk' as attribute"""
@@ -65,6 +78,25 @@ class UrlShortenerDefaultBackendTestCase(TestCase):
                          'https://example.com/2S/')
         default.PROTOCOL = original_protocol
 
+    def test_backend_memoized(self):
+        default.build_shortlink_path.cache_clear()
+        default.backend(FakeEntry(1))
+        default.backend(FakeEntry(1))
+        self.assertEqual(default.build_shortlink_path.cache_info().hits, 1)
+        with override_settings(
+                ROOT_URLCONF='zinnia.tests.implementations.urls.poor'):
+            self.assertEqual(
+                default.build_shortlink_path.cache_info().currsize, 0)
+
+    @override_settings(ROOT_URLCONF='zinnia.tests.implementations.urls.i18n')
+    def test_backend_memoized_language(self):
+        with translation.override('en'):
+            self.assertEqual(default.backend(FakeEntry(1)),
+                             'http://example.com/en/1/')
+        with translation.override('fr'):
+            self.assertEqual(default.backend(FakeEntry(1)),
+                             'http://example.com/fr/1/')
+
     def test_base36(self):
         self.assertEqual(default.base36(1), '1')
         self.assertEqual(default.base36(100), '2S')
@@ -5,9 +5,13 @@ from datetime import date
 from django.contrib.auth.models import update_last_login
 from django.contrib.auth.signals import user_logged_in
 from django.contrib.sites.models import Site
+from django.db import connection
+from django.http import Http404
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.test.utils import override_settings
 from django.utils import timezone
+from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 
 import django_comments as comments
@@ -18,6 +22,7 @@ from zinnia.managers import PUBLISHED
 from zinnia.models.author import Author
 from zinnia.models.category import Category
 from zinnia.models.entry import Entry
+from zinnia.paginator import flush_cached_counts
 from zinnia.settings import PAGINATION
 from zinnia.signals import connect_discussion_signals
 from zinnia.signals import disconnect_discussion_signals
@@ -27,6 +32,10 @@ from zinnia.tests.utils import skip_if_custom_user
 from zinnia.tests.utils import url_equal
 from zinnia.url_shortener.backends.default import base36
 from zinnia.views import quick_entry
+from zinnia.views.archives import EntryArchiveMixin
+from zinnia.views.categories import CategoryDetail
+from zinnia.views.categories import get_category_or_404
+from zinnia.views.search import EntrySearch
 
 
 @skip_if_custom_user
@@ -157,7 +166,7 @@ class ViewsTestCase(ViewsBaseCase):
     @override_settings(USE_TZ=False)
     def test_zinnia_entry_archive_year_no_timezone(self):
         response = self.check_publishing_context(
-            '/2010/', 2, 3, 'entry_list', 3)
+            '/2010/', 2, 3, 'entry_list', 4)
         self.assertTemplateUsed(
             response, 'zinnia/archives/2010/entry_archive_year.html')
         self.assertEqual(response.context['previous_year'], None)
@@ -169,7 +178,7 @@ class ViewsTestCase(ViewsBaseCase):
     @override_settings(USE_TZ=True, TIME_ZONE='Europe/Paris')
     def test_zinnia_entry_archive_year_with_timezone(self):
         response = self.check_publishing_context(
-            '/2010/', 2, 3, 'entry_list', 3)
+            '/2010/', 2, 3, 'entry_list', 4)
         self.assertTemplateUsed(
             response, 'zinnia/archives/2010/entry_archive_year.html')
         self.assertEqual(response.context['previous_year'], None)
@@ -181,7 +190,7 @@ class ViewsTestCase(ViewsBaseCase):
     @override_settings(USE_TZ=False)
     def test_zinnia_entry_archive_week_no_timezone(self):
         response = self.check_publishing_context(
-            '/2010/week/00/', 1, 2, 'entry_list', 3)
+            '/2010/week/00/', 1, 2, 'entry_list', 4)
         self.assertTemplateUsed(
             response, 'zinnia/archives/2010/week/00/entry_archive_week.html')
         # All days in a new year preceding the first Monday
@@ -202,7 +211,7 @@ class ViewsTestCase(ViewsBaseCase):
     @override_settings(USE_TZ=True, TIME_ZONE='Europe/Paris')
     def test_zinnia_entry_archive_week_with_timezone(self):
         response = self.check_publishing_context(
-            '/2010/week/00/', 1, 2, 'entry_list', 3)
+            '/2010/week/00/', 1, 2, 'entry_list', 4)
         self.assertTemplateUsed(
             response, 'zinnia/archives/2010/week/00/entry_archive_week.html')
         # All days in a new year preceding the first Monday
@@ -223,7 +232,7 @@ class ViewsTestCase(ViewsBaseCase):
     @override_settings(USE_TZ=False)
     def test_zinnia_entry_archive_month_no_timezone(self):
         response = self.check_publishing_context(
-            '/2010/01/', 1, 2, 'entry_list', 3)
+            '/2010/01/', 1, 2, 'entry_list', 4)
         self.assertTemplateUsed(
             response, 'zinnia/archives/2010/month/01/entry_archive_month.html')
         self.assertEqual(response.context['previous_month'], None)
@@ -239,7 +248,7 @@ class ViewsTestCase(ViewsBaseCase):
     @override_settings(USE_TZ=True, TIME_ZONE='Europe/Paris')
     def test_zinnia_entry_archive_month_with_timezone(self):
         response = self.check_publishing_context(
-            '/2010/01/', 1, 2, 'entry_list', 3)
+            '/2010/01/', 1, 2, 'entry_list', 4)
         self.assertTemplateUsed(
             response, 'zinnia/archives/2010/month/01/entry_archive_month.html')
         self.assertEqual(response.context['previous_month'], None)
@@ -255,7 +264,7 @@ class ViewsTestCase(ViewsBaseCase):
     @override_settings(USE_TZ=False)
     def test_zinnia_entry_archive_day_no_timezone(self):
         response = self.check_publishing_context(
-            '/2010/01/01/', 1, 2, 'entry_list', 2)
+            '/2010/01/01/', 1, 2, 'entry_list', 3)
         self.assertTemplateUsed(
             response, 'zinnia/archives/2010/01/01/entry_archive_day.html')
         self.assertEqual(response.context['previous_month'], None)
@@ -271,7 +280,7 @@ class ViewsTestCase(ViewsBaseCase):
     @override_settings(USE_TZ=True, TIME_ZONE='Europe/Paris')
     def test_zinnia_entry_archive_day_with_timezone(self):
         response = self.check_publishing_context(
-            '/2010/01/02/', 1, 2, 'entry_list', 2)
+            '/2010/01/02/', 1, 2, 'entry_list', 3)
         self.assertTemplateUsed(
             response, 'zinnia/archives/2010/01/02/entry_archive_day.html')
         self.assertEqual(response.context['previous_month'], None)
@@ -288,7 +297,7 @@ class ViewsTestCase(ViewsBaseCase):
     def test_zinnia_entry_archive_today_no_timezone(self):
         template_name_today = 'zinnia/archives/%s/entry_archive_today.html' % \
                               date.today().strftime('%Y/%m/%d')
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(3):
             response = self.client.get('/today/')
         self.assertTemplateUsed(response, template_name_today)
         self.assertEqual(response.context['day'], date.today())
@@ -302,7 +311,7 @@ class ViewsTestCase(ViewsBaseCase):
         template_name_today = 'zinnia/archives/%s/entry_archive_today.html' % \
                               timezone.localtime(timezone.now()
                                                  ).strftime('%Y/%m/%d')
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(3):
             response = self.client.get('/today/')
         self.assertTemplateUsed(response, template_name_today)
         self.assertEqual(response.context['day'], timezone.localtime(
@@ -489,6 +498,16 @@ class ViewsTestCase(ViewsBaseCase):
             response, 'zinnia/category/tests/entry_list.html')
         self.assertEqual(response.context['category'].slug, 'tests')
 
+    def test_zinnia_category_detail_tree_path(self):
+        child = Category.objects.create(
+            title='Child', slug='child', parent=self.category)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_category_or_404('/tests/child/'), child)
+        with self.assertNumQueries(2):
+            self.assertEqual(get_category_or_404('/moved/child/'), child)
+        with self.assertNumQueries(2):
+            self.assertRaises(Http404, get_category_or_404, 'tests/unknown')
+
     def test_zinnia_category_detail_paginated(self):
         """Test case reproducing issue #42 on category
         detail view paginated"""
@@ -509,6 +528,30 @@ class ViewsTestCase(ViewsBaseCase):
         self.assertEqual(len(response.context['object_list']), 2)
         self.assertEqual(response.context['category'].slug, 'tests')
 
+    @override_settings(CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'paginator': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'paginator'}})
+    def test_zinnia_category_detail_cached_count(self):
+        flush_cached_counts()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/categories/tests/?page=1')
+        self.assertEqual(response.context['paginator'].count, 2)
+        with self.assertNumQueries(len(queries) - 1):
+            response = self.client.get('/categories/tests/?page=1')
+        self.assertEqual(response.context['paginator'].count, 2)
+        with self.assertNumQueries(len(queries) - 1):
+            response = self.client.get('/categories/tests/?page=1&q=1')
+        self.assertEqual(response.context['paginator'].count, 2)
+        self.create_published_entry()
+        response = self.client.get('/categories/tests/')
+        self.assertEqual(response.context['paginator'].count, 2)
+        flush_cached_counts()
+        response = self.client.get('/categories/tests/')
+        self.assertEqual(response.context['paginator'].count, 3)
+
     def test_zinnia_author_list(self):
         user = Author.objects.create(username='new-user',
                                      email='new_user@example.com')
@@ -594,10 +637,108 @@ class ViewsTestCase(ViewsBaseCase):
         self.assertEqual(response.context['error'],
                          _('No pattern to search found'))
 
+    def test_zinnia_keyset_pagination(self):
+        for i in range(3):
+            params = {'title': 'Entry %s' % i, 'content': 'Content %s' % i,
+                      'slug': 'entry-%s' % i, 'status': PUBLISHED,
+                      'publication_date': datetime(2011, 1, i + 1)}
+            entry = Entry.objects.create(**params)
+            entry.sites.add(self.site)
+            entry.categories.add(self.category)
+
+        views = [EntryArchiveMixin, CategoryDetail]
+        for view in views:
+            view.pagination_mode = 'keyset'
+            view.paginate_by = 3
+        try:
+            response = self.client.get('/')
+            page = response.context['page_obj']
+            self.assertTrue(response.context['is_paginated'])
+            self.assertEqual(page.number, None)
+            self.assertEqual(
+                [e.slug for e in response.context['entry_list']],
+                ['entry-2', 'entry-1', 'entry-0'])
+            self.assertTrue(page.has_next())
+            self.assertFalse(page.has_previous())
+
+            with self.assertNumQueries(4):
+                response = self.client.get(
+                    '/categories/tests/', {'after': page.next_cursor})
+            page = response.context['page_obj']
+            self.assertEqual(
+                [e.slug for e in response.context['entry_list']],
+                ['test-2', 'test-1'])
+            self.assertFalse(page.has_next())
+            self.assertTrue(page.has_previous())
+
+            response = self.client.get(
+                '/categories/tests/', {'before': page.previous_cursor})
+            self.assertEqual(
+                [e.slug for e in response.context['entry_list']],
+                ['entry-2', 'entry-1', 'entry-0'])
+
+            response = self.client.get('/', {'after': 'invalid'})
+            self.assertEqual(response.status_code, 404)
+        finally:
+            for view in views:
+                view.pagination_mode = 'offset'
+                view.paginate_by = PAGINATION
+
+    def test_zinnia_keyset_pagination_templates(self):
+        skeleton = (
+            '<title>{% block title %}{% endblock %}'
+            '{% block title-page %}{% endblock %}</title>'
+            '<meta content="{% block meta-description %}{% endblock %}'
+            '{% block meta-description-page %}{% endblock %}" />'
+            '<body class="{% block body-class %}{% endblock %}">'
+            '{% block content %}{% endblock %}</body>')
+        templates = [{
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'OPTIONS': {
+                'context_processors': [
+                    'django.template.context_processors.request',
+                ],
+                'loaders': [
+                    ('django.template.loaders.locmem.Loader',
+                     {'zinnia/skeleton.html': skeleton,
+                      'zinnia/tags/search_form.html': ''}),
+                    'django.template.loaders.app_directories.Loader',
+                ]
+            }
+        }]
+        views = [CategoryDetail, EntrySearch]
+        for view in views:
+            view.pagination_mode = 'keyset'
+            view.paginate_by = 1
+        try:
+            with self.settings(TEMPLATES=templates), \
+                    translation.override('en'):
+                response = self.client.get('/categories/tests/')
+                page = response.context['page_obj']
+                response = self.client.get(
+                    '/categories/tests/', {'after': page.next_cursor})
+                content = response.content.decode('utf-8')
+                self.assertIn('<title>Category Tests</title>', content)
+                self.assertIn('class="entry-list paginated category',
+                              content)
+                self.assertNotIn('None', content)
+                response = self.client.get(
+                    '/search/', {'pattern': 'test'})
+                content = response.content.decode('utf-8')
+                self.assertNotIn('None', content)
+                self.assertNotIn('found', content)
+        finally:
+            for view in views:
+                view.pagination_mode = 'offset'
+                view.paginate_by = PAGINATION
+
     def test_zinnia_entry_random(self):
         response = self.client.get('/random/', follow=True)
         self.assertTrue(response.redirect_chain[0][0].startswith('/2010/'))
         self.assertEqual(response.redirect_chain[0][1], 302)
+        Entry.objects.all().delete()
+        response = self.client.get('/random/')
+        self.assertEqual(response.status_code, 404)
 
     def test_zinnia_sitemap(self):
         with self.assertNumQueries(0):
@@ -1,5 +1,6 @@
 """URL shortener for Zinnia"""
 import warnings
+from functools import lru_cache
 from importlib import import_module
 
 from django.core.exceptions import ImproperlyConfigured
@@ -8,15 +9,16 @@ from zinnia.settings import URL_SHORTENER_BACKEND
 from zinnia.url_shortener.backends.default import backend as default_backend
 
 
-def get_url_shortener():
+@lru_cache(maxsize=None)
+def load_url_shortener(backend_path):
     """
-    Return the selected URL shortener backend.
+    Import an URL shortener backend only once.
     """
     try:
-        backend_module = import_module(URL_SHORTENER_BACKEND)
+        backend_module = import_module(backend_path)
         backend = getattr(backend_module, 'backend')
     except (ImportError, AttributeError):
-        warnings.warn('%s backend cannot be imported' % URL_SHORTENER_BACKEND,
+        warnings.warn('%s backend cannot be imported' % backend_path,
                       RuntimeWarning)
         backend = default_backend
     except ImproperlyConfigured as e:
@@ -24,3 +26,10 @@ def get_url_shortener():
         backend = default_backend
 
     return backend
+
+
+def get_url_shortener():
+    """
+    Return the selected URL shortener backend.
+    """
+    return load_url_shortener(URL_SHORTENER_BACKEND)
@@ -1,8 +1,12 @@
 """Default URL shortener backend for Zinnia"""
 import string
+from functools import lru_cache
 
 from django.contrib.sites.models import Site
+from django.urls import get_script_prefix
+from django.urls import get_urlconf
 from django.urls import reverse
+from django.utils.translation import get_language
 
 from zinnia.settings import PROTOCOL
 
@@ -20,10 +24,21 @@ def base36(value):
     return result
 
 
+@lru_cache(maxsize=4096)
+def build_shortlink_path(pk, urlconf, script_prefix, language):
+    """
+    Builds the path of a shortlink, memoized for each
+    URLconf, script prefix and language.
+    """
+    return reverse('zinnia:entry_shortlink', args=[base36(pk)],
+                   urlconf=urlconf)
+
+
 def backend(entry):
     """
     Default URL shortener backend for Zinnia.
     """
     return '%s://%s%s' % (
         PROTOCOL, Site.objects.get_current().domain,
-        reverse('zinnia:entry_shortlink', args=[base36(entry.pk)]))
+        build_shortlink_path(entry.pk, get_urlconf(), get_script_prefix(),
+                             get_language()))
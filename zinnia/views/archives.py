@@ -13,6 +13,7 @@ from zinnia.models.entry import Entry
 from zinnia.views.mixins.archives import ArchiveMixin
 from zinnia.views.mixins.archives import PreviousNextPublishedMixin
 from zinnia.views.mixins.callable_queryset import CallableQuerysetMixin
+from zinnia.views.mixins.keyset_pagination import KeysetPaginationMixin
 from zinnia.views.mixins.prefetch_related import PrefetchCategoriesAuthorsMixin
 from zinnia.views.mixins.templates import \
     EntryQuerysetArchiveTemplateResponseMixin
@@ -22,6 +23,7 @@ from zinnia.views.mixins.templates import \
 
 class EntryArchiveMixin(ArchiveMixin,
                         PreviousNextPublishedMixin,
+                        KeysetPaginationMixin,
                         PrefetchCategoriesAuthorsMixin,
                         CallableQuerysetMixin,
                         EntryQuerysetArchiveTemplateResponseMixin):
@@ -31,6 +33,7 @@ class EntryArchiveMixin(ArchiveMixin,
     - ArchiveMixin configuration centralizing conf for archive views.
     - PrefetchCategoriesAuthorsMixin to prefetch related objects.
     - PreviousNextPublishedMixin for returning published archives.
+    - KeysetPaginationMixin to paginate the entries with cursors.
     - CallableQueryMixin to force the update of the queryset.
     - EntryQuerysetArchiveTemplateResponseMixin to provide a
       custom templates for archives.
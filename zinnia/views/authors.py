@@ -1,11 +1,12 @@
 """Views for Zinnia authors"""
-from django.db.models import Count
 from django.shortcuts import get_object_or_404
 from django.views.generic.list import BaseListView
 from django.views.generic.list import ListView
 
 from zinnia.models.author import Author
 from zinnia.settings import PAGINATION
+from zinnia.views.mixins.cached_count import CachedCountPaginationMixin
+from zinnia.views.mixins.keyset_pagination import KeysetPaginationMixin
 from zinnia.views.mixins.prefetch_related import PrefetchCategoriesAuthorsMixin
 from zinnia.views.mixins.templates import EntryQuerysetTemplateResponseMixin
 
@@ -20,8 +21,7 @@ class AuthorList(ListView):
         Return a queryset of published authors,
         with a count of their entries published.
         """
-        return Author.published.all().annotate(
-            count_entries_published=Count('entries'))
+        return Author.published.with_count_entries_published()
 
 
 class BaseAuthorDetail(object):
@@ -51,6 +51,8 @@ class BaseAuthorDetail(object):
 
 class AuthorDetail(EntryQuerysetTemplateResponseMixin,
                    PrefetchCategoriesAuthorsMixin,
+                   KeysetPaginationMixin,
+                   CachedCountPaginationMixin,
                    BaseAuthorDetail,
                    BaseListView):
     """
@@ -60,6 +62,8 @@ class AuthorDetail(EntryQuerysetTemplateResponseMixin,
       for the author display page.
     - PrefetchCategoriesAuthorsMixin to prefetch related Categories
       and Authors to belonging the entry list.
+    - KeysetPaginationMixin to paginate the entries with cursors.
+    - CachedCountPaginationMixin to cache the count of the entries.
     - BaseAuthorDetail to provide the behavior of the view.
     - BaseListView to implement the ListView.
     """
@@ -1,21 +1,26 @@
 """Views for Zinnia categories"""
-from django.db.models import Count
 from django.shortcuts import get_object_or_404
 from django.views.generic.list import BaseListView
 from django.views.generic.list import ListView
 
 from zinnia.models.category import Category
 from zinnia.settings import PAGINATION
+from zinnia.views.mixins.cached_count import CachedCountPaginationMixin
+from zinnia.views.mixins.keyset_pagination import KeysetPaginationMixin
 from zinnia.views.mixins.prefetch_related import PrefetchCategoriesAuthorsMixin
 from zinnia.views.mixins.templates import EntryQuerysetTemplateResponseMixin
 
 
 def get_category_or_404(path):
     """
-    Retrieve a Category instance by a path.
+    Retrieve a Category instance by a path,
+    or by its slug if the category has been moved.
     """
     path_bits = [p for p in path.split('/') if p]
-    return get_object_or_404(Category, slug=path_bits[-1])
+    try:
+        return Category.objects.get(tree_path='/'.join(path_bits))
+    except Category.DoesNotExist:
+        return get_object_or_404(Category, slug=path_bits[-1])
 
 
 class CategoryList(ListView):
@@ -28,8 +33,8 @@ class CategoryList(ListView):
         Return a queryset of published categories,
         with a count of their entries published.
         """
-        return Category.published.all().order_by('title').annotate(
-            count_entries_published=Count('entries'))
+        return Category.published.with_count_entries_published(
+            ).order_by('title')
 
 
 class BaseCategoryDetail(object):
@@ -58,6 +63,8 @@ class BaseCategoryDetail(object):
 
 class CategoryDetail(EntryQuerysetTemplateResponseMixin,
                      PrefetchCategoriesAuthorsMixin,
+                     KeysetPaginationMixin,
+                     CachedCountPaginationMixin,
                      BaseCategoryDetail,
                      BaseListView):
     """
@@ -67,6 +74,8 @@ class CategoryDetail(EntryQuerysetTemplateResponseMixin,
       for the category display page.
     - PrefetchCategoriesAuthorsMixin to prefetch related Categories
       and Authors to belonging the entry list.
+    - KeysetPaginationMixin to paginate the entries with cursors.
+    - CachedCountPaginationMixin to cache the count of the entries.
     - BaseCategoryDetail to provide the behavior of the view.
     - BaseListView to implement the ListView.
     """
@@ -3,6 +3,7 @@ from django.views.generic.list import ListView
 
 from zinnia.models.entry import Entry
 from zinnia.settings import PAGINATION
+from zinnia.views.mixins.keyset_pagination import KeysetPaginationMixin
 from zinnia.views.mixins.prefetch_related import PrefetchCategoriesAuthorsMixin
 
 
@@ -32,6 +33,7 @@ class BaseEntryChannel(object):
 
 
 class EntryChannel(PrefetchCategoriesAuthorsMixin,
+                   KeysetPaginationMixin,
                    BaseEntryChannel,
                    ListView):
     """
@@ -39,6 +41,7 @@ class EntryChannel(PrefetchCategoriesAuthorsMixin,
 
     - PrefetchCategoriesAuthorsMixin to prefetch related Categories
       and Authors to belonging the entry list.
+    - KeysetPaginationMixin to paginate the entries with cursors.
     - BaseEntryChannel to provide the behavior of the view.
     - ListView to implement the ListView and template name resolution.
     """
@@ -0,0 +1,43 @@
+"""Cached count pagination mixin for Zinnia views"""
+from hashlib import md5
+
+from django.contrib.sites.models import Site
+from django.utils.encoding import force_bytes
+
+from zinnia.paginator import CachedCountPaginator
+from zinnia.settings import PAGINATION_COUNT_THRESHOLD
+
+
+class CachedCountPaginationMixin(object):
+    """
+    Mixin caching the count of the paginated entries
+    for the filters of the view and the current site.
+    """
+    paginator_class = CachedCountPaginator
+    count_threshold = PAGINATION_COUNT_THRESHOLD
+    count_query_parameters = []
+
+    def get_count_cache_key(self):
+        """
+        Build the key of the count from the view, its URL arguments
+        and the parameters of the query string filtering the entries,
+        the other parameters being ignored.
+        """
+        filters = sorted(self.kwargs.items()) + [
+            (key, self.request.GET.get(key, ''))
+            for key in self.count_query_parameters]
+        return '%s:%s:%s' % (
+            self.__class__.__name__,
+            md5(force_bytes(repr(filters))).hexdigest(),
+            Site.objects.get_current().pk)
+
+    def get_paginator(self, queryset, per_page, orphans=0,
+                      allow_empty_first_page=True, **kwargs):
+        """
+        Return a paginator caching its count.
+        """
+        return self.paginator_class(
+            queryset, per_page, orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+            cache_key=self.get_count_cache_key(),
+            threshold=self.count_threshold, **kwargs)
@@ -1,6 +1,8 @@
 """Callable Queryset mixins for Zinnia views"""
 from django.core.exceptions import ImproperlyConfigured
 
+from zinnia.instrumentation import instrumented
+
 
 class CallableQuerysetMixin(object):
     """
@@ -10,6 +12,7 @@ class CallableQuerysetMixin(object):
     """
     queryset = None
 
+    @instrumented('mixin')
     def get_queryset(self):
         """
         Check that the queryset is defined and call it.
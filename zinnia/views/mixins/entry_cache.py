@@ -1,4 +1,5 @@
 """Cache mixins for Zinnia views"""
+from zinnia.instrumentation import instrumented
 
 
 class EntryCacheMixin(object):
@@ -7,6 +8,7 @@ class EntryCacheMixin(object):
     """
     _cached_object = None
 
+    @instrumented('mixin')
     def get_object(self, queryset=None):
         """
         Implement cache on ``get_object`` method to
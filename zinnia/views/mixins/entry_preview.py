@@ -2,12 +2,15 @@
 from django.http import Http404
 from django.utils.translation import gettext as _
 
+from zinnia.instrumentation import instrumented
+
 
 class EntryPreviewMixin(object):
     """
     Mixin implementing the preview of Entries.
     """
 
+    @instrumented('mixin')
     def get_object(self, queryset=None):
         """
         If the status of the entry is not PUBLISHED,
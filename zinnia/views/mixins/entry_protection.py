@@ -1,6 +1,8 @@
 """Protection mixins for Zinnia views"""
 from django.contrib.auth.views import LoginView
 
+from zinnia.instrumentation import instrumented
+
 
 class LoginMixin(object):
     """
@@ -41,6 +43,7 @@ class EntryProtectionMixin(LoginMixin, PasswordMixin):
     """
     session_key = 'zinnia_entry_%s_password'
 
+    @instrumented('mixin')
     def get(self, request, *args, **kwargs):
         """
         Do the login and password protection.
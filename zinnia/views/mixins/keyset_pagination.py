@@ -0,0 +1,33 @@
+"""Keyset pagination mixin for Zinnia views"""
+from django.core.paginator import InvalidPage
+from django.http import Http404
+
+from zinnia.instrumentation import instrumented
+from zinnia.paginator import KeysetPaginator
+from zinnia.settings import PAGINATION_MODE
+
+
+class KeysetPaginationMixin(object):
+    """
+    Mixin paginating the entries with cursors,
+    if the pagination mode is ``'keyset'``.
+    """
+    pagination_mode = PAGINATION_MODE
+
+    @instrumented('mixin')
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Paginate the queryset with a KeysetPaginator,
+        from the ``after`` or ``before`` cursors of the request.
+        """
+        if self.pagination_mode != 'keyset':
+            return super(KeysetPaginationMixin, self).paginate_queryset(
+                queryset, page_size)
+
+        paginator = KeysetPaginator(queryset, page_size)
+        try:
+            page = paginator.page(after=self.request.GET.get('after'),
+                                  before=self.request.GET.get('before'))
+        except InvalidPage as e:
+            raise Http404(str(e))
+        return (paginator, page, page.object_list, page.has_other_pages())
@@ -1,6 +1,8 @@
 """Mixins for enabling prefetching in views returning list of entries"""
 from django.core.exceptions import ImproperlyConfigured
 
+from zinnia.instrumentation import instrumented
+
 
 class PrefetchRelatedMixin(object):
     """
@@ -9,6 +11,7 @@ class PrefetchRelatedMixin(object):
     """
     relation_names = None
 
+    @instrumented('mixin')
     def get_queryset(self):
         """
         Check if relation_names is correctly set and
@@ -3,8 +3,29 @@ from django.core.exceptions import ImproperlyConfigured
 from django.utils import timezone
 from django.views.generic.base import TemplateResponseMixin
 
+from zinnia.instrumentation import instrumented
+from zinnia.templating import resolve_template_names
 
-class EntryQuerysetTemplateResponseMixin(TemplateResponseMixin):
+
+class ResolvedTemplateResponseMixin(TemplateResponseMixin):
+    """
+    Reduce the template names of the response
+    to the first existing one, with a cached resolution.
+    """
+
+    @instrumented('mixin')
+    def render_to_response(self, context, **response_kwargs):
+        """
+        Return a response rendering the resolved template.
+        """
+        response = super(ResolvedTemplateResponseMixin,
+                         self).render_to_response(context, **response_kwargs)
+        response.template_name = resolve_template_names(
+            response.template_name)
+        return response
+
+
+class EntryQuerysetTemplateResponseMixin(ResolvedTemplateResponseMixin):
     """
     Return a custom template name for views returning
     a queryset of Entry filtered by another model.
@@ -53,7 +74,8 @@ class EntryQuerysetTemplateResponseMixin(TemplateResponseMixin):
         return templates
 
 
-class EntryQuerysetArchiveTemplateResponseMixin(TemplateResponseMixin):
+class EntryQuerysetArchiveTemplateResponseMixin(
+        ResolvedTemplateResponseMixin):
     """
     Return a custom template name for the archive views based
     on the type of the archives and the value of the date.
@@ -1,4 +1,6 @@
 """Views for Zinnia random entry"""
+from django.http import Http404
+from django.utils.translation import gettext as _
 from django.views.generic.base import RedirectView
 
 from zinnia.models.entry import Entry
@@ -13,8 +15,10 @@ class EntryRandom(RedirectView):
 
     def get_redirect_url(self, **kwargs):
         """
-        Get entry corresponding to 'pk' and
+        Pick a random published entry and
         return the get_absolute_url of the entry.
         """
-        entry = Entry.published.all().order_by('?')[0]
-        return entry.get_absolute_url()
+        entries = Entry.published.random()
+        if not entries:
+            raise Http404(_('No entry published.'))
+        return entries[0].get_absolute_url()
@@ -4,6 +4,8 @@ from django.views.generic.list import ListView
 
 from zinnia.models.entry import Entry
 from zinnia.settings import PAGINATION
+from zinnia.views.mixins.cached_count import CachedCountPaginationMixin
+from zinnia.views.mixins.keyset_pagination import KeysetPaginationMixin
 from zinnia.views.mixins.prefetch_related import PrefetchCategoriesAuthorsMixin
 
 
@@ -44,6 +46,8 @@ class BaseEntrySearch(object):
 
 
 class EntrySearch(PrefetchCategoriesAuthorsMixin,
+                  KeysetPaginationMixin,
+                  CachedCountPaginationMixin,
                   BaseEntrySearch,
                   ListView):
     """
@@ -51,8 +55,11 @@ class EntrySearch(PrefetchCategoriesAuthorsMixin,
 
     - PrefetchCategoriesAuthorsMixin to prefetch related Categories
       and Authors to belonging the entry list.
+    - KeysetPaginationMixin to paginate the entries with cursors.
+    - CachedCountPaginationMixin to cache the count of the entries.
     - BaseEntrySearch to provide the behavior of the view.
     - ListView to implement the ListView and template name resolution.
     """
     paginate_by = PAGINATION
     template_name_suffix = '_search'
+    count_query_parameters = ['pattern']
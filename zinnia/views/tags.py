@@ -11,6 +11,8 @@ from tagging.utils import get_tag
 
 from zinnia.models.entry import Entry
 from zinnia.settings import PAGINATION
+from zinnia.views.mixins.cached_count import CachedCountPaginationMixin
+from zinnia.views.mixins.keyset_pagination import KeysetPaginationMixin
 from zinnia.views.mixins.prefetch_related import PrefetchCategoriesAuthorsMixin
 from zinnia.views.mixins.templates import EntryQuerysetTemplateResponseMixin
 
@@ -61,6 +63,8 @@ class BaseTagDetail(object):
 
 class TagDetail(EntryQuerysetTemplateResponseMixin,
                 PrefetchCategoriesAuthorsMixin,
+                KeysetPaginationMixin,
+                CachedCountPaginationMixin,
                 BaseTagDetail,
                 BaseListView):
     """
@@ -70,6 +74,8 @@ class TagDetail(EntryQuerysetTemplateResponseMixin,
       for the tag display page.
     - PrefetchCategoriesAuthorsMixin to prefetch related Categories
       and Authors to belonging the entry list.
+    - KeysetPaginationMixin to paginate the entries with cursors.
+    - CachedCountPaginationMixin to cache the count of the entries.
     - BaseTagDetail to provide the behavior of the view.
     - BaseListView to implement the ListView.
     """
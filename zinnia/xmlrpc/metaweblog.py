@@ -1,52 +1,147 @@
 """XML-RPC methods of Zinnia metaWeblog API"""
+import threading
 from datetime import datetime
 from xmlrpc.client import DateTime
 from xmlrpc.client import Fault
 
 from django.conf import settings
 from django.contrib.sites.models import Site
+from django.core.cache import InvalidCacheBackendError
+from django.core.cache import caches
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
+from django.core.signals import request_finished
+from django.core.signals import request_started
+from django.db import transaction
 from django.template.defaultfilters import slugify
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.crypto import salted_hmac
 from django.utils.translation import gettext as _
 
 from django_xmlrpc.decorators import xmlrpc_func
 
 from tagging.models import Tag
 
+from zinnia.instrumentation import instrument_cache
 from zinnia.managers import DRAFT, PUBLISHED
+from zinnia.markups import html_format_many
 from zinnia.models.author import Author
 from zinnia.models.category import Category
 from zinnia.models.entry import Entry
 from zinnia.settings import PROTOCOL
+from zinnia.settings import XMLRPC_AUTH_CACHE_TIMEOUT
 
 
 # http://docs.nucleuscms.org/blog/12#errorcodes
 LOGIN_ERROR = 801
 PERMISSION_DENIED = 803
 
+XMLRPC_AUTH_CACHE_PREFIX = 'zinnia:xmlrpc_auth'
 
-def authenticate(username, password, permission=None):
+request_authentications = threading.local()
+
+
+def get_cache_backend():
     """
-    Authenticate staff_user with permission.
+    Try to access to ``xmlrpc`` cache value,
+    if fail use the ``default`` cache backend config.
     """
     try:
-        author = Author.objects.get(
-            **{'%s__exact' % Author.USERNAME_FIELD: username})
+        xmlrpc_cache = caches['xmlrpc']
+    except InvalidCacheBackendError:
+        xmlrpc_cache = caches['default']
+    return instrument_cache(xmlrpc_cache)
+
+
+def get_credentials_key(username, password):
+    """
+    Build the cache key of an authentication
+    from a salted hash of the credentials.
+    """
+    return '%s:%s' % (XMLRPC_AUTH_CACHE_PREFIX, salted_hmac(
+        XMLRPC_AUTH_CACHE_PREFIX, '%s\x00%s' % (username, password)
+    ).hexdigest())
+
+
+def start_request_authentications(**kwargs):
+    """
+    Remember the authentications done during a request,
+    so the calls of a system.multicall are authenticated once.
+    """
+    request_authentications.authentications = {}
+
+
+def end_request_authentications(**kwargs):
+    """
+    Forget the authentications done during the request.
+    """
+    request_authentications.authentications = None
+
+
+def get_cached_authentication(credentials_key):
+    """
+    Return the author and the permissions of a cached
+    authentication, if the password of the author is unchanged.
+    """
+    authentication = get_cache_backend().get(credentials_key)
+    if authentication is None:
+        return None, {}
+    try:
+        author = Author.objects.get(pk=authentication['pk'])
     except Author.DoesNotExist:
-        raise Fault(LOGIN_ERROR, _('Username is incorrect.'))
-    if not author.check_password(password):
-        raise Fault(LOGIN_ERROR, _('Password is invalid.'))
+        return None, {}
+    if author.password != authentication['password']:
+        return None, {}
+    return author, authentication['permissions']
+
+
+def authenticate(username, password, permission=None):
+    """
+    Authenticate staff_user with permission.
+    """
+    credentials_key = get_credentials_key(username, password)
+    authentications = getattr(
+        request_authentications, 'authentications', None)
+    if authentications is None:
+        authentications = {}
+    author, permissions = authentications.get(
+        credentials_key, (None, {}))
+    changed = False
+
+    if author is None and XMLRPC_AUTH_CACHE_TIMEOUT:
+        author, permissions = get_cached_authentication(credentials_key)
+    if author is None:
+        try:
+            author = Author.objects.get(
+                **{'%s__exact' % Author.USERNAME_FIELD: username})
+        except Author.DoesNotExist:
+            raise Fault(LOGIN_ERROR, _('Username is incorrect.'))
+        if not author.check_password(password):
+            raise Fault(LOGIN_ERROR, _('Password is invalid.'))
+        changed = True
     if not author.is_staff or not author.is_active:
         raise Fault(PERMISSION_DENIED, _('User account unavailable.'))
-    if permission:
-        if not author.has_perm(permission):
-            raise Fault(PERMISSION_DENIED, _('User cannot %s.') % permission)
+    if permission and permission not in permissions:
+        permissions[permission] = author.has_perm(permission)
+        changed = True
+
+    authentications[credentials_key] = (author, permissions)
+    if changed and XMLRPC_AUTH_CACHE_TIMEOUT:
+        get_cache_backend().set(
+            credentials_key, {'pk': author.pk,
+                              'password': author.password,
+                              'permissions': permissions},
+            XMLRPC_AUTH_CACHE_TIMEOUT)
+    if permission and not permissions[permission]:
+        raise Fault(PERMISSION_DENIED, _('User cannot %s.') % permission)
     return author
 
 
+request_started.connect(start_request_authentications)
+request_finished.connect(end_request_authentications)
+
+
 def blog_structure(site):
     """
     A blog structure.
@@ -123,18 +218,19 @@ def tag_structure(tag, site):
             }
 
 
-def post_structure(entry, site):
+def post_structure(entry, site, description=None):
     """
     A post structure with extensions.
     """
     author = entry.authors.all()[0]
+    if description is None:
+        description = entry.html_content
+    url = '%s://%s%s' % (PROTOCOL, site.domain, entry.get_absolute_url())
     return {'title': entry.title,
-            'description': str(entry.html_content),
-            'link': '%s://%s%s' % (PROTOCOL, site.domain,
-                                   entry.get_absolute_url()),
+            'description': str(description),
+            'link': url,
             # Basic Extensions
-            'permaLink': '%s://%s%s' % (PROTOCOL, site.domain,
-                                        entry.get_absolute_url()),
+            'permaLink': url,
             'categories': [cat.title for cat in entry.categories.all()],
             'dateCreated': DateTime(entry.creation_date.isoformat()),
             'postid': entry.pk,
@@ -154,6 +250,37 @@ def post_structure(entry, site):
             'sticky': entry.featured}
 
 
+def post_structures(entries, site):
+    """
+    A list of post structures, with the authors and the categories
+    prefetched and the descriptions formatted in bulk.
+    """
+    entries = list(entries.prefetch_related('authors', 'categories'))
+    descriptions = html_format_many([entry.content for entry in entries])
+    return [post_structure(entry, site, description)
+            for entry, description in zip(entries, descriptions)]
+
+
+def get_or_create_categories(titles):
+    """
+    Return the categories matching a list of titles by their slugs,
+    the missing ones are created as root categories.
+    """
+    slugs = dict((slugify(title), title) for title in titles)
+    categories = dict((category.slug, category) for category in
+                      Category.objects.filter(slug__in=slugs))
+    missing = [(slug, title) for slug, title in slugs.items()
+               if slug not in categories]
+    if missing:
+        # Saved one by one, to be inserted in the tree
+        # and to materialize their tree paths
+        with transaction.atomic():
+            for slug, title in missing:
+                categories[slug] = Category.objects.create(
+                    title=title, slug=slug)
+    return [categories[slug] for slug in slugs]
+
+
 @xmlrpc_func(returns='struct[]', args=['string', 'string', 'string'])
 def get_users_blogs(apikey, username, password):
     """
@@ -220,8 +347,8 @@ def get_recent_posts(blog_id, username, password, number):
     """
     user = authenticate(username, password)
     site = Site.objects.get_current()
-    return [post_structure(entry, site)
-            for entry in Entry.objects.filter(authors=user)[:number]]
+    return post_structures(
+        Entry.objects.filter(authors=user)[:number], site)
 
 
 @xmlrpc_func(returns='struct[]', args=['string', 'string', 'string'])
@@ -311,10 +438,7 @@ def new_post(blog_id, username, password, post, publish):
 
     entry.sites.add(Site.objects.get_current())
     if 'categories' in post:
-        entry.categories.add(*[
-            Category.objects.get_or_create(
-                title=cat, slug=slugify(cat))[0]
-            for cat in post['categories']])
+        entry.categories.add(*get_or_create_categories(post['categories']))
 
     return entry.pk
 
@@ -358,15 +482,10 @@ def edit_post(post_id, username, password, post, publish):
     if 'wp_author_id' in post and user.has_perm('zinnia.can_change_author'):
         if int(post['wp_author_id']) != user.pk:
             author = Author.objects.get(pk=post['wp_author_id'])
-            entry.authors.clear()
-            entry.authors.add(author)
+            entry.authors.set([author])
 
     if 'categories' in post:
-        entry.categories.clear()
-        entry.categories.add(*[
-            Category.objects.get_or_create(
-                title=cat, slug=slugify(cat))[0]
-            for cat in post['categories']])
+        entry.categories.set(get_or_create_categories(post['categories']))
     return True
 
 